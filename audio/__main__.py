@@ -7,19 +7,40 @@ Author: Claude Code
 Created: 2025-04-27
 """
 
-import logging
+import os
 import sys
 
-from audio.application import main
+from audio import __version__
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
-logger = logging.getLogger(__name__)
+# Flags answered without loading argparse or the application
+_VERSION_FLAGS = ("-V", "--version")
 
 
-if __name__ == "__main__":
+def _run() -> int:
+    """Configure logging and run the application.
+
+    Returns:
+        Exit code from the application
+    """
+    import logging
+
+    from audio.application import main
+
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
     # Forward to application main function
-    sys.exit(main())
+    return main()
+
+
+if __name__ == "__main__":
+    # Answer a bare --version before argparse, asyncio and the services are
+    # imported; the output matches ArgumentParser's version action
+    if len(sys.argv) == 2 and sys.argv[1] in _VERSION_FLAGS:
+        print(f"{os.path.basename(sys.argv[0])} {__version__}")
+        sys.exit(0)
+
+    sys.exit(_run())
@@ -6,12 +6,24 @@ and serves as the composition root for the application.
 
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Final,
+    List,
+    Optional,
+)
 
-from audio.audio_pipeline_controller import AudioPipelineController
 from audio.utilities.argument_parser import ArgumentParser
-from library.bin.dependency_injection.app_services import AppServices
-from services.exceptions import AudioServiceError
+from services.exceptions import AudioServiceError, FileOperationError
+
+if TYPE_CHECKING:
+    from audio.audio_pipeline_controller import AudioPipelineController
+    from library.bin.dependency_injection.app_services import AppServices
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +35,12 @@ class Application:
     using the simplified DI container for service management.
     """
 
+    # Default number of directory files transcribed at once
+    TRANSCRIBE_CONCURRENT_REQUESTS: Final[int] = 3
+
     def __init__(self) -> None:
         """Initialize the application."""
-        self.services: Optional[AppServices] = None
+        self.services: Optional["AppServices"] = None
 
     async def initialize(
         self, config: Optional[Dict[str, Any]] = None
@@ -35,6 +50,8 @@ class Application:
         Args:
             config: Optional application configuration
         """
+        from library.bin.dependency_injection.app_services import AppServices
+
         # Initialize services with configuration
         self.services = AppServices(config)
         logger.info("Application initialized with simplified DI")
@@ -48,33 +65,46 @@ class Application:
         Returns:
             Exit code (0 for success, non-zero for error)
         """
+        # Parse before loading any services so --help and usage errors
+        # exit without importing the service stack
+        parser = ArgumentParser()
+        parsed_args, command = parser.parse_arguments(args)
+
         if not self.services:
             await self.initialize()
 
         try:
-            # Parse command line arguments
-            parser = ArgumentParser()
-            parsed_args, command = parser.parse_arguments(args)
-
             # Run the appropriate command
-            if command == "audio-in":
-                await self._handle_audio_in(parsed_args)
-            elif command == "audio-out":
-                await self._handle_audio_out(parsed_args)
-            elif command == "conversation":
-                await self._handle_conversation(parsed_args)
-            elif command == "state-machine":
-                await self._handle_state_machine(parsed_args)
-            else:
+            handler = self._COMMAND_HANDLERS.get(command)
+            if handler is None:
                 print("Invalid command. Use --help for usage information.")
                 return 1
 
+            await handler(self, parsed_args)
             return 0
         except Exception as e:
             logger.exception(f"Error running application: {e}")
             print(f"An error occurred: {e}")
             return 1
 
+    def _create_controller(
+        self, config: Dict[str, Any]
+    ) -> "AudioPipelineController":
+        """Create a pipeline controller wired to the application services.
+
+        Args:
+            config: Pipeline options for the controller
+
+        Returns:
+            AudioPipelineController: Controller using the shared services
+        """
+        if not self.services:
+            raise RuntimeError("Application not initialized")
+
+        from audio.audio_pipeline_controller import AudioPipelineController
+
+        return AudioPipelineController.from_services(config, self.services)
+
     async def _handle_audio_in(self, args: Dict[str, Any]) -> None:
         """Handle the audio-in command.
 
@@ -84,15 +114,14 @@ class Application:
         if not self.services:
             raise RuntimeError("Application not initialized")
 
+        # Directory mode transcribes many files concurrently
+        if args.get("audio_dir"):
+            await self._handle_audio_in_directory(args)
+            return
+
         try:
-            # Create the controller with dependencies injected
-            controller = AudioPipelineController(
-                args,
-                self.services.config_manager,
-                self.services.transcription_service,
-                self.services.file_service,
-                self.services.audio_service,
-            )
+            # Create the controller with shared services injected
+            controller = self._create_controller(args)
 
             # Run the audio input pipeline
             transcription = await controller.handle_audio_in()
@@ -102,6 +131,92 @@ class Application:
             print(f"Error: {e}")
             raise
 
+    def _get_concurrency_limit(self) -> int:
+        """Get how many directory files may be transcribed at once.
+
+        Returns:
+            int: TRANSCRIBE_CONCURRENT_REQUESTS, or the default when it is
+                not a positive integer
+        """
+        if not self.services:
+            raise RuntimeError("Application not initialized")
+
+        default = self.TRANSCRIBE_CONCURRENT_REQUESTS
+        value = self.services.config_manager.get(
+            "TRANSCRIBE_CONCURRENT_REQUESTS", default
+        )
+        try:
+            limit = int(value)
+        except (TypeError, ValueError):
+            limit = 0
+        if limit < 1:
+            logger.warning(
+                "Invalid TRANSCRIBE_CONCURRENT_REQUESTS: %s. Using %d.",
+                value,
+                default,
+            )
+            return default
+        return limit
+
+    async def _handle_audio_in_directory(self, args: Dict[str, Any]) -> None:
+        """Transcribe every WAV file in a directory as concurrent tasks.
+
+        All tasks are created up front and gathered in input order. A
+        semaphore sized by TRANSCRIBE_CONCURRENT_REQUESTS bounds how many
+        files are transcribed at once, so file I/O for one file overlaps
+        with inference on another without oversubscribing the model.
+
+        Args:
+            args: Command line arguments, with audio_dir set
+        """
+        if not self.services:
+            raise RuntimeError("Application not initialized")
+
+        directory = args["audio_dir"]
+        if not os.path.isdir(directory):
+            raise FileOperationError(f"Directory not found: {directory}")
+
+        audio_paths: List[str] = sorted(
+            entry.path
+            for entry in os.scandir(directory)
+            if entry.is_file() and entry.name.lower().endswith(".wav")
+        )
+        if not audio_paths:
+            print(f"No WAV files found in {directory}")
+            return
+
+        semaphore = asyncio.Semaphore(self._get_concurrency_limit())
+
+        async def transcribe(audio_path: str) -> str:
+            async with semaphore:
+                # Each file gets its own controller; transcripts are saved
+                # per file by the transcription service, so no shared
+                # output path is passed on
+                controller = self._create_controller(
+                    {**args, "audio_path": audio_path, "output_path": None}
+                )
+                return await controller.handle_audio_in()
+
+        tasks = [
+            asyncio.create_task(transcribe(audio_path))
+            for audio_path in audio_paths
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        failures = 0
+        for audio_path, result in zip(audio_paths, results):
+            if isinstance(result, BaseException):
+                failures += 1
+                logger.error(f"Failed to transcribe {audio_path}: {result}")
+                print(f"Error transcribing {audio_path}: {result}")
+            else:
+                print(f"\nTranscription of {audio_path}: {result}\n")
+
+        print(
+            f"Transcribed {len(audio_paths) - failures} of "
+            f"{len(audio_paths)} files from {directory}"
+        )
+
     async def _handle_audio_out(self, args: Dict[str, Any]) -> None:
         """Handle the audio-out command.
 
@@ -112,14 +227,8 @@ class Application:
             raise RuntimeError("Application not initialized")
 
         try:
-            # Create the controller with dependencies injected
-            controller = AudioPipelineController(
-                args,
-                self.services.config_manager,
-                self.services.transcription_service,
-                self.services.file_service,
-                self.services.audio_service,
-            )
+            # Create the controller with shared services injected
+            controller = self._create_controller(args)
 
             # Run the audio output pipeline
             audio_path = await controller.handle_audio_out()
@@ -142,14 +251,8 @@ class Application:
             # Parse max turns
             max_turns = int(args.get("turns", "5"))
 
-            # Create the controller with dependencies injected
-            controller = AudioPipelineController(
-                args,
-                self.services.config_manager,
-                self.services.transcription_service,
-                self.services.file_service,
-                self.services.audio_service,
-            )
+            # Create the controller with shared services injected
+            controller = self._create_controller(args)
 
             # Run the conversation loop
             await controller.handle_conversation_loop(max_turns=max_turns)
@@ -170,15 +273,13 @@ class Application:
 
         try:
             # Import here to avoid circular imports
-            import os
-
             from audio.async_state_machine import AsyncAudioStateMachine
 
-            # Ensure required environment variables are set
+            # Ensure required environment variables are set; the
+            # directories themselves are created by the state machine
             input_dir = self.services.config_manager.get("AUDIO_INPUT_DIR")
             if not input_dir:
                 input_dir = os.path.join(os.getcwd(), "input")
-                os.makedirs(input_dir, exist_ok=True)
                 os.environ["AUDIO_INPUT_DIR"] = input_dir
                 self.services.config_manager.set("AUDIO_INPUT_DIR", input_dir)
                 logger.info(f"Set AUDIO_INPUT_DIR: {input_dir}")
@@ -186,7 +287,6 @@ class Application:
             output_dir = self.services.config_manager.get("AUDIO_OUTPUT_DIR")
             if not output_dir:
                 output_dir = os.path.join(os.getcwd(), "output")
-                os.makedirs(output_dir, exist_ok=True)
                 os.environ["AUDIO_OUTPUT_DIR"] = output_dir
                 self.services.config_manager.set(
                     "AUDIO_OUTPUT_DIR", output_dir
@@ -232,6 +332,17 @@ class Application:
             print(f"Error: {e}")
             raise
 
+    # Handler for each command, looked up once per run instead of
+    # comparing the command against every name in turn
+    _COMMAND_HANDLERS: Dict[
+        str, Callable[["Application", Dict[str, Any]], Awaitable[None]]
+    ] = {
+        "audio-in": _handle_audio_in,
+        "audio-out": _handle_audio_out,
+        "conversation": _handle_conversation,
+        "state-machine": _handle_state_machine,
+    }
+
     def shutdown(self) -> None:
         """Shut down the application and release resources."""
         logger.info("Shutting down application")
@@ -14,6 +14,7 @@ import os
 from typing import Any, Dict, Final
 
 from services.audio_playback_service import AudioPlaybackService
+from services.directories import ensure_directory
 from services.exceptions import AudioServiceError
 from services.interfaces.audio_service_interface import IAudioRecordingService
 from services.interfaces.configuration_manager_interface import (
@@ -126,17 +127,15 @@ class AsyncAudioStateMachine:
         Creates input and output directories if they don't exist and
         sets the appropriate environment variables.
         """
-        # Ensure input directory exists
-        input_dir = os.path.join(os.getcwd(), "input")
-        os.makedirs(input_dir, exist_ok=True)
-        os.environ["AUDIO_INPUT_DIR"] = input_dir
-        logger.info(f"Set AUDIO_INPUT_DIR: {input_dir}")
-
-        # Ensure output directory exists
-        output_dir = os.path.join(os.getcwd(), "output")
-        os.makedirs(output_dir, exist_ok=True)
-        os.environ["AUDIO_OUTPUT_DIR"] = output_dir
-        logger.info(f"Set AUDIO_OUTPUT_DIR: {output_dir}")
+        cwd = os.getcwd()
+        for env_key, name in (
+            ("AUDIO_INPUT_DIR", "input"),
+            ("AUDIO_OUTPUT_DIR", "output"),
+        ):
+            dir_path = os.path.join(cwd, name)
+            ensure_directory(dir_path)
+            os.environ[env_key] = dir_path
+            logger.info(f"Set {env_key}: {dir_path}")
 
     async def run(self) -> None:
         """Run the state machine until it reaches the STOPPED state.
@@ -9,13 +9,31 @@ Created: 2025-04-27
 """
 
 import asyncio
+import itertools
 import logging
 import os
+import queue
+import re
+import shutil
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+)
 
-from library.bin.dependency_injection.app_services import AppServices
-from services.audio_playback_service import AudioPlaybackService
+from services.audio_buffer import AudioBuffer
+from services.directories import ensure_directory
 from services.exceptions import (
     AudioRecordingError,
     AudioServiceError,
@@ -30,10 +48,81 @@ from services.interfaces.file_service_interface import IFileService
 from services.interfaces.transcription_service_interface import (
     ITranscriptionService,
 )
-from services.text_to_speech_service import TextToSpeechService
+from services.tts_cache import TTSCache
+
+if TYPE_CHECKING:
+    from library.bin.dependency_injection.app_services import AppServices
 
 logger = logging.getLogger(__name__)
 
+# Sequence numbers for default transcript names, shared by all controllers
+# so concurrent calls in the same second never pick the same file name
+_transcript_counter = itertools.count()
+
+
+@dataclass(frozen=True, slots=True)
+class _AudioInCall:
+    """Options read by a single audio-in invocation.
+
+    Built once from the controller config at the start of the call so the
+    pipeline reads plain attributes instead of repeated dict lookups.
+    """
+
+    audio_path: Optional[str]
+    duration: int
+    model: Optional[str]
+    language: Optional[str]
+    output_path: Optional[str]
+    save_transcript: bool
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "_AudioInCall":
+        """Snapshot the audio-in options from a config dictionary.
+
+        Args:
+            config: Controller configuration dictionary
+
+        Returns:
+            _AudioInCall: Options with defaults applied
+        """
+        return cls(
+            audio_path=config.get("audio_path"),
+            duration=config.get("duration", 5),
+            model=config.get("model"),
+            language=config.get("language"),
+            output_path=config.get("output_path"),
+            save_transcript=config.get("save_transcript", False),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _AudioOutCall:
+    """Options read by a single audio-out invocation.
+
+    Built once from the controller config at the start of the call so the
+    pipeline reads plain attributes instead of repeated dict lookups.
+    """
+
+    output_path: Optional[str]
+    play_audio: bool
+    return_text_output: bool
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "_AudioOutCall":
+        """Snapshot the audio-out options from a config dictionary.
+
+        Args:
+            config: Controller configuration dictionary
+
+        Returns:
+            _AudioOutCall: Options with defaults applied
+        """
+        return cls(
+            output_path=config.get("output_path"),
+            play_audio=config.get("play_audio", True),
+            return_text_output=config.get("return_text_output", False),
+        )
+
 
 class AudioPipelineController:
     """Asynchronous controller for audio processing pipelines.
@@ -48,6 +137,38 @@ class AudioPipelineController:
         file_service: Service for file operations
     """
 
+    # Maximum number of synthesized chunks buffered ahead of playback
+    STREAM_BUFFER_CHUNKS: Final[int] = 8
+
+    # Directories already created by a controller in this process
+    _dirs_ensured: ClassVar[Set[str]] = set()
+
+    # Default size limit of the synthesized speech cache (0 disables it)
+    TTS_CACHE_MAX_BYTES: Final[int] = 100 * 1024 * 1024
+
+    # Engine and voice used by TextToSpeechService, part of each cache key
+    TTS_CACHE_MODEL: Final[str] = "gtts"
+    TTS_CACHE_VOICE: Final[str] = "en"
+
+    # Canned conversation replies, checked in order against the user
+    # text; each entry's keywords are compiled into one case-insensitive
+    # pattern and the first entry that matches wins
+    _CANNED_RESPONSES: ClassVar[Tuple[Tuple[Pattern[str], str], ...]] = (
+        (
+            re.compile("hello|hi", re.IGNORECASE),
+            "Hello! How can I help you today?",
+        ),
+        (
+            re.compile("how are you", re.IGNORECASE),
+            "I'm functioning well, thank you for asking. How about you?",
+        ),
+        (
+            re.compile("weather", re.IGNORECASE),
+            "I'm sorry, I don't have access to weather information at the "
+            "moment.",
+        ),
+    )
+
     def __init__(
         self,
         config: Dict[str, Any],
@@ -94,12 +215,27 @@ class AudioPipelineController:
         self.file_service = file_service
         self.audio_service = audio_service
 
-        # Ensure directories exist
+        # Ensure directories exist; resolved paths are kept on the instance
+        self._input_dir = ""
+        self._output_dir = ""
         self._ensure_directories()
 
+        # Prefix of default transcript paths, resolved once per controller
+        self._transcript_prefix = os.path.join(
+            self._output_dir,
+            f"transcript_{time.strftime('%Y%m%d-%H%M%S')}_",
+        )
+
+        # Cache synthesized speech so repeated text skips TTS entirely
+        self._tts_cache = self._create_tts_cache()
+
+        # Latest transcription as (path, mtime_ns, text), reused until a
+        # newer file appears or the file changes
+        self._latest_transcription: Optional[Tuple[str, int, str]] = None
+
     @classmethod
     def from_services(
-        cls, config: Dict[str, Any], services: AppServices
+        cls, config: Dict[str, Any], services: "AppServices"
     ) -> "AudioPipelineController":
         """Create a controller using the AppServices container.
 
@@ -121,33 +257,78 @@ class AudioPipelineController:
     def _ensure_directories(self) -> None:
         """Ensure required directories exist for audio I/O.
 
-        Creates the input and output directories if they don't exist.
+        Creates the input and output directories if they don't exist and
+        records the resolved paths so later calls don't query the
+        configuration manager again.
         """
-        # Ensure input directory exists
+        # Resolve input directory, defaulting to ./input
         input_dir = self.config_manager.get("AUDIO_INPUT_DIR")
         if not input_dir:
             input_dir = os.path.join(os.getcwd(), "input")
             os.environ["AUDIO_INPUT_DIR"] = input_dir
             self.config_manager.set("AUDIO_INPUT_DIR", input_dir)
-            logger.info(f"AUDIO_INPUT_DIR not set, using default: {input_dir}")
-
-            if not os.path.exists(input_dir):
-                os.makedirs(input_dir, exist_ok=True)
-                logger.info(f"Created input directory: {input_dir}")
+            logger.info("AUDIO_INPUT_DIR not set, using default: %s", input_dir)
 
-        # Ensure output directory exists
+        # Resolve output directory, defaulting to ./output
         output_dir = self.config_manager.get("AUDIO_OUTPUT_DIR")
         if not output_dir:
             output_dir = os.path.join(os.getcwd(), "output")
             os.environ["AUDIO_OUTPUT_DIR"] = output_dir
             self.config_manager.set("AUDIO_OUTPUT_DIR", output_dir)
             logger.info(
-                f"AUDIO_OUTPUT_DIR not set, using default: {output_dir}"
+                "AUDIO_OUTPUT_DIR not set, using default: %s", output_dir
             )
 
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir, exist_ok=True)
-                logger.info(f"Created output directory: {output_dir}")
+        self._make_directory(input_dir, "input")
+        self._make_directory(output_dir, "output")
+
+        self._input_dir = input_dir
+        self._output_dir = output_dir
+
+    @classmethod
+    def _make_directory(cls, directory: str, label: str) -> None:
+        """Create a directory once per process.
+
+        mkdir itself reports an existing directory, so no separate
+        existence check is made, and directories already handled by any
+        controller are skipped without a syscall.
+
+        Args:
+            directory: Directory to create
+            label: Name of the directory used in log messages
+        """
+        if directory in cls._dirs_ensured:
+            return
+
+        try:
+            if ensure_directory(directory):
+                logger.info("Created %s directory: %s", label, directory)
+        except OSError as e:
+            logger.warning("Could not create %s directory: %s", label, e)
+            return
+
+        cls._dirs_ensured.add(directory)
+
+    def _create_tts_cache(self) -> Optional[TTSCache]:
+        """Create the synthesized speech cache under the output directory.
+
+        Returns:
+            Optional[TTSCache]: The cache, or None if caching is disabled
+        """
+        try:
+            max_bytes = int(
+                self.config_manager.get(
+                    "TTS_CACHE_MAX_BYTES", self.TTS_CACHE_MAX_BYTES
+                )
+            )
+        except (TypeError, ValueError):
+            logger.warning("Invalid TTS_CACHE_MAX_BYTES, using default")
+            max_bytes = self.TTS_CACHE_MAX_BYTES
+
+        if max_bytes <= 0:
+            return None
+
+        return TTSCache(os.path.join(self._output_dir, "_cache"), max_bytes)
 
     async def _record_audio_async(self, duration: int) -> str:
         """Record audio from microphone asynchronously.
@@ -163,7 +344,7 @@ class AudioPipelineController:
         """
         try:
             # Run the recording operation in a thread pool since PyAudio is blocking
-            logger.info(f"Recording audio for {duration} seconds...")
+            logger.info("Recording audio for %s seconds...", duration)
             print(f"Recording audio for {duration} seconds...")
 
             # Use asyncio.to_thread to run the blocking recording operation
@@ -172,7 +353,7 @@ class AudioPipelineController:
                 self.audio_service.record_audio, duration=duration
             )
 
-            logger.info(f"Audio recorded and saved to: {audio_path}")
+            logger.info("Audio recorded and saved to: %s", audio_path)
             print(f"Audio recorded and saved to: {audio_path}")
             return audio_path
         except Exception as e:
@@ -181,13 +362,18 @@ class AudioPipelineController:
             raise AudioRecordingError(error_msg, error_code="RECORD_FAILED")
 
     async def _save_transcription_async(
-        self, transcription: str, output_path: Optional[str] = None
+        self,
+        transcription: str,
+        output_path: Optional[str] = None,
+        save_transcript: bool = False,
     ) -> str:
         """Save transcription to file asynchronously.
 
         Args:
             transcription: The transcription text to save
             output_path: Optional specific path to save to
+            save_transcript: Whether to generate a unique timestamped path
+                when no output path is given
 
         Returns:
             str: Path to the saved transcription file
@@ -196,22 +382,18 @@ class AudioPipelineController:
             FileOperationError: If saving fails
         """
         try:
-            # Use provided path or generate timestamped one
-            if not output_path and self.config.get("save_transcript", False):
-                timestamp = time.strftime("%Y%m%d-%H%M%S")
-                output_dir = self.config_manager.get("AUDIO_OUTPUT_DIR", "")
-                if output_dir:
-                    output_path = os.path.join(
-                        output_dir,
-                        f"transcript_{timestamp}.txt",
-                    )
+            # Use provided path or generate a unique timestamped one
+            if not output_path and save_transcript:
+                output_path = (
+                    f"{self._transcript_prefix}{next(_transcript_counter)}.txt"
+                )
 
             if output_path:
                 # Run the file saving operation in a thread
                 await asyncio.to_thread(
                     self.file_service.save_text, transcription, output_path
                 )
-                logger.info(f"Transcription saved to: {output_path}")
+                logger.info("Transcription saved to: %s", output_path)
                 print(f"Transcription saved to: {output_path}")
                 return output_path
 
@@ -245,13 +427,13 @@ class AudioPipelineController:
             print(transcription)
             ```
         """
+        call = _AudioInCall.from_config(self.config)
+
         # Use guard clause for determining audio path
-        audio_path = self.config.get("audio_path")
+        audio_path = call.audio_path
         if not audio_path:
             # Record from microphone if no path provided
-            audio_path = await self._record_audio_async(
-                self.config.get("duration", 5)
-            )
+            audio_path = await self._record_audio_async(call.duration)
 
         # Transcribe the audio - use a thread pool for CPU-intensive work
         try:
@@ -259,8 +441,8 @@ class AudioPipelineController:
             transcription = await asyncio.to_thread(
                 self.transcription_service.transcribe_audio,
                 audio_path,
-                model_size=self.config.get("model"),
-                language=self.config.get("language"),
+                model_size=call.model,
+                language=call.language,
             )
         except Exception as e:
             error_msg = f"Failed to transcribe audio: {e}"
@@ -268,8 +450,9 @@ class AudioPipelineController:
             raise TranscriptionError(error_msg, error_code="TRANSCRIBE_FAILED")
 
         # Save transcript if needed
-        output_path = self.config.get("output_path")
-        await self._save_transcription_async(transcription, output_path)
+        await self._save_transcription_async(
+            transcription, call.output_path, call.save_transcript
+        )
 
         # Always print the transcription
         print(f"Transcription: {transcription}")
@@ -277,11 +460,15 @@ class AudioPipelineController:
         # Always return the text
         return transcription
 
-    async def resolve_text_source_async(self) -> str:
+    async def resolve_text_source_async(self) -> Optional[str]:
         """Resolve the input source text from config or environment asynchronously.
 
         Returns:
-            str: The resolved text content
+            Optional[str]: The resolved text content, or None if no source
+                is configured
+
+        Raises:
+            FileOperationError: If the source file cannot be read
 
         Example:
             ```python
@@ -295,7 +482,7 @@ class AudioPipelineController:
         source = self.config.get("data_source")
         if not source:
             logger.warning("No source text found in config.")
-            return "no text found"
+            return None
 
         # Guard clause: check if it's a file path
         if not os.path.isfile(source):
@@ -332,6 +519,11 @@ class AudioPipelineController:
             audio_path = await controller.handle_audio_out()
             ```
         """
+        # Imported here so the audio-in path never loads the TTS stack
+        from services.text_to_speech_service import TextToSpeechService
+
+        call = _AudioOutCall.from_config(self.config)
+
         try:
             # Get the text to synthesize
             text = await self.resolve_text_source_async()
@@ -343,57 +535,238 @@ class AudioPipelineController:
                 details={"original_error": str(e)},
             )
 
+        # Normalize once so formatting differences don't reach TTS or the
+        # synthesis cache key
+        if text:
+            text = TextToSpeechService.normalize_text(text)
+
         # Guard clause: validate text
-        if not text or text == "no text found":
+        if not text:
             error_msg = "No valid text to synthesize."
             logger.warning(error_msg)
             raise AudioServiceError(error_msg, error_code="EMPTY_TEXT")
 
-        # Synthesize audio - run in thread pool since TTS is CPU-intensive
-        try:
-            audio_data = await asyncio.to_thread(
-                TextToSpeechService.synthesize, text
-            )
-        except Exception as e:
-            error_msg = f"Error synthesizing audio: {e}"
-            logger.error(error_msg)
-            raise AudioServiceError(error_msg, error_code="SYNTHESIS_FAILED")
-
         # Determine output path
-        output_path = self.config.get(
-            "output_path"
-        ) or await asyncio.to_thread(
+        output_path = call.output_path or await asyncio.to_thread(
             self.file_service.generate_temp_output_path
         )
 
-        # Save audio to file - file I/O operations in thread pool
+        # Synthesize, save and play in one streaming pass - run in thread
+        # pool since TTS is CPU-intensive and file I/O and playback block
+        cache_key = TTSCache.make_key(
+            text,
+            self.TTS_CACHE_VOICE,
+            self.TTS_CACHE_MODEL,
+            os.path.splitext(output_path)[1][1:],
+        )
         try:
-            await asyncio.to_thread(
-                self.file_service.save, audio_data, output_path
+            cached = await asyncio.to_thread(
+                self._serve_from_cache, cache_key, output_path, call.play_audio
             )
-            logger.info(f"Audio saved to: {output_path}")
-        except Exception as e:
+            if not cached:
+                synthesized = await asyncio.to_thread(
+                    self._synthesize_to_file,
+                    text,
+                    output_path,
+                    call.play_audio,
+                )
+                # Never cache the dummy tone produced when TTS is unavailable
+                if synthesized and self._tts_cache:
+                    await asyncio.to_thread(
+                        self._tts_cache.store, cache_key, output_path
+                    )
+            logger.info("Audio saved to: %s", output_path)
+        except FileOperationError as e:
             error_msg = f"Error saving audio file: {e}"
             logger.error(error_msg)
             raise FileOperationError(error_msg, error_code="SAVE_FAILED")
+        except AudioServiceError:
+            raise
+        except Exception as e:
+            error_msg = f"Error synthesizing audio: {e}"
+            logger.error(error_msg)
+            raise AudioServiceError(error_msg, error_code="SYNTHESIS_FAILED")
+
+        if call.play_audio:
+            logger.info("Audio playback completed")
+
+        # Return text instead of path if flagged (for testing or debugging)
+        if call.return_text_output:
+            return text
+
+        return output_path
+
+    def _serve_from_cache(
+        self, cache_key: str, output_path: str, play_audio: bool
+    ) -> bool:
+        """Copy cached speech to the output path and play it, if cached.
+
+        When playback is enabled the copy runs in a worker thread while
+        the cached audio plays, so neither waits for the other.
+
+        Args:
+            cache_key: Key of the synthesis request in the TTS cache
+            output_path: Path where the audio file should be saved
+            play_audio: Whether to play the cached audio
+
+        Returns:
+            bool: True if the request was served from the cache, False on
+                a miss or when playback was requested but the cached audio
+                cannot be decoded
+
+        Raises:
+            FileOperationError: If the cached file cannot be copied
+        """
+        if not self._tts_cache:
+            return False
+
+        cache_path = self._tts_cache.lookup(cache_key)
+        if not cache_path:
+            return False
+
+        audio = None
+        if play_audio:
+            audio = self._tts_cache.load(cache_key)
+            if audio is None:
+                # An entry that cannot be decoded cannot be played either,
+                # so the request falls through to synthesis
+                return False
+
+        if audio is None:
+            self._copy_cached_audio(cache_path, output_path)
+        else:
+            from services.audio_playback_service import AudioPlaybackService
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                copy = executor.submit(
+                    self._copy_cached_audio, cache_path, output_path
+                )
+                AudioPlaybackService.play(audio)
+                copy.result()
+
+        logger.info("Using cached synthesis for: %s", output_path)
+        return True
+
+    @staticmethod
+    def _copy_cached_audio(cache_path: str, output_path: str) -> None:
+        """Copy a cached audio file to the requested output path.
+
+        Args:
+            cache_path: Path of the cached audio file
+            output_path: Path where the audio file should be saved
+
+        Raises:
+            FileOperationError: If the cached file cannot be copied
+        """
+        try:
+            try:
+                shutil.copyfile(cache_path, output_path)
+            except FileNotFoundError:
+                # Create the output directory only if the copy shows it
+                # is missing, instead of checking before every copy
+                output_dir = os.path.dirname(output_path)
+                if not output_dir:
+                    raise
+                os.makedirs(output_dir, exist_ok=True)
+                shutil.copyfile(cache_path, output_path)
+        except OSError as e:
+            raise FileOperationError(f"Failed to copy cached audio: {e}")
+
+    def _synthesize_to_file(
+        self, text: str, output_path: str, play_audio: bool
+    ) -> bool:
+        """Synthesize text, streaming each chunk to disk and to playback.
+
+        Chunks produced by the TTS service are appended to the output file
+        as they arrive and, when playback is enabled, handed to a playback
+        worker through a bounded queue. The first chunk is heard while later
+        ones are still being synthesized, the queue bound keeps the
+        synthesizer at most ``STREAM_BUFFER_CHUNKS`` chunks ahead, and the
+        complete audio is never held in memory.
+
+        Args:
+            text: The text to synthesize
+            output_path: Path of the audio file to write
+            play_audio: Whether to play the chunks while synthesizing
+
+        Returns:
+            bool: True if the file holds synthesized speech, False if the
+                TTS service fell back to its dummy tone
+
+        Raises:
+            AudioServiceError: If synthesis fails
+            FileOperationError: If writing the audio file fails
+        """
+        from services.text_to_speech_service import TextToSpeechService
+
+        fallback_used = False
+
+        def mark_fallback() -> None:
+            nonlocal fallback_used
+            fallback_used = True
+
+        buffer: "queue.Queue[Optional[AudioBuffer]]" = (
+            queue.Queue(maxsize=self.STREAM_BUFFER_CHUNKS)
+        )
 
-        # Play audio if enabled - in thread pool since playback is blocking
-        if self.config.get("play_audio", True):
+        def produce() -> Iterator[AudioBuffer]:
             try:
-                await asyncio.to_thread(AudioPlaybackService.play, audio_data)
-                logger.info("Audio playback completed")
+                for chunk in TextToSpeechService.synthesize_stream(
+                    text, on_fallback=mark_fallback
+                ):
+                    if play_audio:
+                        buffer.put(chunk)
+                    yield chunk
             except Exception as e:
-                error_msg = f"Error playing audio: {e}"
+                error_msg = f"Error synthesizing audio: {e}"
                 logger.error(error_msg)
                 raise AudioServiceError(
-                    error_msg, error_code="PLAYBACK_FAILED"
+                    error_msg, error_code="SYNTHESIS_FAILED"
                 )
 
-        # Return text instead of path if flagged (for testing or debugging)
-        if self.config.get("return_text_output", False):
-            return text
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            playback = (
+                executor.submit(self._play_from_buffer, buffer)
+                if play_audio
+                else None
+            )
+            try:
+                self.file_service.save_stream(produce(), output_path)
+            finally:
+                if playback is not None:
+                    # Signal end of stream and wait for playback to finish
+                    buffer.put(None)
+                    playback.result()
+
+        return not fallback_used
+
+    @staticmethod
+    def _play_from_buffer(
+        buffer: "queue.Queue[Optional[AudioBuffer]]",
+    ) -> None:
+        """Play chunks from the buffer until the end-of-stream marker.
 
-        return output_path
+        Args:
+            buffer: Queue of (audio_data, sample_rate) chunks ending in None
+        """
+
+        def drain() -> Iterator[AudioBuffer]:
+            while True:
+                item = buffer.get()
+                if item is None:
+                    return
+                yield item
+
+        # Imported here so sounddevice only loads when audio is played
+        from services.audio_playback_service import AudioPlaybackService
+
+        chunks = drain()
+        AudioPlaybackService.play_stream(chunks)
+
+        # If playback stopped early, keep consuming so the producer never
+        # blocks on a full buffer
+        for _ in chunks:
+            pass
 
     async def _get_latest_transcription_async(self) -> Optional[str]:
         """Get the latest transcription from files asynchronously.
@@ -412,17 +785,57 @@ class AudioPipelineController:
             ```
         """
         try:
-            return await asyncio.to_thread(
-                self.file_service.load_latest_transcription
-            )
+            return await asyncio.to_thread(self._load_latest_transcription)
         except FileOperationError as e:
-            logger.warning(f"Failed to load latest transcription: {e}")
+            logger.warning("Failed to load latest transcription: %s", e)
             return None
         except Exception as e:
             error_msg = f"Unexpected error loading transcription: {e}"
             logger.error(error_msg)
             return None
 
+    def _load_latest_transcription(self) -> Optional[str]:
+        """Load the latest transcription, reusing the last read if unchanged.
+
+        Returns:
+            Optional[str]: The latest transcription or None if not found
+
+        Raises:
+            FileOperationError: If the transcription file cannot be read
+        """
+        path = self.file_service.get_latest_transcription_path()
+        if not path:
+            return None
+
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            # Cannot validate a cached copy; fall back to a plain load
+            return self.file_service.load_latest_transcription()
+
+        cached = self._latest_transcription
+        if cached and cached[:2] == (path, mtime_ns):
+            return cached[2]
+
+        text = self.file_service.read_text(path)
+        self._latest_transcription = (path, mtime_ns, text)
+        return text
+
+    @classmethod
+    def _generate_response(cls, user_text: str) -> str:
+        """Pick the canned reply for a conversation turn.
+
+        Args:
+            user_text: The transcribed user input
+
+        Returns:
+            str: The assistant's reply
+        """
+        for pattern, response in cls._CANNED_RESPONSES:
+            if pattern.search(user_text):
+                return response
+        return f"I heard you say: {user_text}. That's interesting!"
+
     async def handle_conversation_loop(
         self, max_turns: int = 5
     ) -> List[Dict[str, str]]:
@@ -469,7 +882,7 @@ class AudioPipelineController:
                     break
 
             except Exception as e:
-                logger.error(f"Error in user input handling: {e}")
+                logger.error("Error in user input handling: %s", e)
                 print(f"Sorry, I couldn't understand that. Error: {e}")
                 continue
 
@@ -480,16 +893,7 @@ class AudioPipelineController:
                 await asyncio.sleep(0.5)  # Simulate thinking time
 
                 # Generate simple response based on user input
-                if "hello" in user_text.lower() or "hi" in user_text.lower():
-                    response = "Hello! How can I help you today?"
-                elif "how are you" in user_text.lower():
-                    response = "I'm functioning well, thank you for asking. How about you?"
-                elif "weather" in user_text.lower():
-                    response = "I'm sorry, I don't have access to weather information at the moment."
-                else:
-                    response = (
-                        f"I heard you say: {user_text}. That's interesting!"
-                    )
+                response = self._generate_response(user_text)
 
                 conversation_history.append(
                     {"role": "assistant", "content": response}
@@ -504,7 +908,7 @@ class AudioPipelineController:
                 await self.handle_audio_out()
 
             except Exception as e:
-                logger.error(f"Error in response generation or playback: {e}")
+                logger.error("Error in response generation or playback: %s", e)
                 print(f"Sorry, I couldn't respond properly. Error: {e}")
 
         print("\nConversation loop completed.")
@@ -11,8 +11,21 @@ Created: 2025-04-27
 import argparse
 import logging
 import sys
-from typing import Any, Dict, List, Optional, Sequence, Tuple
-
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+# Arguments are parsed before any service is loaded, so this module must
+# not import from services, plugins or the pipeline controller.
+from audio import __version__
 from library.bin.dependency_injection.module_loader import Injectable
 
 logger = logging.getLogger(__name__)
@@ -43,25 +56,58 @@ class ArgumentParser(IArgumentParser):
 
     This class encapsulates all argument parsing logic for the application,
     including support for audio-in, audio-out, and conversation modes.
+    Command parsers are built on demand: a recognised command only builds
+    its own parser, while top-level help and usage errors build them all.
     """
 
+    _VERSION_FLAGS: ClassVar[Tuple[str, ...]] = ("-V", "--version")
+
     def __init__(self) -> None:
         """Initialize the argument parser."""
         self.parser = argparse.ArgumentParser(
             description="Audio transcription and synthesis tool",
             formatter_class=argparse.ArgumentDefaultsHelpFormatter,
         )
+        self.parser.add_argument(
+            *self._VERSION_FLAGS,
+            action="version",
+            version=f"%(prog)s {__version__}",
+        )
 
         # Add subparsers for different commands
         self.subparsers = self.parser.add_subparsers(
             dest="command", help="Command to execute", required=True
         )
+        self._configured_commands: Set[str] = set()
+
+    def _setup_commands(self, commands: Sequence[str]) -> None:
+        """Build the parsers for commands not yet configured.
+
+        Args:
+            commands: Names of the commands to set up
+        """
+        for command in commands:
+            if command not in self._configured_commands:
+                self._COMMAND_SETUP[command](self)
+                self._configured_commands.add(command)
+
+    @staticmethod
+    def _sniff_command(args: Sequence[str]) -> Optional[str]:
+        """Find the command name without running the full parser.
 
-        # Set up command parsers
-        self._setup_audio_in_parser()
-        self._setup_audio_out_parser()
-        self._setup_conversation_parser()
-        self._setup_state_machine_parser()
+        The top-level parser only has flag options, so the first
+        positional argument is the command.
+
+        Args:
+            args: Command-line arguments
+
+        Returns:
+            Optional[str]: The command name, or None if there is none
+        """
+        for arg in args:
+            if not arg.startswith("-"):
+                return arg
+        return None
 
     def _setup_audio_in_parser(self) -> None:
         """Set up the parser for the audio-in command."""
@@ -84,6 +130,13 @@ class ArgumentParser(IArgumentParser):
             help="Transcribe a specific audio file",
             dest="audio_path",
         )
+        source_group.add_argument(
+            "--dir",
+            "-d",
+            metavar="DIR",
+            help="Transcribe every WAV file in a directory concurrently",
+            dest="audio_dir",
+        )
 
         # Recording options
         parser.add_argument(
@@ -223,6 +276,16 @@ class ArgumentParser(IArgumentParser):
             help="Language code to use for transcription",
         )
 
+    # Setup method for each command, in the order shown in help
+    _COMMAND_SETUP: ClassVar[
+        Dict[str, Callable[["ArgumentParser"], None]]
+    ] = {
+        "audio-in": _setup_audio_in_parser,
+        "audio-out": _setup_audio_out_parser,
+        "conversation": _setup_conversation_parser,
+        "state-machine": _setup_state_machine_parser,
+    }
+
     def parse_arguments(
         self, args: Optional[Sequence[str]] = None
     ) -> Tuple[Dict[str, Any], str]:
@@ -247,7 +310,19 @@ class ArgumentParser(IArgumentParser):
             ```
         """
         # Use provided args or default to sys.argv[1:]
-        parsed_args = self.parser.parse_args(args)
+        argv = sys.argv[1:] if args is None else list(args)
+
+        # Build only the parser for the requested command; a bare
+        # --version needs none, anything else gets full help and errors
+        command = self._sniff_command(argv)
+        if command in self._COMMAND_SETUP:
+            self._setup_commands([command])
+        elif command is not None or not any(
+            arg in self._VERSION_FLAGS for arg in argv
+        ):
+            self._setup_commands(list(self._COMMAND_SETUP))
+
+        parsed_args = self.parser.parse_args(argv)
 
         # Convert Namespace to dictionary
         args_dict = vars(parsed_args)
@@ -6,7 +6,10 @@ application configuration from environment variables and config files.
 
 import logging
 import os
-from typing import Any, Dict, Optional
+import re
+from typing import Any, Dict, Optional, Tuple
+
+from services.directories import ensure_directory
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,16 @@ class ConfigurationManager:
     # Configuration store
     _config: Dict[str, Any] = {}
 
+    # Parsed config files keyed by path, with the mtime and size they
+    # were parsed at
+    _file_cache: Dict[str, Tuple[int, int, Dict[str, str]]] = {}
+
+    # One env file assignment: optional "export" prefix, identifier key,
+    # and a value with surrounding double quotes and whitespace dropped
+    _ENV_RE = re.compile(
+        r'^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=\s*"?([^"\n]*?)"?\s*$'
+    )
+
     @classmethod
     def initialize(cls, config_file: Optional[str] = None) -> None:
         """Initialize configuration from environment variables and optional config file.
@@ -38,16 +51,16 @@ class ConfigurationManager:
         Args:
             config_file: Optional path to configuration file
         """
-        # Start with defaults
-        cls._config = cls._defaults.copy()
-
-        # Override with environment variables
-        for key in cls._defaults:
-            if key in os.environ:
-                cls._config[key] = os.environ[key]
-
-        # Override with config file if provided
-        if config_file and os.path.exists(config_file):
+        # Start with defaults, overridden by environment variables
+        env_overrides = {
+            key: os.environ[key]
+            for key in cls._defaults.keys() & os.environ.keys()
+        }
+        cls._config = {**cls._defaults, **env_overrides}
+
+        # Override with config file if provided; a missing file is
+        # detected by the load itself rather than a separate check
+        if config_file:
             cls._load_from_file(config_file)
 
         # Ensure critical directories exist
@@ -82,30 +95,56 @@ class ConfigurationManager:
     def _load_from_file(cls, config_file: str) -> None:
         """Load configuration from file.
 
+        The parsed values are cached and reused until the file's
+        modification time or size changes.
+
+        A missing file is skipped silently, as an optional config file.
+
         Args:
             config_file: Path to configuration file
         """
         try:
-            # Simple implementation for env file format
-            with open(config_file, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    if "=" in line:
-                        key, value = line.split("=", 1)
-                        cls._config[key.strip()] = value.strip()
-        except Exception as e:
+            stat = os.stat(config_file)
+            cached = cls._file_cache.get(config_file)
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                values = cached[2]
+            else:
+                # Env file format, read in one call and matched line by
+                # line with the precompiled assignment pattern
+                with open(
+                    config_file, "r", encoding="utf-8", errors="replace"
+                ) as f:
+                    text = f.read()
+                matches = (
+                    cls._ENV_RE.match(line)
+                    for line in text.splitlines()
+                    if line and not line.lstrip().startswith("#")
+                )
+                values = {m.group(1): m.group(2) for m in matches if m}
+                cls._file_cache[config_file] = (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    values,
+                )
+        except FileNotFoundError:
+            logger.debug(f"Configuration file not found: {config_file}")
+            return
+        except OSError as e:
             logger.error(f"Error loading configuration file: {e}")
+            return
+
+        cls._config.update(values)
 
     @classmethod
     def _ensure_directories(cls) -> None:
         """Ensure required directories exist."""
-        for dir_key in ["AUDIO_INPUT_DIR", "AUDIO_OUTPUT_DIR"]:
+        for dir_key in ("AUDIO_INPUT_DIR", "AUDIO_OUTPUT_DIR"):
             dir_path = cls._config.get(dir_key)
-            if dir_path and not os.path.exists(dir_path):
-                try:
-                    os.makedirs(dir_path, exist_ok=True)
+            if not dir_path:
+                continue
+
+            try:
+                if ensure_directory(dir_path):
                     logger.info(f"Created directory: {dir_path}")
-                except Exception as e:
-                    logger.error(f"Failed to create directory {dir_path}: {e}")
+            except OSError as e:
+                logger.error(f"Failed to create directory {dir_path}: {e}")
@@ -1,22 +1,11 @@
 """Utility for creating dummy audio files for testing purposes."""
 
+import io
 import os
 import sys
-import tempfile
+from math import gcd
 from typing import Optional
 
-try:
-    import numpy as np
-    import soundfile as sf
-except ImportError:
-    pass
-
-try:
-    import librosa
-    from gtts import gTTS
-except ImportError:
-    pass
-
 from colorama import Fore, Style
 
 
@@ -35,43 +24,61 @@ def create_dummy_file(text: Optional[str] = None) -> str:
     # Early return for text-to-speech path
     if text:
         try:
-            # Create a temporary MP3 file using context manager for proper cleanup
-            with tempfile.NamedTemporaryFile(
-                suffix=".mp3", delete=False
-            ) as temp_mp3:
-                temp_mp3_path = temp_mp3.name
-
-                # Generate speech
-                tts = gTTS(text=text, lang="en", slow=False)
-                tts.save(temp_mp3_path)
-
-                # Convert to WAV
-                output_path = os.path.join(input_dir, "dummy_speech.wav")
-                audio_data, sample_rate = librosa.load(temp_mp3_path, sr=16000)
-                sf.write(output_path, audio_data, sample_rate)
-
-            # Clean up temp file after processing
-            os.unlink(temp_mp3_path)
+            # Optional dependencies are imported only on the path using them
+            import soundfile as sf
+            from gtts import gTTS
+            from scipy.signal import resample_poly
+
+            # Generate speech as MP3 in memory
+            mp3_buffer = io.BytesIO()
+            tts = gTTS(text=text, lang="en", slow=False)
+            tts.write_to_fp(mp3_buffer)
+            mp3_buffer.seek(0)
+
+            # Decode with libsndfile and resample to 16 kHz mono
+            audio_data, source_rate = sf.read(mp3_buffer, dtype="float32")
+            if audio_data.ndim > 1:
+                audio_data = audio_data.mean(axis=1)
+            sample_rate = 16000
+            if source_rate != sample_rate:
+                factor = gcd(sample_rate, source_rate)
+                audio_data = resample_poly(
+                    audio_data, sample_rate // factor, source_rate // factor
+                )
+
+            # Convert to WAV
+            output_path = os.path.join(input_dir, "dummy_speech.wav")
+            sf.write(output_path, audio_data, sample_rate)
 
             print(
                 f"{Fore.GREEN}Created speech WAV file: {output_path}{Style.RESET_ALL}"
             )
             return output_path
 
-        except (ImportError, NameError):
+        except ImportError:
             print(
                 f"{Fore.YELLOW}Speech synthesis packages not available.{Style.RESET_ALL}"
             )
-            print("Install with: pip install gtts librosa soundfile")
+            print("Install with: pip install gtts scipy soundfile")
             # Fall back to sine wave
 
     # Sine wave generation as fallback
     try:
+        import numpy as np
+        import soundfile as sf
+
         # Create a sine wave
         duration = 3.0
         sample_rate = 16000
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        audio = 0.5 * np.sin(2 * np.pi * 440 * t)
+        num_samples = int(sample_rate * duration)
+        t = np.linspace(
+            0, duration, num_samples, endpoint=False, dtype=np.float32
+        )
+        # Compute in place in float32 to avoid float64 temporaries
+        audio = np.empty(num_samples, dtype=np.float32)
+        np.multiply(t, 2 * np.pi * 440, out=audio)
+        np.sin(audio, out=audio)
+        audio *= 0.5
 
         # Save as WAV
         output_path = os.path.join(input_dir, "dummy_sine.wav")
@@ -82,7 +89,7 @@ def create_dummy_file(text: Optional[str] = None) -> str:
         )
         return output_path
 
-    except (ImportError, NameError):
+    except ImportError:
         print(
             f"{Fore.RED}Could not create dummy file. Install numpy and soundfile.{Style.RESET_ALL}"
         )
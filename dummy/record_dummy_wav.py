@@ -2,10 +2,10 @@
 
 import argparse
 import os
+import wave
 
 import numpy as np
 import sounddevice as sd
-from scipy.io.wavfile import write  # type: ignore
 
 
 def record_wav(
@@ -35,17 +35,27 @@ def record_wav(
         # If recording fails (e.g., no microphone), generate dummy audio
         print(f"Recording failed: {e}")
         print("Generating dummy audio instead...")
+        num_samples = int(samplerate * duration)
         t = np.linspace(
-            0, duration, int(samplerate * duration), endpoint=False
+            0, duration, num_samples, endpoint=False, dtype=np.float32
         )
-        audio = np.sin(2 * np.pi * 440 * t).astype(np.int16) * 10000
-        audio = audio.reshape(-1, 1)  # Reshape to match channels
+        # Compute the wave in place in float32, then scale it straight
+        # into the int16 output
+        sine = np.empty(num_samples, dtype=np.float32)
+        np.multiply(t, 2 * np.pi * 440, out=sine)
+        np.sin(sine, out=sine)
+        audio = np.empty((num_samples, 1), dtype=np.int16)  # One channel
+        np.multiply(sine, 10000, out=audio[:, 0], casting="unsafe")
 
     # Create the output directory if it doesn't exist
     os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
 
-    # Save the audio
-    write(filename, samplerate, audio)
+    # Save the audio as 16-bit mono PCM; the samples are already int16
+    with wave.open(filename, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(samplerate)
+        wf.writeframes(np.ascontiguousarray(audio, dtype=np.int16).tobytes())
     print(f"Recording saved to: {filename}")
 
     return filename
@@ -4,6 +4,16 @@ This package provides dependency injection functionality for managing
 service instances and their dependencies across the application.
 """
 
-from library.bin.dependency_injection.container import DIContainer, container
+from library.bin.dependency_injection.container import (
+    DIContainer,
+    get_container,
+)
+from library.bin.dependency_injection.lazy_import import lazy_import
 
-__all__ = ["container", "DIContainer"]
+# Stands in for the global container so importing the package does not
+# build it; the container is created on first attribute access or call
+container = lazy_import(
+    "library.bin.dependency_injection.container.container"
+)
+
+__all__ = ["container", "DIContainer", "get_container"]
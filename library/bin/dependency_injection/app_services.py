@@ -5,9 +5,19 @@ prototyping, replacing the more complex enterprise-grade DI container.
 """
 
 import logging
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Final,
+    Optional,
+    Type,
+    TypeVar,
+)
 
-from services.implementations.audio_service_impl import AudioRecordingService
+from library.bin.dependency_injection.lazy_import import lazy_import
 from services.implementations.configuration_manager_impl import (
     ConfigurationManager,
 )
@@ -15,13 +25,6 @@ from services.implementations.file_service_impl import FileService
 from services.implementations.platform_service_impl import (
     PlatformDetectionService,
 )
-from services.implementations.text_to_speech_service_impl import (
-    TextToSpeechService,
-)
-from services.implementations.transcription_service_impl import (
-    TranscriptionService,
-)
-from services.interfaces.audio_service_interface import IAudioRecordingService
 from services.interfaces.configuration_manager_interface import (
     IConfigurationManager,
 )
@@ -29,17 +32,53 @@ from services.interfaces.file_service_interface import IFileService
 from services.interfaces.platform_service_interface import (
     IPlatformDetectionService,
 )
-from services.interfaces.text_to_speech_service_interface import (
-    ITextToSpeechService,
-)
-from services.interfaces.transcription_service_interface import (
-    ITranscriptionService,
-)
+
+if TYPE_CHECKING:
+    from services.interfaces.audio_service_interface import (
+        IAudioRecordingService,
+    )
+    from services.interfaces.text_to_speech_service_interface import (
+        ITextToSpeechService,
+    )
+    from services.interfaces.transcription_service_interface import (
+        ITranscriptionService,
+    )
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Heavier implementations, imported when their service is first created
+AudioRecordingService = lazy_import(
+    "services.implementations.audio_service_impl.AudioRecordingService"
+)
+TranscriptionService = lazy_import(
+    "services.implementations.transcription_service_impl.TranscriptionService"
+)
+TextToSpeechService = lazy_import(
+    "services.implementations.text_to_speech_service_impl.TextToSpeechService"
+)
+
+# Services created on first access, keyed by the qualified names of their
+# interface and implementation so get() can match either without
+# importing the modules
+_LAZY_SERVICE_ATTRS: Final[Dict[str, str]] = {
+    "services.interfaces.audio_service_interface.IAudioRecordingService": (
+        "audio_service"
+    ),
+    "services.implementations.audio_service_impl.AudioRecordingService": (
+        "audio_service"
+    ),
+    "services.interfaces.transcription_service_interface."
+    "ITranscriptionService": "transcription_service",
+    "services.implementations.transcription_service_impl."
+    "TranscriptionService": "transcription_service",
+    "services.interfaces.text_to_speech_service_interface."
+    "ITextToSpeechService": "text_to_speech_service",
+    "services.implementations.text_to_speech_service_impl."
+    "TextToSpeechService": "text_to_speech_service",
+}
+
 
 class AppServices:
     """Simple service container with constructor injection.
@@ -49,6 +88,17 @@ class AppServices:
     dependencies for easier testing.
     """
 
+    # Attribute holding each eagerly created service, by interface and
+    # implementation type
+    _SERVICE_ATTRS: ClassVar[Dict[Type[Any], str]] = {
+        IConfigurationManager: "config_manager",
+        ConfigurationManager: "config_manager",
+        IFileService: "file_service",
+        FileService: "file_service",
+        IPlatformDetectionService: "platform_service",
+        PlatformDetectionService: "platform_service",
+    }
+
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Initialize the service container with configuration.
 
@@ -63,12 +113,71 @@ class AppServices:
         self.file_service = FileService()
         self.platform_service = PlatformDetectionService()
 
-        # Services with dependencies
-        self.audio_service = AudioRecordingService(
-            self.platform_service, self.file_service
-        )
-        self.transcription_service = TranscriptionService(self.file_service)
-        self.text_to_speech_service = TextToSpeechService()
+        # Heavier services are created on first access
+        self._audio_service: Optional["IAudioRecordingService"] = None
+        self._transcription_service: Optional["ITranscriptionService"] = None
+        self._text_to_speech_service: Optional["ITextToSpeechService"] = None
+
+        # Factories registered for a service attribute, called on the
+        # service's first get()
+        self._factories: Dict[str, Callable[[], Any]] = {}
+
+        # Lookup table for get(), rebuilt whenever a service is replaced
+        self._service_map: Dict[Type[Any], Any] = {}
+        self._reset_service_map()
+
+    @property
+    def audio_service(self) -> "IAudioRecordingService":
+        """Audio recording service, created on first access."""
+        if self._audio_service is None:
+            self._audio_service = AudioRecordingService(
+                self.platform_service, self.file_service
+            )
+        return self._audio_service
+
+    @audio_service.setter
+    def audio_service(self, instance: "IAudioRecordingService") -> None:
+        self._audio_service = instance
+        self._reset_service_map()
+
+    @property
+    def transcription_service(self) -> "ITranscriptionService":
+        """Transcription service, created on first access."""
+        if self._transcription_service is None:
+            self._transcription_service = TranscriptionService(
+                self.file_service
+            )
+        return self._transcription_service
+
+    @transcription_service.setter
+    def transcription_service(self, instance: "ITranscriptionService") -> None:
+        self._transcription_service = instance
+        self._reset_service_map()
+
+    @property
+    def text_to_speech_service(self) -> "ITextToSpeechService":
+        """Text-to-speech service, created on first access."""
+        if self._text_to_speech_service is None:
+            self._text_to_speech_service = TextToSpeechService()
+        return self._text_to_speech_service
+
+    @text_to_speech_service.setter
+    def text_to_speech_service(self, instance: "ITextToSpeechService") -> None:
+        self._text_to_speech_service = instance
+        self._reset_service_map()
+
+    @staticmethod
+    def _lazy_attr(service_type: Type[Any]) -> Optional[str]:
+        """Get the attribute holding a lazily created service type.
+
+        Args:
+            service_type: Interface or implementation type
+
+        Returns:
+            Optional[str]: Attribute name, or None if not a lazy service
+        """
+        qualified_name = f"{service_type.__module__}.{service_type.__qualname__}"
+        return _LAZY_SERVICE_ATTRS.get(qualified_name)
 
     def get(self, service_type: Type[T]) -> T:
         """To locate for testing/overrides.
@@ -82,27 +191,56 @@ class AppServices:
         Raises:
             KeyError: If service is not registered
         """
-        service_map = {
-            IConfigurationManager: self.config_manager,
-            ConfigurationManager: self.config_manager,
-            IFileService: self.file_service,
-            FileService: self.file_service,
-            IPlatformDetectionService: self.platform_service,
-            PlatformDetectionService: self.platform_service,
-            IAudioRecordingService: self.audio_service,
-            AudioRecordingService: self.audio_service,
-            ITranscriptionService: self.transcription_service,
-            TranscriptionService: self.transcription_service,
-            ITextToSpeechService: self.text_to_speech_service,
-            TextToSpeechService: self.text_to_speech_service,
-        }
+        try:
+            return self._service_map[service_type]  # type: ignore
+        except KeyError:
+            pass
 
-        if service_type not in service_map:
+        attr = self._service_attr(service_type)
+        if attr is None:
             raise KeyError(
                 f"No service of type {service_type.__name__} is registered"
             )
 
-        return service_map[service_type]  # type: ignore
+        factory = self._factories.pop(attr, None)
+        if factory is not None:
+            # First lookup of a factory-registered service
+            instance = factory()
+            setattr(self, attr, instance)
+            self._reset_service_map()
+            return instance  # type: ignore
+
+        # Create the lazy service and remember it for later lookups
+        instance = getattr(self, attr)
+        self._service_map[service_type] = instance
+        return instance  # type: ignore
+
+    def _service_attr(self, service_type: Type[Any]) -> Optional[str]:
+        """Get the attribute holding a service type.
+
+        Args:
+            service_type: Interface or implementation type
+
+        Returns:
+            Optional[str]: Attribute name, or None if not recognized
+        """
+        attr = self._SERVICE_ATTRS.get(service_type)
+        if attr is None:
+            attr = self._lazy_attr(service_type)
+        return attr
+
+    def _reset_service_map(self) -> None:
+        """Rebuild the get() lookup table from the current services.
+
+        Lazily created services, and services with a pending factory, are
+        added on their first get().
+        """
+        factories = self._factories
+        self._service_map = {
+            service_type: getattr(self, attr)
+            for service_type, attr in self._SERVICE_ATTRS.items()
+            if attr not in factories
+        }
 
     def register_instance(self, service_type: Type[T], instance: Any) -> None:
         """Register a service instance for testing/mocking.
@@ -111,38 +249,69 @@ class AppServices:
             service_type: Type of service to register
             instance: Service instance to register
         """
-        if (
-            service_type == IConfigurationManager
-            or service_type == ConfigurationManager
-        ):
-            self.config_manager = instance
-        elif service_type == IFileService or service_type == FileService:
-            self.file_service = instance
-        elif (
-            service_type == IPlatformDetectionService
-            or service_type == PlatformDetectionService
-        ):
-            self.platform_service = instance
-        elif (
-            service_type == IAudioRecordingService
-            or service_type == AudioRecordingService
-        ):
-            self.audio_service = instance
-        elif (
-            service_type == ITranscriptionService
-            or service_type == TranscriptionService
-        ):
-            self.transcription_service = instance
-        elif (
-            service_type == ITextToSpeechService
-            or service_type == TextToSpeechService
-        ):
-            self.text_to_speech_service = instance
-        else:
+        attr = self._service_attr(service_type)
+        if attr is None:
+            logger.warning(
+                f"Unrecognized service type: {service_type.__name__}"
+            )
+            return
+
+        # An explicit instance replaces any factory still pending
+        self._factories.pop(attr, None)
+        setattr(self, attr, instance)
+        self._reset_service_map()
+
+    def register_factory(
+        self, service_type: Type[T], factory: Callable[[], Any]
+    ) -> None:
+        """Register a factory that creates a service on its first get().
+
+        The factory is only consulted by get(); reading the service
+        attribute directly still returns the current instance.
+
+        Args:
+            service_type: Type of service to register
+            factory: Zero-argument callable creating the service
+        """
+        attr = self._service_attr(service_type)
+        if attr is None:
             logger.warning(
                 f"Unrecognized service type: {service_type.__name__}"
             )
+            return
+
+        self._factories[attr] = factory
+        self._reset_service_map()
+
+
+# Shared instance, created on first use rather than at import time
+_app_services: Optional[AppServices] = None
+
 
+def get_app_services() -> AppServices:
+    """Get the shared service container, creating it on first use.
 
-# Create a global instance for easy access
-app_services = AppServices()
+    Returns:
+        The shared AppServices instance
+    """
+    global _app_services
+    if _app_services is None:
+        _app_services = AppServices()
+    return _app_services
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy ``app_services`` module attribute lazily.
+
+    Args:
+        name: Name of the requested module attribute
+
+    Returns:
+        The shared AppServices instance for ``app_services``
+
+    Raises:
+        AttributeError: If the module has no such attribute
+    """
+    if name == "app_services":
+        return get_app_services()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
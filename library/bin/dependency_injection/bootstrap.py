@@ -10,33 +10,17 @@ from typing import Any, Dict, Optional, Type, TypeVar
 from library.bin.dependency_injection.container import (
     DIContainer,
     ServiceLifetime,
+    get_container,
+)
+from library.bin.dependency_injection.container_configuration import (
+    register_core_services,
 )
 from library.bin.dependency_injection.module_loader import (
     auto_register_services,
 )
-from library.bin.dependency_injection.plugin_provider import PluginProvider
-from services.implementations.audio_service_impl import AudioRecordingService
-from services.implementations.configuration_manager_impl import (
-    ConfigurationManager,
-)
-from services.implementations.file_service_impl import FileService
-from services.implementations.platform_service_impl import (
-    PlatformDetectionService,
-)
-from services.implementations.transcription_service_impl import (
-    TranscriptionService,
-)
-from services.interfaces.audio_service_interface import IAudioRecordingService
 from services.interfaces.configuration_manager_interface import (
     IConfigurationManager,
 )
-from services.interfaces.file_service_interface import IFileService
-from services.interfaces.platform_service_interface import (
-    IPlatformDetectionService,
-)
-from services.interfaces.transcription_service_interface import (
-    ITranscriptionService,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -76,7 +60,19 @@ class Bootstrapper:
         logger.info("Application bootstrapped with DI container")
 
     def _register_core_services(self) -> None:
-        """Register core application services manually."""
+        """Register core application services manually.
+
+        The core services are registered as factories from the shared
+        CORE_SERVICES table, so each implementation module is only
+        imported when its service is first resolved.
+        """
+        from library.bin.dependency_injection.plugin_provider import (
+            PluginProvider,
+        )
+        from services.implementations.configuration_manager_impl import (
+            ConfigurationManager,
+        )
+
         # Create and register configuration manager
         config_manager = ConfigurationManager(self.container._config)
         self.container.register(
@@ -94,37 +90,13 @@ class Bootstrapper:
             lifetime=ServiceLifetime.SINGLETON,
         )
 
-        # Register platform service
-        self.container.register(
-            IPlatformDetectionService,
-            PlatformDetectionService,
-            lifetime=ServiceLifetime.SINGLETON,
-        )
-
-        # Register file service
-        self.container.register(
-            IFileService, FileService, lifetime=ServiceLifetime.SINGLETON
-        )
-
-        # Register audio recording service
-        # Dependencies will be auto-resolved
-        self.container.register(
-            IAudioRecordingService,
-            AudioRecordingService,
-            lifetime=ServiceLifetime.SINGLETON,
-        )
-
-        # Register transcription service
-        # Dependencies will be auto-resolved
-        self.container.register(
-            ITranscriptionService,
-            TranscriptionService,
-            lifetime=ServiceLifetime.SINGLETON,
-        )
+        # Register the lazily created core services
+        register_core_services(self.container)
 
     def _auto_register_services(self) -> None:
         """Auto-register services from annotated modules."""
-        # Packages to scan for @Injectable services
+        # Packages to scan for @Injectable services; keep the Makefile's
+        # INJECTABLE_PACKAGES and the Dockerfile index step in sync
         packages = [
             "services.implementations",
             "services.factories",
@@ -152,14 +124,26 @@ class Bootstrapper:
         return self.container.factory(service_type)
 
 
-# Create a bootstrapper for the global container
-bootstrapper = Bootstrapper(DIContainer())
+# Global bootstrapper, created on first use
+_bootstrapper: Optional[Bootstrapper] = None
+
+
+def _get_bootstrapper() -> Bootstrapper:
+    """Get the bootstrapper for the global container, creating it once.
+
+    Returns:
+        The global Bootstrapper instance
+    """
+    global _bootstrapper
+    if _bootstrapper is None:
+        _bootstrapper = Bootstrapper(get_container())
+    return _bootstrapper
 
 
 def bootstrap_application(config: Optional[Dict[str, Any]] = None) -> None:
-    """Bootstrap the application with DI configuration.
+    """Bootstrap the global container with DI configuration.
 
     Args:
         config: Optional application configuration
     """
-    bootstrapper.bootstrap(config)
+    _get_bootstrapper().bootstrap(config)
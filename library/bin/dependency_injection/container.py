@@ -6,13 +6,102 @@ advanced features like scoped lifetimes, lazy resolution, and factory methods.
 
 import inspect
 import logging
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, cast
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    get_type_hints,
+)
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 TFactory = TypeVar("TFactory")
 
+# Marks a missing cache entry, since None is a valid service instance
+_MISSING = object()
+
+# Shared overrides for the common no-override path; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+# A constructor dependency: the parameter name and its annotated type
+Dependency = Tuple[str, Type]
+
+# Builds an instance for a registration from a scope and overrides
+ResolutionPlan = Callable[[Optional["Scope"], Dict[str, Any]], Any]
+
+# Constructor reflection results, computed once per implementation type
+_signatures: Dict[Type, inspect.Signature] = {}
+_dependencies: Dict[Type, Tuple[Dependency, ...]] = {}
+
+
+def _constructor_signature(implementation_type: Type) -> inspect.Signature:
+    """Get the signature of a type's constructor, reflected once per type.
+
+    Args:
+        implementation_type: Type to inspect
+
+    Returns:
+        Signature of the type's ``__init__``
+    """
+    signature = _signatures.get(implementation_type)
+    if signature is None:
+        signature = inspect.signature(implementation_type.__init__)
+        _signatures[implementation_type] = signature
+    return signature
+
+
+def _constructor_hints(implementation_type: Type) -> Dict[str, Any]:
+    """Get a constructor's annotations with string annotations evaluated.
+
+    Args:
+        implementation_type: Type to inspect
+
+    Returns:
+        Mapping of parameter name to annotation
+    """
+    constructor = implementation_type.__init__
+    try:
+        return get_type_hints(constructor)
+    except Exception:
+        # Some annotation names a type imported only for type checking;
+        # fall back to the raw annotations, where such strings are skipped
+        return dict(getattr(constructor, "__annotations__", {}))
+
+
+def _constructor_dependencies(
+    implementation_type: Type,
+) -> Tuple[Dependency, ...]:
+    """Collect the class-annotated parameters of a type's constructor.
+
+    Args:
+        implementation_type: Type to analyze
+
+    Returns:
+        (parameter name, type) pairs in parameter order
+    """
+    dependencies = _dependencies.get(implementation_type)
+    if dependencies is None:
+        signature = _constructor_signature(implementation_type)
+        hints = _constructor_hints(implementation_type)
+        dependencies = tuple(
+            (name, hints[name])
+            for name in signature.parameters
+            if name != "self" and isinstance(hints.get(name), type)
+        )
+        _dependencies[implementation_type] = dependencies
+    return dependencies
+
 
 class ServiceLifetime:
     """Service lifetime options for DI container registrations."""
@@ -25,6 +114,16 @@ class ServiceLifetime:
 class ServiceRegistration:
     """Registration details for a service in the DI container."""
 
+    __slots__ = (
+        "service_type",
+        "implementation_type",
+        "implementation",
+        "factory",
+        "lifetime",
+        "dependencies",
+        "plan",
+    )
+
     def __init__(
         self,
         service_type: Type,
@@ -32,7 +131,7 @@ class ServiceRegistration:
         implementation: Optional[Any] = None,
         factory: Optional[Callable[..., Any]] = None,
         lifetime: str = ServiceLifetime.SINGLETON,
-        dependencies: Optional[List[Type]] = None,
+        dependencies: Optional[Sequence[Dependency]] = None,
     ) -> None:
         """Initialize a service registration.
 
@@ -42,17 +141,25 @@ class ServiceRegistration:
             implementation: Instance implementing the service (optional)
             factory: Factory function to create the service (optional)
             lifetime: Service lifetime (singleton, scoped, transient)
-            dependencies: List of dependency types required for initialization
+            dependencies: (parameter name, type) pairs required for initialization
         """
         self.service_type = service_type
         self.implementation_type = implementation_type
         self.implementation = implementation
         self.factory = factory
         self.lifetime = lifetime
-        self.dependencies = dependencies or []
+        # Only ever iterated, so stored as a tuple
+        self.dependencies: Tuple[Dependency, ...] = tuple(dependencies or ())
+
+        # Compiled by the container on first instantiation
+        self.plan: Optional[ResolutionPlan] = None
 
         # Validate registration
-        if not any([implementation_type, implementation, factory]):
+        if (
+            implementation_type is None
+            and implementation is None
+            and factory is None
+        ):
             raise ValueError(
                 f"Service {service_type} must have either an implementation "
                 "type, instance, or factory method"
@@ -67,6 +174,8 @@ class Scope:
     the scope but not between different scopes.
     """
 
+    __slots__ = ("container", "instances", "lock")
+
     def __init__(self, container: "DIContainer") -> None:
         """Initialize a scope with reference to its parent container.
 
@@ -74,7 +183,11 @@ class Scope:
             container: Parent DI container
         """
         self.container = container
-        self.instances: Dict[str, Any] = {}
+        self.instances: Dict[Type, Any] = {}
+
+        # Guards creation only; reentrant because creating one scoped
+        # service may resolve another in the same scope
+        self.lock = threading.RLock()
 
     def resolve(self, service_type: Type[T]) -> T:
         """Resolve a service from this scope.
@@ -103,10 +216,21 @@ class DIContainer:
 
     def __init__(self) -> None:
         """Initialize the dependency injection container."""
-        self._registrations: Dict[str, ServiceRegistration] = {}
-        self._singletons: Dict[str, Any] = {}
+        # Keyed by the service type itself, so same-named types from
+        # different modules never collide
+        self._registrations: Dict[Type, ServiceRegistration] = {}
+        self._singletons: Dict[Type, Any] = {}
         self._config: Dict[str, Any] = {}
 
+        # Taken only when a singleton has to be created, so cached reads
+        # stay lock-free; reentrant because singleton dependencies are
+        # created while it is held
+        self._singleton_lock = threading.RLock()
+
+        # Services whose dependency subgraph is known to be acyclic,
+        # cleared whenever registrations change
+        self._acyclic: Set[Type] = set()
+
     def configure(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Configure the container with application settings.
 
@@ -158,7 +282,7 @@ class DIContainer:
             lifetime = ServiceLifetime.SINGLETON
 
         # Determine dependencies for implementation type
-        dependencies = []
+        dependencies: List[Dependency] = []
         if implementation_type and not implementation and not factory:
             try:
                 dependencies = self._get_constructor_dependencies(
@@ -179,18 +303,23 @@ class DIContainer:
             dependencies=dependencies,
         )
 
-        # Store registration
-        key = service_type.__name__
-        self._registrations[key] = registration
+        # Store registration, dropping any instance cached for a previous
+        # registration since resolve() serves cached singletons first
+        self._registrations[service_type] = registration
+        self._singletons.pop(service_type, None)
+        self._acyclic.clear()
 
         # If this is a singleton with an instance already provided, store it
         if (
             lifetime == ServiceLifetime.SINGLETON
             and implementation is not None
         ):
-            self._singletons[key] = implementation
+            self._singletons[service_type] = implementation
 
-        logger.debug(f"Registered service: {key} with lifetime {lifetime}")
+        logger.debug(
+            f"Registered service: {service_type.__name__} "
+            f"with lifetime {lifetime}"
+        )
 
     def factory(self, service_type: Type[TFactory]) -> Callable[..., TFactory]:
         """Get a factory function for a service type.
@@ -199,6 +328,9 @@ class DIContainer:
         registered service with optional arguments that override the resolved
         dependencies.
 
+        Overrides are keyword arguments named after either the constructor
+        parameter or the dependency's class.
+
         Args:
             service_type: Type of service to create a factory for
 
@@ -208,9 +340,10 @@ class DIContainer:
         Raises:
             KeyError: If service is not registered
         """
-        key = service_type.__name__
-        if key not in self._registrations:
-            raise KeyError(f"No service of type {key} is registered")
+        if service_type not in self._registrations:
+            raise KeyError(
+                f"No service of type {service_type.__name__} is registered"
+            )
 
         def factory_func(**kwargs: Any) -> TFactory:
             """Must create service instances with overrides.
@@ -221,9 +354,10 @@ class DIContainer:
             Returns:
                 An instance of the requested service
             """
-            return self._create_instance(
-                self._registrations[key], None, kwargs
+            instance: TFactory = self._create_instance(
+                self._registrations[service_type], None, kwargs
             )
+            return instance
 
         return factory_func
 
@@ -249,39 +383,90 @@ class DIContainer:
 
         Raises:
             KeyError: If service is not registered
+            ValueError: If the service's dependencies depend on each
+                other in a cycle
         """
-        key = service_type.__name__
-        if key not in self._registrations:
-            raise KeyError(f"No service of type {key} is registered")
+        # Fast path: an already created singleton needs one lookup. The
+        # annotation carries the return type, so no cast() call is needed
+        instance: T = self._singletons.get(service_type, _MISSING)
+        if instance is not _MISSING:
+            return instance
 
-        registration = self._registrations[key]
+        try:
+            registration = self._registrations[service_type]
+        except KeyError:
+            raise KeyError(
+                f"No service of type {service_type.__name__} is registered"
+            ) from None
+
+        # Check the dependencies reachable from this service once, before
+        # its first creation; cycles elsewhere do not affect it
+        if service_type not in self._acyclic:
+            self._acyclic.update(self._dependency_order((service_type,)))
 
         # Handle different service lifetimes
         if registration.lifetime == ServiceLifetime.SINGLETON:
-            # For singletons, create once and reuse
-            if key not in self._singletons:
-                self._singletons[key] = self._create_instance(
-                    registration, scope
-                )
-            return cast(T, self._singletons[key])
+            # For singletons, create once and reuse; re-check under the
+            # lock in case another thread created it first
+            with self._singleton_lock:
+                instance = self._singletons.get(service_type, _MISSING)
+                if instance is _MISSING:
+                    instance = self._create_instance(registration, scope)
+                    self._singletons[service_type] = instance
+            return instance
 
         elif registration.lifetime == ServiceLifetime.SCOPED:
             # For scoped services, ensure we have a scope
             if not scope:
                 raise ValueError(
-                    f"Cannot resolve scoped service {key} without a scope"
+                    f"Cannot resolve scoped service {service_type.__name__} "
+                    "without a scope"
                 )
 
             # Create once per scope
-            if key not in scope.instances:
-                scope.instances[key] = self._create_instance(
-                    registration, scope
-                )
-            return cast(T, scope.instances[key])
+            instance = scope.instances.get(service_type, _MISSING)
+            if instance is _MISSING:
+                with scope.lock:
+                    instance = scope.instances.get(service_type, _MISSING)
+                    if instance is _MISSING:
+                        instance = self._create_instance(registration, scope)
+                        scope.instances[service_type] = instance
+            return instance
 
         else:  # TRANSIENT
             # Always create a new instance
-            return cast(T, self._create_instance(registration, scope))
+            instance = self._create_instance(registration, scope)
+            return instance
+
+    def build(
+        self, implementation_type: Type[T], scope: Optional[Scope] = None
+    ) -> T:
+        """Create an instance of a type with its dependencies resolved.
+
+        The type does not need to be registered; its constructor
+        dependencies are resolved from the container as for a registered
+        implementation type.
+
+        Args:
+            implementation_type: Concrete type to instantiate
+            scope: Optional scope for resolving scoped dependencies
+
+        Returns:
+            A new instance of the type
+
+        Raises:
+            ValueError: If instantiation fails
+        """
+        registration = ServiceRegistration(
+            service_type=implementation_type,
+            implementation_type=implementation_type,
+            lifetime=ServiceLifetime.TRANSIENT,
+            dependencies=self._get_constructor_dependencies(
+                implementation_type
+            ),
+        )
+        instance: T = self._create_instance(registration, scope)
+        return instance
 
     def _create_instance(
         self,
@@ -302,98 +487,101 @@ class DIContainer:
         Raises:
             ValueError: If instantiation fails
         """
+        plan = registration.plan
+        if plan is None:
+            plan = registration.plan = self._compile_plan(registration)
+        return plan(scope, overrides or _EMPTY)
+
+    def _compile_plan(self, registration: ServiceRegistration) -> ResolutionPlan:
+        """Build the instantiation function for a registration.
+
+        Everything that does not depend on the scope or overrides, such as
+        the registration kind and the names of the dependencies, is worked
+        out here once rather than on every resolve.
+
+        Args:
+            registration: Service registration
+
+        Returns:
+            A function creating instances from a scope and overrides
+
+        Raises:
+            ValueError: If the registration has nothing to instantiate
+        """
         # If we already have an instance, return it
-        if registration.implementation is not None:
-            return registration.implementation
+        implementation = registration.implementation
+        if implementation is not None:
+            return lambda scope, overrides: implementation
 
         # If we have a factory, use it with resolved dependencies
-        if registration.factory is not None:
-            return registration.factory(self)
+        factory = registration.factory
+        if factory is not None:
+            return lambda scope, overrides: factory(self)
 
         # Otherwise, create an instance of the implementation type
-        if registration.implementation_type is None:
+        implementation_type = registration.implementation_type
+        if implementation_type is None:
             raise ValueError(
                 f"Cannot create instance of {registration.service_type.__name__}: "
                 "no implementation type, instance, or factory provided"
             )
+        service_name = registration.service_type.__name__
+
+        # Dependencies already carry their parameter names; add the class
+        # names accepted as override keys
+        dep_args = [
+            (param_name, dep_type.__name__, dep_type)
+            for param_name, dep_type in registration.dependencies
+        ]
+
+        def plan(scope: Optional[Scope], overrides: Dict[str, Any]) -> Any:
+            # Resolve dependencies
+            args = {}
+            for param_name, dep_name, dep_type in dep_args:
+                # Use override if provided
+                if param_name in overrides:
+                    args[param_name] = overrides[param_name]
+                    continue
+                if dep_name in overrides:
+                    args[param_name] = overrides[dep_name]
+                    continue
 
-        # Resolve dependencies
-        args = {}
-        overrides = overrides or {}
+                # Otherwise resolve from container
+                try:
+                    args[param_name] = self.resolve(dep_type, scope)
+                except KeyError:
+                    logger.warning(
+                        f"Failed to resolve dependency {dep_name} for "
+                        f"{service_name}"
+                    )
 
-        # Get constructor signature to get parameter names
-        if registration.implementation_type:
-            signature = inspect.signature(
-                registration.implementation_type.__init__
-            )
-            param_names = [
-                name for name in signature.parameters.keys() if name != "self"
-            ]
-
-            # Match dependencies to parameter names
-            for i, dep_type in enumerate(registration.dependencies):
-                dep_name = dep_type.__name__
-                # Use the actual parameter name from the signature if possible
-                param_name = (
-                    param_names[i]
-                    if i < len(param_names)
-                    else dep_name.lower()
+            # Create instance with resolved dependencies
+            try:
+                return implementation_type(**args)
+            except Exception as e:
+                raise ValueError(
+                    f"Failed to create instance of {service_name}: {e}"
                 )
 
-                if dep_name in overrides:
-                    # Use override if provided
-                    args[param_name] = overrides[dep_name]
-                else:
-                    # Otherwise resolve from container
-                    try:
-                        args[param_name] = self.resolve(dep_type, scope)
-                    except KeyError:
-                        logger.warning(
-                            f"Failed to resolve dependency {dep_name} for "
-                            f"{registration.service_type.__name__}"
-                        )
-
-        # Create instance with resolved dependencies
-        try:
-            return registration.implementation_type(**args)
-        except Exception as e:
-            raise ValueError(
-                f"Failed to create instance of {registration.service_type.__name__}: {e}"
-            )
+        return plan
 
     def _get_constructor_dependencies(
         self, implementation_type: Type
-    ) -> List[Type]:
+    ) -> List[Dependency]:
         """Determine the dependencies required by a type's constructor.
 
         Args:
             implementation_type: Type to analyze
 
         Returns:
-            List of dependency types
+            List of (parameter name, dependency type) pairs
 
         Raises:
             ValueError: If constructor analysis fails
         """
         try:
-            # Get constructor signature
-            constructor = implementation_type.__init__
-            signature = inspect.signature(constructor)
-
-            # Extract parameter types from type hints
-            dependencies = []
-            for name, param in signature.parameters.items():
-                if name == "self":
-                    continue
-
-                # Get the parameter type
-                param_type = param.annotation
-                if param_type is not inspect.Parameter.empty and isinstance(
-                    param_type, type
-                ):
-                    dependencies.append(param_type)
-
-            return dependencies
+            # Reflection is cached per type; copy so callers may mutate
+            return list(_constructor_dependencies(implementation_type))
         except Exception as e:
             raise ValueError(
                 f"Failed to analyze constructor for {implementation_type}: {e}"
@@ -408,7 +596,7 @@ class DIContainer:
         Returns:
             True if the type is registered, False otherwise
         """
-        return service_type.__name__ in self._registrations
+        return service_type in self._registrations
 
     def remove_registration(self, service_type: Type) -> bool:
         """Remove a service registration.
@@ -419,14 +607,138 @@ class DIContainer:
         Returns:
             True if removed, False if not found
         """
-        key = service_type.__name__
-        if key in self._registrations:
-            del self._registrations[key]
-            if key in self._singletons:
-                del self._singletons[key]
+        if service_type in self._registrations:
+            del self._registrations[service_type]
+            self._singletons.pop(service_type, None)
+            self._acyclic.clear()
             return True
         return False
 
+    def warm_up(self) -> None:
+        """Create all singleton services in dependency order.
+
+        Raises:
+            ValueError: If the registered services depend on each other
+                in a cycle
+        """
+        build_order = self._dependency_order(self._registrations)
+        self._acyclic.update(build_order)
+        for service_type in build_order:
+            if (
+                self._registrations[service_type].lifetime
+                == ServiceLifetime.SINGLETON
+            ):
+                self.resolve(service_type)
+
+    def _dependency_order(self, roots: Iterable[Type]) -> List[Type]:
+        """Order the services reachable from roots, dependencies first.
+
+        Runs Tarjan's strongly connected components algorithm iteratively,
+        so deep graphs cannot hit the recursion limit, over the registered
+        constructor dependencies reachable from the roots only. Factory
+        registrations contribute no edges, since their dependencies are
+        only known when they run.
+
+        Args:
+            roots: Registered service types to start from
+
+        Returns:
+            The reachable service types, each after its dependencies
+
+        Raises:
+            ValueError: If the reachable services depend on each other
+                in a cycle
+        """
+        registrations = self._registrations
+
+        def edges(service_type: Type) -> Iterator[Type]:
+            for _, dep in registrations[service_type].dependencies:
+                if dep in registrations:
+                    yield dep
+
+        index: Dict[Type, int] = {}
+        lowlink: Dict[Type, int] = {}
+        stack: List[Type] = []
+        on_stack: Set[Type] = set()
+        build_order: List[Type] = []
+
+        for root in roots:
+            if root in index:
+                continue
+
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, edges(root))]
+
+            while work:
+                node, deps = work[-1]
+                for dep in deps:
+                    if dep not in index:
+                        # Descend; this node's iterator resumes afterwards
+                        index[dep] = lowlink[dep] = len(index)
+                        stack.append(dep)
+                        on_stack.add(dep)
+                        work.append((dep, edges(dep)))
+                        break
+                    if dep in on_stack:
+                        lowlink[node] = min(lowlink[node], index[dep])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] != index[node]:
+                        continue
+
+                    # Node is the root of a component; pop its members
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member is node:
+                            break
+
+                    if len(component) > 1 or node in set(edges(node)):
+                        cycle = [dep.__name__ for dep in reversed(component)]
+                        raise ValueError(
+                            "Circular dependency detected: "
+                            + " -> ".join(cycle + cycle[:1])
+                        )
+                    build_order.append(node)
+
+        return build_order
+
+
+# Global container, created on first use rather than at import time
+_container: Optional[DIContainer] = None
 
-# Create a global container instance
-container = DIContainer()
+
+def get_container() -> DIContainer:
+    """Get the global container, creating it on first use.
+
+    Returns:
+        The global DIContainer instance
+    """
+    global _container
+    if _container is None:
+        _container = DIContainer()
+    return _container
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy ``container`` module attribute lazily.
+
+    Args:
+        name: Name of the requested module attribute
+
+    Returns:
+        The global DIContainer instance for ``container``
+
+    Raises:
+        AttributeError: If the module has no such attribute
+    """
+    if name == "container":
+        return get_container()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,22 +4,13 @@ This module provides the configuration for the dependency injection container,
 registering all service implementations and their dependencies.
 """
 
+import importlib
 import logging
-from typing import Any, Dict, Optional
-
-from library.bin.dependency_injection.container import DIContainer
-from library.bin.dependency_injection.plugin_provider import PluginProvider
-from plugins.plugin_manager import PluginManager
-from services.implementations.audio_service_impl import AudioRecordingService
-from services.implementations.configuration_manager_impl import (
-    ConfigurationManager,
-)
-from services.implementations.file_service_impl import FileService
-from services.implementations.platform_service_impl import (
-    PlatformDetectionService,
-)
-from services.implementations.transcription_service_impl import (
-    TranscriptionService,
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from library.bin.dependency_injection.container import (
+    DIContainer,
+    ServiceLifetime,
 )
 from services.interfaces.audio_service_interface import IAudioRecordingService
 from services.interfaces.configuration_manager_interface import (
@@ -36,6 +27,63 @@ from services.interfaces.transcription_service_interface import (
 logger = logging.getLogger(__name__)
 
 
+# Core services created lazily by every entry point, as (interface,
+# dotted path of the implementation); each implementation module is only
+# imported when its service is first resolved
+CORE_SERVICES: Tuple[Tuple[type, str], ...] = (
+    (
+        IPlatformDetectionService,
+        "services.implementations.platform_service_impl."
+        "PlatformDetectionService",
+    ),
+    (
+        IFileService,
+        "services.implementations.file_service_impl.FileService",
+    ),
+    (
+        IAudioRecordingService,
+        "services.implementations.audio_service_impl.AudioRecordingService",
+    ),
+    (
+        ITranscriptionService,
+        "services.implementations.transcription_service_impl."
+        "TranscriptionService",
+    ),
+)
+
+
+def _lazy_implementation(path: str) -> Callable[[DIContainer], Any]:
+    """Create a factory that imports an implementation on first resolve.
+
+    Args:
+        path: Dotted path of the implementation class
+
+    Returns:
+        Factory building the implementation with its dependencies resolved
+    """
+    module_name, _, class_name = path.rpartition(".")
+
+    def factory(container: DIContainer) -> Any:
+        module = importlib.import_module(module_name)
+        return container.build(getattr(module, class_name))
+
+    return factory
+
+
+def register_core_services(container: DIContainer) -> None:
+    """Register the core services as lazily created singletons.
+
+    Args:
+        container: The DI container to register the services with
+    """
+    for service_type, path in CORE_SERVICES:
+        container.register(
+            service_type,
+            factory=_lazy_implementation(path),
+            lifetime=ServiceLifetime.SINGLETON,
+        )
+
+
 def configure_container(
     container: DIContainer, config: Optional[Dict[str, Any]] = None
 ) -> None:
@@ -45,32 +93,27 @@ def configure_container(
         container: The DI container to configure
         config: Optional configuration dictionary
     """
+    from library.bin.dependency_injection.plugin_provider import (
+        PluginProvider,
+    )
+    from services.implementations.configuration_manager_impl import (
+        ConfigurationManager,
+    )
+
     # Configure the container with application settings
     container.configure(config)
 
     # Create configuration manager first
     config_manager = ConfigurationManager(config)
-    container.register(IConfigurationManager, config_manager)
+    container.register(IConfigurationManager, implementation=config_manager)
 
     # Create plugin provider with configuration manager
     plugin_provider = PluginProvider(config_manager)
     plugin_provider.initialize()
 
-    # Create file service
-    file_service = FileService()
-    container.register(IFileService, file_service)
-
-    # Create platform service
-    platform_service = PlatformDetectionService()
-    container.register(IPlatformDetectionService, platform_service)
-
-    # Create audio recording service with its dependencies
-    audio_service = AudioRecordingService(platform_service, file_service)
-    container.register(IAudioRecordingService, audio_service)
-
-    # Create transcription service with its dependencies
-    transcription_service = TranscriptionService(file_service)
-    container.register(ITranscriptionService, transcription_service)
+    # Register the remaining services; each is created, and its
+    # implementation module imported, on first resolve
+    register_core_services(container)
 
     logger.info("Container configured with all service registrations")
 
@@ -81,6 +124,8 @@ def cleanup_container(container: DIContainer) -> None:
     Args:
         container: The DI container to clean up
     """
+    from plugins.plugin_manager import PluginManager
+
     # Get plugin manager and clean up plugins
     plugin_manager = PluginManager.get_instance()
     if plugin_manager:
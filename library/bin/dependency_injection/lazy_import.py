@@ -0,0 +1,71 @@
+"""Deferred imports for service implementations.
+
+This module provides a proxy that stands in for a class or function and
+imports the module defining it only when the proxy is first used, so
+registration sites can name heavy implementations without loading them.
+"""
+
+import importlib
+from typing import Any, Optional
+
+
+class _LazyImport:
+    """Proxy that imports its target on first call or attribute access."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the proxy.
+
+        Args:
+            path: Dotted path of the target, e.g. ``"package.module.Name"``
+        """
+        self._path = path
+        self._target: Optional[Any] = None
+
+    def _resolve(self) -> Any:
+        """Import the target on first use.
+
+        Returns:
+            The imported object
+        """
+        if self._target is None:
+            module_name, _, attr = self._path.rpartition(".")
+            module = importlib.import_module(module_name)
+            self._target = getattr(module, attr)
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Call the target, importing it first if needed."""
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward attribute access to the target."""
+        # Guard the proxy's own fields so a partially built proxy
+        # cannot recurse through _resolve
+        if name in ("_path", "_target"):
+            raise AttributeError(name)
+        return getattr(self._resolve(), name)
+
+    def __repr__(self) -> str:
+        """Describe the proxy without importing the target."""
+        return f"<lazy import of {self._path!r}>"
+
+
+def lazy_import(path: str) -> Any:
+    """Create a proxy for an object that is imported on first use.
+
+    Args:
+        path: Dotted path of the object, e.g.
+            ``"services.implementations.file_service_impl.FileService"``
+
+    Returns:
+        A proxy that imports the object when called or inspected
+
+    Example:
+        ```python
+        FileService = lazy_import(
+            "services.implementations.file_service_impl.FileService"
+        )
+        file_service = FileService()  # module imported here
+        ```
+    """
+    return _LazyImport(path)
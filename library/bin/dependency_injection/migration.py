@@ -5,14 +5,16 @@ enterprise-grade DI container to the simplified AppServices approach.
 """
 
 import logging
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, TypeVar
 
-from library.bin.dependency_injection.app_services import AppServices
 from library.bin.dependency_injection.container import (
     DIContainer,
     ServiceLifetime,
 )
 
+if TYPE_CHECKING:
+    from library.bin.dependency_injection.app_services import AppServices
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -25,7 +27,7 @@ class DIContainerAdapter:
     to work with the simplified AppServices without modification.
     """
 
-    def __init__(self, app_services: AppServices) -> None:
+    def __init__(self, app_services: "AppServices") -> None:
         """Initialize the adapter with AppServices.
 
         Args:
@@ -34,6 +36,10 @@ class DIContainerAdapter:
         self.app_services = app_services
         self._config: Dict[str, Any] = app_services.config
 
+        # Services already resolved through this adapter, cleared when a
+        # service is registered through it
+        self._resolve_cache: Dict[Type[Any], Any] = {}
+
     def configure(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Configure the container with application settings.
 
@@ -56,18 +62,25 @@ class DIContainerAdapter:
 
         Args:
             service_type: Interface or abstract type being registered
-            implementation_type: Concrete type implementing the service (optional)
+            implementation_type: Concrete type implementing the service,
+                constructed on first resolve (optional)
             lifetime: Service lifetime (ignored in simplified DI)
             implementation: Instance implementing the service (optional)
             factory: Factory function to create the service (ignored in simplified DI)
         """
+        # Registering rebuilds the AppServices lookup table, so every
+        # cached resolution may be stale
+        self._resolve_cache.clear()
+
         if implementation:
             self.app_services.register_instance(service_type, implementation)
             logger.info(f"Registered instance for {service_type.__name__}")
         elif implementation_type:
-            # Create an instance of the implementation type
-            instance = implementation_type()
-            self.app_services.register_instance(service_type, instance)
+            # The implementation is constructed on the first resolve, so
+            # services that are never resolved are never built
+            self.app_services.register_factory(
+                service_type, implementation_type
+            )
             logger.info(
                 f"Registered implementation for {service_type.__name__}"
             )
@@ -75,6 +88,10 @@ class DIContainerAdapter:
     def resolve(self, service_type: Type[T]) -> T:
         """Resolve a service instance.
 
+        Repeat resolves are answered from the adapter's own cache.
+        Services replaced on the AppServices directly, rather than through
+        register(), are not seen by types already resolved here.
+
         Args:
             service_type: Type of service to resolve
 
@@ -84,11 +101,16 @@ class DIContainerAdapter:
         Raises:
             KeyError: If service is not registered
         """
-        return self.app_services.get(service_type)
+        cache = self._resolve_cache
+        instance = cache.get(service_type)
+        if instance is None:
+            instance = self.app_services.get(service_type)
+            cache[service_type] = instance
+        return instance
 
 
 def create_adapter(
-    app_services: Optional[AppServices] = None,
+    app_services: Optional["AppServices"] = None,
 ) -> DIContainerAdapter:
     """Create a DIContainerAdapter from AppServices.
 
@@ -98,11 +120,14 @@ def create_adapter(
     Returns:
         A DIContainerAdapter that wraps the AppServices
     """
-    services = app_services or AppServices()
-    return DIContainerAdapter(services)
+    if app_services is None:
+        from library.bin.dependency_injection.app_services import AppServices
+
+        app_services = AppServices()
+    return DIContainerAdapter(app_services)
 
 
-def migrate_container(container: DIContainer) -> AppServices:
+def migrate_container(container: DIContainer) -> "AppServices":
     """Migrate a DIContainer to AppServices.
 
     Args:
@@ -111,6 +136,8 @@ def migrate_container(container: DIContainer) -> AppServices:
     Returns:
         An AppServices instance with services from the container
     """
+    from library.bin.dependency_injection.app_services import AppServices
+
     # Create a new AppServices with the same config
     app_services = AppServices(container._config)
 
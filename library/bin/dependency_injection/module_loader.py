@@ -2,13 +2,24 @@
 
 This module provides functionality to automatically discover and register
 service implementations from modules across the application.
+
+Discovery walks and imports every module in the scanned packages. A
+prebuilt index of the injectable classes avoids that walk; build it with
+
+    python -m library.bin.dependency_injection.module_loader PACKAGE...
+
+using the same packages the bootstrapper scans. The index is ignored once
+any file in those packages is newer than it.
 """
 
 import importlib
-import inspect
+import importlib.util
+import json
 import logging
+import os
 import pkgutil
-from typing import Any, Dict, Iterable, List, Optional, Set, Type
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type
 
 from library.bin.dependency_injection.container import (
     DIContainer,
@@ -17,6 +28,21 @@ from library.bin.dependency_injection.container import (
 
 logger = logging.getLogger(__name__)
 
+# An injectable class found by a scan: (service type, implementation,
+# lifetime)
+Discovered = Tuple[Type, Type, str]
+
+# Scan results per tuple of package paths, as (discovered services, number
+# of modules imported), so each set of packages is only walked once
+_scan_cache: Dict[Tuple[str, ...], Tuple[Tuple[Discovered, ...], int]] = {}
+
+# Prebuilt index of the injectable classes, read instead of walking the
+# packages when it was built for the same package paths and no package
+# file has changed since
+INDEX_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "injectables.json"
+)
+
 
 class Injectable:
     """Decorator to mark a class as injectable with specific configuration."""
@@ -44,10 +70,11 @@ class Injectable:
         Returns:
             The decorated class
         """
-        # Store metadata on the class
-        setattr(cls, "__injectable__", True)
-        setattr(cls, "__inj_interface__", self.interface or cls)
-        setattr(cls, "__inj_lifetime__", self.lifetime)
+        # Store metadata on the class as one (interface, lifetime) tuple
+        cls.__injectable_meta__ = (
+            self.interface or cls,
+            self.lifetime,
+        )
 
         return cls
 
@@ -75,19 +102,65 @@ class ModuleLoader:
         """
         stats = {"interfaces": 0, "implementations": 0, "modules": 0}
 
-        for package_path in package_paths:
-            self._load_from_package(package_path, stats)
+        discovered, stats["modules"] = self._scan(tuple(package_paths))
+        for interface, implementation, lifetime in discovered:
+            self._register_service(interface, implementation, lifetime, stats)
 
         return stats
 
+    def _scan(
+        self, package_paths: Tuple[str, ...]
+    ) -> Tuple[Tuple[Discovered, ...], int]:
+        """Find the injectable services in packages, once per process.
+
+        Args:
+            package_paths: Package paths to scan
+
+        Returns:
+            Tuple of the discovered services and the number of modules
+            imported while scanning
+        """
+        cached = _scan_cache.get(package_paths)
+        if cached is not None:
+            return cached
+
+        result = _read_index(package_paths)
+        if result is None:
+            result = self._walk(package_paths)
+        _scan_cache[package_paths] = result
+        return result
+
+    def _walk(
+        self, package_paths: Tuple[str, ...]
+    ) -> Tuple[Tuple[Discovered, ...], int]:
+        """Find the injectable services by importing every package module.
+
+        Args:
+            package_paths: Package paths to scan
+
+        Returns:
+            Tuple of the discovered services and the number of modules
+            imported while scanning
+        """
+        discovered: List[Discovered] = []
+        stats = {"modules": 0}
+        for package_path in package_paths:
+            self._load_from_package(package_path, discovered, stats)
+
+        return tuple(discovered), stats["modules"]
+
     def _load_from_package(
-        self, package_path: str, stats: Dict[str, int]
+        self,
+        package_path: str,
+        discovered: List[Discovered],
+        stats: Dict[str, int],
     ) -> None:
-        """Load modules from a package and register services.
+        """Load modules from a package and collect their services.
 
         Args:
             package_path: Package path to scan
-            stats: Dict with registration statistics
+            discovered: List the package's injectable services are added to
+            stats: Dict with the count of imported modules
         """
         try:
             # Import the package
@@ -103,22 +176,30 @@ class ModuleLoader:
             self._processed_modules.add(package_name)
 
             # Import the package
-            package = importlib.import_module(package_name)
+            package = _cached_import(package_name)
 
-            # Register services from the package
-            self._register_services_from_module(package, stats)
+            # Collect services from the package
+            self._find_services_in_module(package, discovered)
 
             # Process subpackages
             for _, subpackage_name, is_pkg in pkgutil.iter_modules(
                 package.__path__, package.__name__ + "."
             ):
+                # Skip modules and subpackages another scan already covered
+                if subpackage_name in self._processed_modules:
+                    continue
+
                 if is_pkg:
-                    self._load_from_package(subpackage_name, stats)
+                    self._load_from_package(
+                        subpackage_name, discovered, stats
+                    )
                 else:
-                    # Import the module and register services
+                    self._processed_modules.add(subpackage_name)
+
+                    # Import the module and collect its services
                     try:
-                        module = importlib.import_module(subpackage_name)
-                        self._register_services_from_module(module, stats)
+                        module = _cached_import(subpackage_name)
+                        self._find_services_in_module(module, discovered)
                         stats["modules"] += 1
                     except Exception as e:
                         logger.warning(
@@ -128,51 +209,232 @@ class ModuleLoader:
         except Exception as e:
             logger.warning(f"Failed to process package {package_path}: {e}")
 
-    def _register_services_from_module(
-        self, module: Any, stats: Dict[str, int]
+    def _find_services_in_module(
+        self, module: Any, discovered: List[Discovered]
     ) -> None:
-        """Register services from a module.
+        """Collect the injectable services defined in a module.
 
         Args:
             module: Module to scan for services
-            stats: Dict with registration statistics
+            discovered: List the module's injectable services are added to
         """
-        # Get all classes in the module
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            # Skip classes not defined in this module
-            if obj.__module__ != module.__name__:
+        # Walk the module namespace directly, in definition order, rather
+        # than through inspect.getmembers, which sorts and getattr()s
+        # every name
+        module_name = module.__name__
+        for obj in list(vars(module).values()):
+            # Skip non-classes and classes not defined in this module
+            if not isinstance(obj, type) or obj.__module__ != module_name:
                 continue
 
-            # Check if the class is marked as injectable
-            if hasattr(obj, "__injectable__"):
-                interface = getattr(obj, "__inj_interface__")
-                lifetime = getattr(obj, "__inj_lifetime__")
+            # Check if the class itself is marked as injectable; looking in
+            # its own __dict__ keeps undecorated subclasses from inheriting
+            # the parent's registration
+            meta = obj.__dict__.get("__injectable_meta__")
+            if meta is None:
+                continue
+            interface, lifetime = meta
+            discovered.append((interface, obj, lifetime))
 
-                # Register the implementation with its interface
-                if interface != obj:
-                    try:
-                        self.container.register(
-                            interface, obj, lifetime=lifetime
-                        )
-                        stats["implementations"] += 1
-                        logger.debug(
-                            f"Registered {obj.__name__} as implementation of {interface.__name__}"
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to register {obj.__name__} for {interface.__name__}: {e}"
-                        )
-                else:
-                    try:
-                        self.container.register(obj, obj, lifetime=lifetime)
-                        stats["interfaces"] += 1
-                        logger.debug(
-                            f"Registered self-implementing service: {obj.__name__}"
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to register {obj.__name__}: {e}"
-                        )
+    def _register_service(
+        self,
+        interface: Type,
+        implementation: Type,
+        lifetime: str,
+        stats: Dict[str, int],
+    ) -> None:
+        """Register a discovered service with the container.
+
+        Args:
+            interface: Service type the implementation is registered for
+            implementation: The injectable class
+            lifetime: Service lifetime (singleton, scoped, transient)
+            stats: Dict with registration statistics
+        """
+        # Register the implementation with its interface
+        if interface != implementation:
+            try:
+                self.container.register(
+                    interface, implementation, lifetime=lifetime
+                )
+                stats["implementations"] += 1
+                logger.debug(
+                    "Registered %s as implementation of %s",
+                    implementation.__name__,
+                    interface.__name__,
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to register {implementation.__name__} for {interface.__name__}: {e}"
+                )
+        else:
+            try:
+                self.container.register(
+                    implementation, implementation, lifetime=lifetime
+                )
+                stats["interfaces"] += 1
+                logger.debug(
+                    "Registered self-implementing service: %s",
+                    implementation.__name__,
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to register {implementation.__name__}: {e}"
+                )
+
+
+def _cached_import(name: str) -> Any:
+    """Import a module, returning it straight from sys.modules if loaded.
+
+    Skips the import machinery and its lock for modules that are already
+    imported, which is most of them on repeat scans.
+
+    Args:
+        name: Fully qualified module name
+
+    Returns:
+        The imported module
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+    return module
+
+
+def _import_name(module_name: str, qualname: str) -> Any:
+    """Import a module and look up a possibly nested name in it.
+
+    Args:
+        module_name: Module defining the object
+        qualname: Qualified name of the object within the module
+
+    Returns:
+        The named object
+    """
+    obj = _cached_import(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _source_mtime(package_paths: Iterable[str]) -> float:
+    """Get the latest modification time of the packages' files.
+
+    Directories are included, so added, removed and renamed modules count
+    as changes too. Packages that cannot be found are skipped, as the
+    package walk skips them.
+
+    Args:
+        package_paths: Package paths to check
+
+    Returns:
+        Latest modification time, or 0.0 if nothing was found
+    """
+    latest = 0.0
+    for package_path in package_paths:
+        package_name = package_path.replace("/", ".").lstrip(".")
+        try:
+            spec = importlib.util.find_spec(package_name)
+        except ImportError:
+            continue
+        if spec is None or not spec.submodule_search_locations:
+            continue
+
+        for location in spec.submodule_search_locations:
+            for dir_path, dir_names, file_names in os.walk(location):
+                dir_names[:] = [d for d in dir_names if d != "__pycache__"]
+                latest = max(latest, os.stat(dir_path).st_mtime)
+                for file_name in file_names:
+                    if file_name.endswith(".py"):
+                        file_path = os.path.join(dir_path, file_name)
+                        latest = max(latest, os.stat(file_path).st_mtime)
+    return latest
+
+
+def _read_index(
+    package_paths: Tuple[str, ...], index_path: str = INDEX_PATH
+) -> Optional[Tuple[Tuple[Discovered, ...], int]]:
+    """Read the injectable services from a prebuilt index.
+
+    Only the modules defining injectable classes are imported. An index
+    older than any file in the packages is ignored, so services added or
+    renamed since it was built are still found.
+
+    Args:
+        package_paths: Package paths the index must have been built for
+        index_path: Path of the index file
+
+    Returns:
+        Tuple of the discovered services and the number of modules the
+        index was built from, or None if there is no usable index
+    """
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable service index {index_path}: {e}")
+        return None
+
+    if tuple(index.get("packages", ())) != package_paths:
+        return None
+
+    if _source_mtime(package_paths) > index.get("source_mtime", 0.0):
+        logger.info(f"Service index {index_path} is out of date, ignoring it")
+        return None
+
+    discovered: List[Discovered] = []
+    for entry in index.get("services", ()):
+        try:
+            implementation = _import_name(entry["module"], entry["name"])
+            interface = _import_name(
+                entry["interface_module"], entry["interface"]
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to import indexed service {entry.get('name')}: {e}"
+            )
+            continue
+        discovered.append((interface, implementation, entry["lifetime"]))
+
+    return tuple(discovered), index.get("modules", 0)
+
+
+def write_index(
+    package_paths: Iterable[str], index_path: str = INDEX_PATH
+) -> int:
+    """Scan packages and write the index of their injectable services.
+
+    Args:
+        package_paths: Package paths to scan
+        index_path: Path of the index file to write
+
+    Returns:
+        Number of services written to the index
+    """
+    packages = tuple(package_paths)
+    source_mtime = _source_mtime(packages)
+    discovered, modules = ModuleLoader(DIContainer())._walk(packages)
+    index = {
+        "packages": list(packages),
+        "modules": modules,
+        "source_mtime": source_mtime,
+        "services": [
+            {
+                "module": implementation.__module__,
+                "name": implementation.__qualname__,
+                "interface_module": interface.__module__,
+                "interface": interface.__qualname__,
+                "lifetime": lifetime,
+            }
+            for interface, implementation, lifetime in discovered
+        ],
+    }
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+        f.write("\n")
+    return len(discovered)
 
 
 def auto_register_services(
@@ -189,3 +451,11 @@ def auto_register_services(
     """
     loader = ModuleLoader(container)
     return loader.load_modules(package_paths)
+
+
+if __name__ == "__main__":
+    # Build the service index for the packages given on the command line
+    if len(sys.argv) < 2:
+        sys.exit(f"usage: python -m {__spec__.name} PACKAGE...")
+    count = write_index(sys.argv[1:])
+    print(f"Indexed {count} services in {INDEX_PATH}")
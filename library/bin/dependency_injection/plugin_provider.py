@@ -5,16 +5,16 @@ and maintaining their lifecycle.
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-from plugins.audio_format_plugin import AudioFormatPlugin
-from plugins.output_plugin import OutputPlugin
-from plugins.plugin_manager import PluginManager
-from plugins.preprocessing_plugin import PreprocessingPlugin
-from plugins.transcription_plugin import TranscriptionPlugin
-from services.interfaces.configuration_manager_interface import (
-    IConfigurationManager,
-)
+if TYPE_CHECKING:
+    from plugins.audio_format_plugin import AudioFormatPlugin
+    from plugins.output_plugin import OutputPlugin
+    from plugins.preprocessing_plugin import PreprocessingPlugin
+    from plugins.transcription_plugin import TranscriptionPlugin
+    from services.interfaces.configuration_manager_interface import (
+        IConfigurationManager,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -26,12 +26,25 @@ class PluginProvider:
     proper dependency injection and lifecycle management.
     """
 
-    def __init__(self, config_manager: IConfigurationManager) -> None:
+    # Accessors that forward unchanged to the plugin manager once the
+    # plugin system is initialized
+    _DELEGATED_METHODS = (
+        "get_transcription_plugin",
+        "get_audio_format_plugin",
+        "get_output_plugin",
+        "get_preprocessing_plugin",
+        "get_available_plugins",
+    )
+
+    def __init__(self, config_manager: "IConfigurationManager") -> None:
         """Initialize the plugin provider.
 
         Args:
             config_manager: Configuration manager instance
         """
+        # Imported here so importing the provider does not load plugins
+        from plugins.plugin_manager import PluginManager
+
         self.plugin_manager = PluginManager(config_manager)
         self._initialized = False
 
@@ -44,12 +57,17 @@ class PluginProvider:
         if not self._initialized:
             result = self.plugin_manager.initialize()
             self._initialized = True
+
+            # Bind the plugin manager's methods over the wrappers so later
+            # calls skip the initialization check
+            for name in self._DELEGATED_METHODS:
+                setattr(self, name, getattr(self.plugin_manager, name))
             return result
         return self.plugin_manager.get_available_plugins()
 
     def get_transcription_plugin(
         self, plugin_id: Optional[str] = None
-    ) -> Optional[TranscriptionPlugin]:
+    ) -> Optional["TranscriptionPlugin"]:
         """Get a transcription plugin instance.
 
         Args:
@@ -63,7 +81,7 @@ class PluginProvider:
 
     def get_audio_format_plugin(
         self, plugin_id: Optional[str] = None
-    ) -> Optional[AudioFormatPlugin]:
+    ) -> Optional["AudioFormatPlugin"]:
         """Get an audio format plugin instance.
 
         Args:
@@ -77,7 +95,7 @@ class PluginProvider:
 
     def get_output_plugin(
         self, plugin_id: Optional[str] = None
-    ) -> Optional[OutputPlugin]:
+    ) -> Optional["OutputPlugin"]:
         """Get an output plugin instance.
 
         Args:
@@ -91,7 +109,7 @@ class PluginProvider:
 
     def get_preprocessing_plugin(
         self, plugin_id: Optional[str] = None
-    ) -> Optional[PreprocessingPlugin]:
+    ) -> Optional["PreprocessingPlugin"]:
         """Get a preprocessing plugin instance.
 
         Args:
@@ -123,6 +141,10 @@ class PluginProvider:
             self.plugin_manager.cleanup()
             self._initialized = False
 
+            # Restore the wrappers so the next call re-initializes
+            for name in self._DELEGATED_METHODS:
+                self.__dict__.pop(name, None)
+
     def _ensure_initialized(self) -> None:
         """Ensure the plugin provider is initialized."""
         if not self._initialized:
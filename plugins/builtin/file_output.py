@@ -10,10 +10,17 @@ from typing import Any, Dict, Optional
 
 from config.configuration_manager import ConfigurationManager
 from plugins.output_plugin import OutputPlugin
+from services.directories import ensure_directory
 from services.exceptions import FileOperationError
 
 logger = logging.getLogger(__name__)
 
+# Separates the transcription from its metadata comments
+_METADATA_HEADER = "\n\n# Metadata:\n"
+
+# Timestamp embedded in output filenames
+_TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+
 
 class FileOutputPlugin(OutputPlugin):
     """File output plugin.
@@ -50,9 +57,10 @@ class FileOutputPlugin(OutputPlugin):
 
     def __init__(self) -> None:
         """Initialize the plugin."""
-        self._output_dir = None
+        self._output_dir: Optional[str] = None
         self._file_prefix = "transcript_"
         self._file_extension = ".txt"
+        self._filename_template = self._build_filename_template()
 
     def initialize(
         self, config_manager: Optional[ConfigurationManager] = None
@@ -65,30 +73,41 @@ class FileOutputPlugin(OutputPlugin):
         self.config_manager = config_manager or ConfigurationManager
 
         # Get output directory from configuration
-        self._output_dir = self.config_manager.get(
-            "AUDIO_OUTPUT_DIR", "output"
+        output_dir = str(
+            self.config_manager.get("AUDIO_OUTPUT_DIR", "output")
         )
+        self._output_dir = output_dir
 
-        # Create directory if it doesn't exist
-        if not os.path.exists(self._output_dir):
-            try:
-                os.makedirs(self._output_dir, exist_ok=True)
-                logger.info(f"Created output directory: {self._output_dir}")
-            except Exception as e:
-                logger.error(f"Failed to create output directory: {e}")
-                raise FileOperationError(
-                    f"Failed to create output directory: {e}"
-                )
+        try:
+            if ensure_directory(output_dir):
+                logger.info(f"Created output directory: {output_dir}")
+        except Exception as e:
+            logger.error(f"Failed to create output directory: {e}")
+            raise FileOperationError(f"Failed to create output directory: {e}")
 
         # Get optional file prefix from configuration
         custom_prefix = self.config_manager.get("FILE_OUTPUT_PREFIX")
         if custom_prefix:
             self._file_prefix = custom_prefix
+        self._filename_template = self._build_filename_template()
 
         logger.info(
             f"Initialized file output plugin (dir: {self._output_dir})"
         )
 
+    def _build_filename_template(self) -> str:
+        """Render the output filename template for the current settings.
+
+        The prefix and extension are fixed after initialization, so they
+        are baked into the template once instead of per saved file.
+
+        Returns:
+            str: Template with a single ``{stem}`` placeholder
+        """
+        prefix = self._file_prefix.replace("{", "{{").replace("}", "}}")
+        extension = self._file_extension.replace("{", "{{").replace("}", "}}")
+        return f"{prefix}{{stem}}{extension}"
+
     def cleanup(self) -> None:
         """Clean up resources used by the plugin."""
         logger.info("Cleaned up file output plugin")
@@ -109,40 +128,70 @@ class FileOutputPlugin(OutputPlugin):
             OutputError: If saving fails
         """
         try:
-            # Generate filename
-            timestamp = time.strftime("%Y%m%d-%H%M%S")
-
-            # Use source filename from metadata if available
-            source_file = None
-            if metadata and "source_file" in metadata:
-                source_file = os.path.basename(metadata["source_file"])
-                source_name = os.path.splitext(source_file)[0]
-                filename = f"{self._file_prefix}{source_name}_{timestamp}{self._file_extension}"
-            else:
-                filename = (
-                    f"{self._file_prefix}{timestamp}{self._file_extension}"
-                )
-
-            # Full output path
-            output_path = os.path.join(self._output_dir, filename)
-
-            # Save to file
-            with open(output_path, "w") as f:
-                f.write(transcription)
-
-                # Add metadata as comments if available
-                if metadata:
-                    f.write("\n\n# Metadata:\n")
-                    for key, value in metadata.items():
-                        f.write(f"# {key}: {value}\n")
-
-            logger.info(f"Saved transcription to: {output_path}")
+            output_path = self._write_transcription(transcription, metadata)
+            logger.info("Saved transcription to: %s", output_path)
             return True
 
         except Exception as e:
             logger.error(f"Failed to save transcription: {e}")
             raise FileOperationError(f"Failed to save transcription: {e}")
 
+    def _write_transcription(
+        self,
+        transcription: str,
+        metadata: Optional[Dict[str, Any]],
+        timestamp: Optional[str] = None,
+        sequence: Optional[int] = None,
+    ) -> str:
+        """Write one transcription file with a single write call.
+
+        Args:
+            transcription: The transcribed text
+            metadata: Optional metadata about the transcription
+            timestamp: Filename timestamp, formatted now if not given
+            sequence: Position within a batch, appended to the filename
+                so files sharing a timestamp stay distinct
+
+        Returns:
+            str: Path of the written file
+
+        Raises:
+            FileOperationError: If the plugin has not been initialized
+            OSError: If the file cannot be written
+        """
+        output_dir = self._output_dir
+        if output_dir is None:
+            raise FileOperationError("File output plugin is not initialized")
+
+        # Generate filename
+        if timestamp is None:
+            timestamp = time.strftime(_TIMESTAMP_FORMAT)
+
+        # Use source filename from metadata if available
+        if metadata and "source_file" in metadata:
+            source_file = os.path.basename(metadata["source_file"])
+            source_name = os.path.splitext(source_file)[0]
+            stem = f"{source_name}_{timestamp}"
+        else:
+            stem = timestamp
+        if sequence is not None:
+            stem = f"{stem}_{sequence}"
+        output_path = os.path.join(
+            output_dir, self._filename_template.format(stem=stem)
+        )
+
+        # Build the whole file first so it is written in one call
+        content = transcription
+        if metadata:
+            # Add metadata as comments
+            content += _METADATA_HEADER + "".join(
+                f"# {key}: {value}\n" for key, value in metadata.items()
+            )
+
+        with open(output_path, "wb") as f:
+            f.write(content.encode("utf-8"))
+        return output_path
+
     def supports_batch(self) -> bool:
         """Check if this plugin supports batch processing.
 
@@ -166,16 +215,32 @@ class FileOutputPlugin(OutputPlugin):
             OutputError: If batch processing fails
         """
         results = {}
+        write_transcription = self._write_transcription
 
-        for item_id, item_data in items.items():
-            try:
-                text = item_data.get("text", "")
-                metadata = item_data.get("metadata")
+        # One timestamp names every file in the batch; the item's position
+        # keeps items without a source file, or with the same source name,
+        # from overwriting each other
+        timestamp = time.strftime(_TIMESTAMP_FORMAT)
 
-                success = self.handle_transcription(text, metadata)
-                results[item_id] = success
+        # Each item is written directly, without the per-item error
+        # wrapping and logging of handle_transcription
+        for sequence, (item_id, item_data) in enumerate(items.items(), 1):
+            try:
+                write_transcription(
+                    item_data.get("text", ""),
+                    item_data.get("metadata"),
+                    timestamp,
+                    sequence,
+                )
+                results[item_id] = True
             except Exception as e:
                 logger.error(f"Failed to process item {item_id}: {e}")
                 results[item_id] = False
 
+        logger.info(
+            "Saved %d of %d transcriptions to: %s",
+            sum(results.values()),
+            len(results),
+            self._output_dir,
+        )
         return results
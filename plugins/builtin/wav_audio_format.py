@@ -5,17 +5,26 @@ This module provides an audio format plugin for WAV files.
 
 import logging
 import os
+import struct
 import wave
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import soundfile as sf
 
 from plugins.audio_format_plugin import AudioFormatPlugin
+from services.directories import ensure_directory
 from services.exceptions import FileOperationError
 
 logger = logging.getLogger(__name__)
 
+# WAVE format tag for integer PCM
+WAVE_FORMAT_PCM = 0x0001
+
+# Canonical 44-byte PCM header: RIFF, size, WAVE, "fmt ", fmt size, format
+# tag, channels, rate, byte rate, block align, bits, "data", data size
+_CANONICAL_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
 
 class WavAudioFormatPlugin(AudioFormatPlugin):
     """WAV audio format plugin.
@@ -79,26 +88,117 @@ class WavAudioFormatPlugin(AudioFormatPlugin):
         Returns:
             bool: True if the file is a valid WAV file, False otherwise
         """
-        if not os.path.exists(file_path):
+        # Read the canonical header in one call; the file's absence is
+        # detected by the open itself
+        try:
+            with open(file_path, "rb") as f:
+                header = f.read(_CANONICAL_HEADER.size)
+        except FileNotFoundError:
             logger.error(f"Audio file not found: {file_path}")
             return False
+        except (IOError, OSError) as e:
+            logger.error(f"File I/O error during audio validation: {e}")
+            return False
 
-        try:
-            with wave.open(file_path, "rb") as wf:
-                # Check basic WAV file properties
-                if wf.getnchannels() < 1:
-                    logger.error(f"Invalid audio channels in {file_path}")
-                    return False
+        fields = self._parse_canonical_header(header)
+        if fields is None:
+            # Extra chunks, extensible or non-PCM headers are left to the
+            # wave module, which decides whether they are acceptable
+            return self._validate_with_wave(file_path)
 
-                if wf.getsampwidth() < 1:
-                    logger.error(f"Invalid sample width in {file_path}")
-                    return False
+        channels, sample_width, frame_rate = fields
+        return self._check_wav_properties(
+            file_path, channels, sample_width, frame_rate
+        )
 
-                if wf.getframerate() < 1:
-                    logger.error(f"Invalid frame rate in {file_path}")
-                    return False
+    @staticmethod
+    def _parse_canonical_header(
+        header: bytes,
+    ) -> Optional[Tuple[int, int, int]]:
+        """Extract the WAV properties from a canonical PCM header.
 
-                return True
+        Args:
+            header: The first bytes of the file
+
+        Returns:
+            Optional[Tuple[int, int, int]]: (channels, sample width in
+                bytes, frame rate), or None if the header is not a plain
+                44-byte PCM header
+        """
+        if len(header) < _CANONICAL_HEADER.size:
+            return None
+        (
+            riff,
+            _,
+            wave_id,
+            fmt_id,
+            fmt_size,
+            tag,
+            channels,
+            frame_rate,
+            _,
+            _,
+            bits,
+            data_id,
+            _,
+        ) = _CANONICAL_HEADER.unpack(header)
+        if (
+            riff != b"RIFF"
+            or wave_id != b"WAVE"
+            or fmt_id != b"fmt "
+            or fmt_size != 16
+            or tag != WAVE_FORMAT_PCM
+            or data_id != b"data"
+        ):
+            return None
+        return channels, (bits + 7) // 8, frame_rate
+
+    @staticmethod
+    def _check_wav_properties(
+        file_path: str, channels: int, sample_width: int, frame_rate: int
+    ) -> bool:
+        """Check the basic WAV file properties.
+
+        Args:
+            file_path: Path to the audio file, for error messages
+            channels: Number of channels
+            sample_width: Sample width in bytes
+            frame_rate: Frames per second
+
+        Returns:
+            bool: True if all properties are valid, False otherwise
+        """
+        if channels < 1:
+            logger.error(f"Invalid audio channels in {file_path}")
+            return False
+
+        if sample_width < 1:
+            logger.error(f"Invalid sample width in {file_path}")
+            return False
+
+        if frame_rate < 1:
+            logger.error(f"Invalid frame rate in {file_path}")
+            return False
+
+        return True
+
+    def _validate_with_wave(self, file_path: str) -> bool:
+        """Validate a WAV file with a non-canonical header.
+
+        Args:
+            file_path: Path to the audio file to validate
+
+        Returns:
+            bool: True if the file is a valid WAV file, False otherwise
+        """
+        try:
+            with wave.open(file_path, "rb") as wf:
+                return self._check_wav_properties(
+                    file_path,
+                    wf.getnchannels(),
+                    wf.getsampwidth(),
+                    wf.getframerate(),
+                )
         except wave.Error as e:
             logger.error(f"WAV file format error: {e}")
             return False
@@ -122,9 +222,11 @@ class WavAudioFormatPlugin(AudioFormatPlugin):
             AudioFormatError: If reading fails
         """
         try:
-            data, sample_rate = sf.read(file_path)
+            # float32 halves the buffer against soundfile's float64
+            # default and is what the transcription stage consumes
+            data, sample_rate = sf.read(file_path, dtype="float32")
             logger.info(
-                f"Read WAV file: {file_path} (sample rate: {sample_rate}Hz)"
+                "Read WAV file: %s (sample rate: %dHz)", file_path, sample_rate
             )
             return data, sample_rate
         except Exception as e:
@@ -156,8 +258,8 @@ class WavAudioFormatPlugin(AudioFormatPlugin):
         try:
             # Ensure the parent directory exists
             parent_dir = os.path.dirname(file_path)
-            if parent_dir and not os.path.exists(parent_dir):
-                os.makedirs(parent_dir, exist_ok=True)
+            if parent_dir:
+                ensure_directory(parent_dir)
 
             # Add .wav extension if not present
             if not file_path.lower().endswith(".wav"):
@@ -165,7 +267,7 @@ class WavAudioFormatPlugin(AudioFormatPlugin):
 
             # Save using soundfile
             sf.write(file_path, audio_data, sample_rate)
-            logger.info(f"Saved WAV file: {file_path}")
+            logger.info("Saved WAV file: %s", file_path)
             return file_path
 
         except Exception as e:
@@ -7,8 +7,6 @@ import logging
 import os
 from typing import Dict, Optional
 
-from faster_whisper import WhisperModel
-
 from config.configuration_manager import ConfigurationManager
 from plugins.transcription_plugin import TranscriptionPlugin
 from services.exceptions import TranscriptionError
@@ -75,6 +73,9 @@ class WhisperTranscriptionPlugin(TranscriptionPlugin):
 
         # Initialize the model
         try:
+            # Imported here so loading the plugin module stays cheap
+            from faster_whisper import WhisperModel
+
             self._model = WhisperModel(
                 model_size,
                 device=device,
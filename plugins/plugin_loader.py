@@ -21,6 +21,9 @@ from plugins.transcription_plugin import TranscriptionPlugin
 
 logger = logging.getLogger(__name__)
 
+# Built-in plugin directory, resolved once at import
+_BUILTIN_DIR = os.path.join(os.path.dirname(__file__), "builtin")
+
 
 class PluginLoader:
     """Loader for discovering and registering plugins."""
@@ -49,7 +52,7 @@ class PluginLoader:
         if plugin_dirs is None:
             # Default locations: built-in plugins and user plugins directory
             plugin_dirs = [
-                os.path.join(os.path.dirname(__file__), "builtin"),
+                _BUILTIN_DIR,
                 os.path.expanduser("~/.audio/plugins"),
             ]
 
@@ -19,6 +19,9 @@ from services.interfaces.configuration_manager_interface import (
 
 logger = logging.getLogger(__name__)
 
+# Built-in plugin directory, resolved once at import
+_BUILTIN_DIR = os.path.join(os.path.dirname(__file__), "builtin")
+
 
 class PluginManager:
     """Manager for audio application plugins.
@@ -85,12 +88,7 @@ class PluginManager:
         plugin_dirs = []
 
         # Add built-in plugins directory
-        import plugins
-
-        builtin_dir = os.path.join(
-            os.path.dirname(plugins.__file__), "builtin"
-        )
-        plugin_dirs.append(builtin_dir)
+        plugin_dirs.append(_BUILTIN_DIR)
 
         # Add user plugins directory
         user_dir = os.path.expanduser("~/.audio/plugins")
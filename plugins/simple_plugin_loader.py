@@ -15,6 +15,10 @@ from services.implementations.configuration_manager_impl import (
 
 logger = logging.getLogger(__name__)
 
+# Plugin directories next to this module, resolved once at import
+_BUILTIN_DIR = os.path.join(os.path.dirname(__file__), "builtin")
+_CUSTOM_DIR = os.path.join(os.path.dirname(__file__), "custom")
+
 
 class SimplePluginLoader:
     """Simple plugin loading without complex registries."""
@@ -120,9 +124,8 @@ class SimplePluginLoader:
             plugins[default_id] = f"{default_id} (default)"
 
         # Look for builtin plugins
-        builtin_dir = os.path.join(os.path.dirname(__file__), "builtin")
-        if os.path.isdir(builtin_dir):
-            for filename in os.listdir(builtin_dir):
+        if os.path.isdir(_BUILTIN_DIR):
+            for filename in os.listdir(_BUILTIN_DIR):
                 if filename.endswith(".py") and not filename.startswith("__"):
                     plugin_id = filename[:-3]  # Remove .py extension
                     # Only include plugins that match the requested type
@@ -131,9 +134,8 @@ class SimplePluginLoader:
                             plugins[plugin_id] = plugin_id
 
         # Look for custom plugins
-        custom_dir = os.path.join(os.path.dirname(__file__), "custom")
-        if os.path.isdir(custom_dir):
-            for filename in os.listdir(custom_dir):
+        if os.path.isdir(_CUSTOM_DIR):
+            for filename in os.listdir(_CUSTOM_DIR):
                 if filename.endswith(".py") and not filename.startswith("__"):
                     plugin_id = filename[:-3]  # Remove .py extension
                     # Only include plugins that match the requested type
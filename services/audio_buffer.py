@@ -0,0 +1,21 @@
+"""Typed container for decoded audio."""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class AudioBuffer(NamedTuple):
+    """Decoded audio samples with their sample rate.
+
+    Being a tuple, an AudioBuffer can be passed anywhere an
+    ``(audio_data, sample_rate)`` pair is expected and unpacked the same
+    way, while callers that know the type can use named fields.
+
+    Attributes:
+        samples: Audio samples as a numpy array
+        sample_rate: Sample rate in Hz
+    """
+
+    samples: np.ndarray
+    sample_rate: int
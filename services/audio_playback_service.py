@@ -1,7 +1,7 @@
 """Audio playback service for audio synthesis."""
 
 import logging
-from typing import Tuple, Union
+from typing import Iterable, Tuple, Union
 
 import numpy as np
 import sounddevice as sd
@@ -39,3 +39,43 @@ class AudioPlaybackService:
         except Exception as e:
             logger.error(f"Error playing audio: {e}")
             print(f"Error playing audio: {e}")
+
+    @staticmethod
+    def play_stream(chunks: Iterable[Tuple[np.ndarray, int]]) -> None:
+        """Play audio chunks through the default output as they arrive.
+
+        The output stream is opened with the sample rate and channel count
+        of the first chunk, and each chunk is written as soon as it is
+        available, so playback starts before the full audio exists.
+
+        Args:
+            chunks: Iterable of (audio_data, sample_rate) tuples
+        """
+        stream = None
+        try:
+            for data, sample_rate in chunks:
+                frames = np.asarray(data, dtype=np.float32)
+                if frames.ndim == 1:
+                    frames = frames.reshape(-1, 1)
+
+                if stream is None:
+                    stream = sd.OutputStream(
+                        samplerate=sample_rate,
+                        channels=frames.shape[1],
+                        dtype="float32",
+                    )
+                    stream.start()
+                    logger.info(f"Streaming audio playback at {sample_rate}Hz")
+
+                # Blocks until the device has room for the chunk
+                stream.write(np.ascontiguousarray(frames))
+
+            logger.info("Audio stream playback completed")
+
+        except Exception as e:
+            logger.error(f"Error playing audio stream: {e}")
+            print(f"Error playing audio: {e}")
+        finally:
+            if stream is not None:
+                stream.stop()
+                stream.close()
@@ -4,11 +4,19 @@ import logging
 import os
 import time
 import wave
-from typing import List, Tuple
+from typing import Tuple
 
 import pyaudio
-from colorama import Fore, Style
 
+from services.console_colors import (
+    CYAN,
+    GREEN,
+    MAGENTA,
+    RECORDING_PROGRESS_LINE,
+    RED,
+    RESET,
+    YELLOW,
+)
 from services.exceptions import AudioRecordingError, FileOperationError
 from services.file_service import FileService
 from services.platform_service import PlatformDetectionService
@@ -164,7 +172,10 @@ class AudioRecordingService:
             )
 
             # Record audio
-            frames = self._capture_audio_frames(stream, chunk, rate, duration)
+            frame_size = audio.get_sample_size(format_type) * channels
+            frames = self._capture_audio_frames(
+                stream, chunk, rate, duration, frame_size
+            )
 
             # Save to WAV file
             self._save_frames_to_wav(
@@ -203,70 +214,81 @@ class AudioRecordingService:
 
     def _display_recording_countdown(self) -> None:
         """Display countdown before recording starts."""
-        print(f"{Fore.CYAN}Recording countdown.{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}Recording will start in:{Style.RESET_ALL}")
+        print(f"{CYAN}Recording countdown.{RESET}")
+        print(f"{YELLOW}Recording will start in:{RESET}")
         print("\n")
         for i in range(3, -1, -1):
             if i == 0:
-                print(f"{Fore.MAGENTA}  {i}...{Style.RESET_ALL}")
+                print(f"{MAGENTA}  {i}...{RESET}")
             elif i == 1:
-                print(f"{Fore.RED}  {i}...{Style.RESET_ALL}")
+                print(f"{RED}  {i}...{RESET}")
             elif i == 2:
-                print(f"{Fore.YELLOW}  {i}...{Style.RESET_ALL}")
+                print(f"{YELLOW}  {i}...{RESET}")
             else:
-                print(f"{Fore.GREEN}  {i}...{Style.RESET_ALL}")
+                print(f"{GREEN}  {i}...{RESET}")
             time.sleep(1)
         print(
-            f"{Fore.CYAN}Recording now! {Fore.GREEN}Speak clearly...{Style.RESET_ALL}"
+            f"{CYAN}Recording now! {GREEN}Speak clearly...{RESET}"
         )
         print("\n")
 
     def _capture_audio_frames(
-        self, stream: pyaudio.Stream, chunk: int, rate: int, duration: int
-    ) -> List[bytes]:
-        """Capture audio frames from the stream.
+        self,
+        stream: pyaudio.Stream,
+        chunk: int,
+        rate: int,
+        duration: int,
+        frame_size: int,
+    ) -> memoryview:
+        """Capture audio frames from the stream into one buffer.
+
+        The buffer is allocated once at the full recording size, so no
+        per-chunk objects are kept and no final join is needed.
 
         Args:
             stream: PyAudio stream
             chunk: Buffer size
             rate: Sample rate
             duration: Recording duration in seconds
+            frame_size: Bytes per frame (sample width times channels)
 
         Returns:
-            List[bytes]: List of captured audio frames
+            memoryview: The captured audio data
         """
-        frames = []
-        total_iterations = int(rate / chunk * duration)
+        total_chunks = int(rate / chunk * duration)
+        chunk_bytes = chunk * frame_size
+        # Approximately one chunk per second, for progress output
+        chunks_per_second = max(1, int(rate / chunk))
+
+        # Zero-filled, so a failed read leaves silence in its slot
+        buffer = bytearray(total_chunks * chunk_bytes)
+        offset = 0
+        stream_read = stream.read
 
-        for i in range(0, total_iterations):
+        for i in range(0, total_chunks):
             try:
-                data = stream.read(chunk, exception_on_overflow=False)
-                frames.append(data)
+                data = stream_read(chunk, exception_on_overflow=False)
+                buffer[offset : offset + len(data)] = data
+                offset += len(data)
                 # Show progress during recording
-                if i % int(rate / chunk) == 0:  # Approximately every second
-                    seconds_left = duration - (i // int(rate / chunk))
-                    print(
-                        f"{Fore.BLUE}Recording: {Fore.GREEN}{seconds_left}"
-                        f"{Fore.BLUE} seconds left...{Style.RESET_ALL}"
-                    )
+                if i % chunks_per_second == 0:  # Approximately every second
+                    seconds_left = duration - (i // chunks_per_second)
+                    print(RECORDING_PROGRESS_LINE.format(seconds_left))
             except Exception as e:
                 logger.error(f"Error reading from stream: {e}")
-                # Create some silent data to maintain timing
-                frames.append(b"\x00" * chunk)
+                # Keep a chunk of silence to maintain timing
+                offset += chunk_bytes
 
         # Ensure we display zero seconds at the end
-        print(
-            f"{Fore.BLUE}Recording: {Fore.GREEN}0"
-            f"{Fore.BLUE} seconds left...{Style.RESET_ALL}"
-        )
+        print(RECORDING_PROGRESS_LINE.format(0))
 
-        return frames
+        return memoryview(buffer)[:offset]
 
     def _save_frames_to_wav(
         self,
         output_path: str,
         audio: pyaudio.PyAudio,
-        frames: List[bytes],
+        frames: memoryview,
         channels: int,
         rate: int,
         format_type: int,
@@ -276,7 +298,7 @@ class AudioRecordingService:
         Args:
             output_path: Path where the WAV file will be saved
             audio: PyAudio instance
-            frames: List of audio frames
+            frames: Captured audio data
             channels: Number of audio channels
             rate: Sample rate
             format_type: Audio format
@@ -289,7 +311,7 @@ class AudioRecordingService:
                 wf.setnchannels(channels)
                 wf.setsampwidth(audio.get_sample_size(format_type))
                 wf.setframerate(rate)
-                wf.writeframes(b"".join(frames))
+                wf.writeframes(frames)
         except (IOError, OSError) as e:
             logger.error(f"Error saving WAV file: {e}")
             raise AudioRecordingError(f"Failed to save audio file: {e}")
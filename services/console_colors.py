@@ -0,0 +1,25 @@
+"""Console color codes shared by the command-line services.
+
+Color codes are resolved once at import; NO_COLOR or a non-terminal
+stdout disables them entirely, leaving every code an empty string.
+"""
+
+import os
+import sys
+
+from colorama import Fore, Style
+
+NO_COLOR = bool(os.environ.get("NO_COLOR")) or not sys.stdout.isatty()
+GREEN = "" if NO_COLOR else Fore.GREEN
+CYAN = "" if NO_COLOR else Fore.CYAN
+YELLOW = "" if NO_COLOR else Fore.YELLOW
+MAGENTA = "" if NO_COLOR else Fore.MAGENTA
+RED = "" if NO_COLOR else Fore.RED
+BLUE = "" if NO_COLOR else Fore.BLUE
+RESET = "" if NO_COLOR else Style.RESET_ALL
+
+# Recording progress line, with its color codes concatenated once rather
+# than on every progress update
+RECORDING_PROGRESS_LINE = (
+    f"{BLUE}Recording: {GREEN}{{}}{BLUE} seconds left...{RESET}"
+)
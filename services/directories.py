@@ -0,0 +1,29 @@
+"""Directory creation helper shared by the services and plugins."""
+
+import os
+
+
+def ensure_directory(dir_path: str) -> bool:
+    """Create a directory and its parents unless it already exists.
+
+    mkdir reports an existing path itself, so no separate existence check
+    is made up front; the path is only inspected when it already exists,
+    to tell a directory apart from a file in the way.
+
+    Args:
+        dir_path: Path of the directory
+
+    Returns:
+        bool: True if the directory was created, False if it existed
+
+    Raises:
+        OSError: If the directory cannot be created, including
+            FileExistsError when the path exists but is not a directory
+    """
+    try:
+        os.makedirs(dir_path)
+    except FileExistsError:
+        if not os.path.isdir(dir_path):
+            raise
+        return False
+    return True
@@ -11,10 +11,14 @@ import numpy as np
 import soundfile as sf
 
 from config.configuration_manager import ConfigurationManager
+from services.directories import ensure_directory
 from services.exceptions import FileOperationError, SecurityError
 
 logger = logging.getLogger(__name__)
 
+# Extensions accepted for text files without a warning
+_TEXT_EXTENSIONS = (".txt", ".md", ".json", ".csv", ".log")
+
 
 class FileService:
     """Service for file operations."""
@@ -224,16 +228,12 @@ class FileService:
         if not dir_path:
             raise FileOperationError("Directory path cannot be empty")
 
-        # Try to create directory if it doesn't exist
-        if not os.path.isdir(dir_path):
-            try:
-                os.makedirs(dir_path, exist_ok=True)
+        try:
+            if ensure_directory(dir_path):
                 logger.info(f"Created directory: {dir_path}")
-            except (IOError, OSError) as e:
-                logger.error(f"Failed to create directory: {e}")
-                raise FileOperationError(
-                    f"Failed to create directory: {dir_path}"
-                )
+        except OSError as e:
+            logger.error(f"Failed to create directory: {e}")
+            raise FileOperationError(f"Failed to create directory: {dir_path}")
 
         return dir_path
 
@@ -284,19 +284,16 @@ class FileService:
                 self.prepare_directory(parent_dir)
 
             # Validate file extension
-            valid_extensions = [".txt", ".md", ".json", ".csv", ".log"]
-            if not any(
-                sanitized_path.lower().endswith(ext)
-                for ext in valid_extensions
-            ):
+            if not sanitized_path.lower().endswith(_TEXT_EXTENSIONS):
                 logger.warning(
                     f"Suspicious file extension for text file: {sanitized_path}"
                 )
                 # We continue but log the warning
 
-            # Save text to file
-            with open(sanitized_path, "w") as f:
-                f.write(text)
+            # Encode once as utf-8 and write the bytes in a single call,
+            # independent of the locale encoding
+            with open(sanitized_path, "wb") as f:
+                f.write(text.encode("utf-8"))
 
             logger.info(f"Text saved to: {sanitized_path}")
             return sanitized_path
@@ -402,29 +399,28 @@ class FileService:
             )
 
         # Check file extension to ensure it's a text file
-        valid_extensions = [".txt", ".md", ".json", ".csv", ".log"]
-        if not any(
-            sanitized_path.lower().endswith(ext) for ext in valid_extensions
-        ):
+        if not sanitized_path.lower().endswith(_TEXT_EXTENSIONS):
             logger.warning(
                 f"Suspicious file extension for text file: {sanitized_path}"
             )
             # We continue but log the warning
 
         try:
-            with open(sanitized_path, "r") as f:
-                content = f.read().strip()
+            # Read the bytes and decode them once instead of
+            # streaming them through a text wrapper
+            with open(sanitized_path, "rb") as f:
+                content = f.read().decode("utf-8").strip()
             logger.info(f"Text read from: {sanitized_path}")
             return content
         except Exception as e:
             logger.error(f"Failed to read text file: {e}")
             raise FileOperationError(f"Failed to read text file: {e}")
 
-    def load_latest_transcription(self) -> Optional[str]:
-        """Load the latest transcription file.
+    def get_latest_transcription_path(self) -> Optional[str]:
+        """Find the most recent transcription file without reading it.
 
         Returns:
-            Optional[str]: The content of the latest transcription file or None if not found
+            Optional[str]: Path of the latest transcription file or None if not found
         """
         # Get output directory from configuration
         output_dir = self.sanitize_path(
@@ -439,11 +435,23 @@ class FileService:
             logger.info("No transcription files found")
             return None
         # Get the most recent file
-        latest_file = max(transcript_files, key=os.path.getctime)
+        return max(transcript_files, key=os.path.getctime)
+
+    def load_latest_transcription(self) -> Optional[str]:
+        """Load the latest transcription file.
+
+        Returns:
+            Optional[str]: The content of the latest transcription file or None if not found
+        """
+        latest_file = self.get_latest_transcription_path()
+        if not latest_file:
+            return None
         try:
             # Read and return the content
-            with open(latest_file, "r") as f:
-                content = f.read().strip()
+            # Read the bytes and decode them once instead of
+            # streaming them through a text wrapper
+            with open(latest_file, "rb") as f:
+                content = f.read().decode("utf-8").strip()
             logger.info(f"Loaded latest transcription from: {latest_file}")
             return content
         except Exception as e:
@@ -5,9 +5,8 @@ import os
 import time
 from typing import Tuple
 
-from colorama import Fore, Style
-
 from library.bin.dependency_injection.module_loader import Injectable
+from services.console_colors import CYAN, GREEN, RED, RESET, YELLOW
 from services.exceptions import AudioServiceError
 from services.interfaces.application_service_interface import (
     IApplicationService,
@@ -52,7 +51,7 @@ class ApplicationService(IApplicationService):
         """
         try:
             # Record audio
-            print(f"{Fore.GREEN}Recording audio...{Style.RESET_ALL}")
+            print(f"{GREEN}Recording audio...{RESET}")
             audio_path = self.recording_service.record_audio(duration=duration)
             logger.info(f"Audio recording complete. Saved to {audio_path}")
 
@@ -60,9 +59,7 @@ class ApplicationService(IApplicationService):
             transcription = self.transcription_service.transcribe_audio(
                 audio_path
             )
-            print(
-                f"\n{Fore.GREEN}Transcription:{Style.RESET_ALL}\n{transcription}\n"
-            )
+            print(f"\n{GREEN}Transcription:{RESET}\n{transcription}\n")
 
             # Get the path to the saved transcription
             transcript_path = os.path.join(
@@ -71,17 +68,17 @@ class ApplicationService(IApplicationService):
             )
 
             print(
-                f"{Fore.CYAN}Transcription saved to: "
-                f"{Fore.YELLOW}{transcript_path}{Style.RESET_ALL}"
+                f"{CYAN}Transcription saved to: "
+                f"{YELLOW}{transcript_path}{RESET}"
             )
 
             return audio_path, transcript_path
 
         except AudioServiceError as e:
             logger.error(f"Audio service error: {e}")
-            print(f"\n{Fore.RED}Error: {e}{Style.RESET_ALL}")
+            print(f"\n{RED}Error: {e}{RESET}")
             raise
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
-            print(f"\n{Fore.RED}Unexpected error: {e}{Style.RESET_ALL}")
+            print(f"\n{RED}Unexpected error: {e}{RESET}")
             raise AudioServiceError(f"Application error: {str(e)}")
@@ -4,11 +4,20 @@ import logging
 import os
 import time
 import wave
-from typing import List
+from typing import List, Optional
 
+import numpy as np
 import pyaudio
-from colorama import Fore, Style
 
+from services.console_colors import (
+    CYAN,
+    GREEN,
+    MAGENTA,
+    RECORDING_PROGRESS_LINE,
+    RED,
+    RESET,
+    YELLOW,
+)
 from services.exceptions import AudioRecordingError, FileOperationError
 from services.interfaces.audio_service_interface import IAudioRecordingService
 from services.interfaces.file_service_interface import IFileService
@@ -36,6 +45,10 @@ class AudioRecordingService(IAudioRecordingService):
         self.platform_service = platform_service
         self.file_service = file_service
 
+        # PortAudio handle shared across recordings; initializing it probes
+        # every device, so it is created once rather than per recording
+        self._audio: Optional[pyaudio.PyAudio] = None
+
     def record_audio(
         self,
         duration: int = 5,
@@ -153,15 +166,11 @@ class AudioRecordingService(IAudioRecordingService):
         Raises:
             AudioRecordingError: If recording or saving audio fails
         """
-        audio = None
         stream = None
 
         try:
-            # Initialize PyAudio
-            audio = pyaudio.PyAudio()
-
-            # Log available audio devices for debugging
-            self._log_available_audio_devices(audio)
+            # Reuse the shared PyAudio instance
+            audio = self._get_audio()
 
             # Countdown before recording
             self._display_recording_countdown()
@@ -175,42 +184,74 @@ class AudioRecordingService(IAudioRecordingService):
                 frames_per_buffer=chunk,
             )
 
-            # Record audio
-            frames = self._capture_audio_frames(stream, chunk, rate, duration)
+            # Record audio straight into a WAV file, so the recording is
+            # never buffered in memory; only sample frames are kept. The
+            # file replaces output_path once capture completes, so a
+            # failed recording never leaves a truncated WAV behind
+            partial_path = f"{output_path}.part"
+            frame_size = audio.get_sample_size(format_type) * channels
+            try:
+                with self._open_wav_file(
+                    partial_path, audio, channels, rate, format_type
+                ) as wf:
+                    frames = self._capture_audio_frames(
+                        stream, wf, chunk, rate, duration, frame_size
+                    )
+                os.replace(partial_path, output_path)
+            except BaseException:
+                try:
+                    os.remove(partial_path)
+                except OSError:
+                    pass
+                raise
 
-            # Validate audio quality before saving
-            if self._validate_audio_quality(frames):
-                # Save to WAV file
-                self._save_frames_to_wav(
-                    output_path, audio, frames, channels, rate, format_type
-                )
-            else:
+            # Validate audio quality; the file is kept either way
+            if not self._validate_audio_quality(frames):
                 logger.warning(
                     "Audio quality validation failed, but continuing with processing"
                 )
                 print(
-                    f"{Fore.YELLOW}Warning: Audio quality may be poor. Processing anyway...{Style.RESET_ALL}"
-                )
-                # Save to WAV file regardless
-                self._save_frames_to_wav(
-                    output_path, audio, frames, channels, rate, format_type
+                    f"{YELLOW}Warning: Audio quality may be poor. Processing anyway...{RESET}"
                 )
 
             logger.info(f"Audio saved to {output_path}")
 
         except (IOError, OSError) as e:
             logger.error(f"Error recording audio: {e}")
+            # Re-probe devices on the next recording in case they changed
+            self.cleanup()
             raise AudioRecordingError(f"Failed to record audio: {e}")
         except Exception as e:
             logger.error(f"Unexpected error during recording: {e}")
+            self.cleanup()
             raise AudioRecordingError(f"Failed to record audio: {e}")
         finally:
-            # Clean up resources
+            # Clean up the stream; the PyAudio instance is kept for reuse
             if stream:
                 stream.stop_stream()
                 stream.close()
-            if audio:
-                audio.terminate()
+
+    def _get_audio(self) -> pyaudio.PyAudio:
+        """Get the shared PyAudio instance, creating it on first use.
+
+        Available devices are enumerated and logged once, when the
+        instance is created.
+
+        Returns:
+            pyaudio.PyAudio: The shared PyAudio instance
+        """
+        if self._audio is None:
+            self._audio = pyaudio.PyAudio()
+
+            # Log available audio devices for debugging
+            self._log_available_audio_devices(self._audio)
+        return self._audio
+
+    def cleanup(self) -> None:
+        """Release the shared PyAudio instance."""
+        if self._audio is not None:
+            self._audio.terminate()
+            self._audio = None
 
     def _log_available_audio_devices(self, audio: pyaudio.PyAudio) -> None:
         """Log information about available audio devices.
@@ -228,62 +269,82 @@ class AudioRecordingService(IAudioRecordingService):
 
     def _display_recording_countdown(self) -> None:
         """Display countdown before recording starts."""
-        print(f"{Fore.CYAN}Recording countdown.{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}Recording will start in:{Style.RESET_ALL}")
+        print(f"{CYAN}Recording countdown.{RESET}")
+        print(f"{YELLOW}Recording will start in:{RESET}")
         print("\n")
         for i in range(3, -1, -1):
             if i == 0:
-                print(f"{Fore.MAGENTA}  {i}...{Style.RESET_ALL}")
+                print(f"{MAGENTA}  {i}...{RESET}")
             elif i == 1:
-                print(f"{Fore.RED}  {i}...{Style.RESET_ALL}")
+                print(f"{RED}  {i}...{RESET}")
             elif i == 2:
-                print(f"{Fore.YELLOW}  {i}...{Style.RESET_ALL}")
+                print(f"{YELLOW}  {i}...{RESET}")
             else:
-                print(f"{Fore.GREEN}  {i}...{Style.RESET_ALL}")
+                print(f"{GREEN}  {i}...{RESET}")
             time.sleep(1)
         print(
-            f"{Fore.CYAN}Recording now! {Fore.GREEN}Speak clearly...{Style.RESET_ALL}"
+            f"{CYAN}Recording now! {GREEN}Speak clearly...{RESET}"
         )
         print("\n")
 
     def _capture_audio_frames(
-        self, stream: pyaudio.Stream, chunk: int, rate: int, duration: int
+        self,
+        stream: pyaudio.Stream,
+        wf: wave.Wave_write,
+        chunk: int,
+        rate: int,
+        duration: int,
+        frame_size: int,
     ) -> List[bytes]:
-        """Capture audio frames from the stream.
+        """Capture audio frames from the stream into a WAV file.
+
+        Each frame is written to the file as soon as it is read. At most
+        about ten evenly spaced frames are kept, for quality validation.
+        If capture fails part way, the file holds only the frames read so
+        far, so callers should write to a temporary path.
 
         Args:
             stream: PyAudio stream
+            wf: Open WAV file the frames are written to
             chunk: Buffer size
             rate: Sample rate
             duration: Recording duration in seconds
+            frame_size: Bytes per frame (sample width times channels)
 
         Returns:
-            List[bytes]: List of captured audio frames
+            List[bytes]: Sample of the captured audio frames
         """
-        frames = []
-        total_iterations = int(rate / chunk * duration)
-
-        for i in range(0, total_iterations):
+        frames: List[bytes] = []
+        total_chunks = int(rate / chunk * duration)
+        # Approximately one chunk per second, for progress output
+        chunks_per_second = max(1, int(rate / chunk))
+        # Keep the same frames as slicing the full list [::total // 10]
+        sample_step = total_chunks // 10 if total_chunks >= 10 else 1
+        # Silent data used in place of a failed read to maintain timing
+        silence = b"\x00" * (chunk * frame_size)
+
+        # Bind per-chunk methods once so the loop keeps up with the device
+        stream_read = stream.read
+        write_frames = wf.writeframes
+        frames_append = frames.append
+
+        for i in range(0, total_chunks):
             try:
-                data = stream.read(chunk, exception_on_overflow=False)
-                frames.append(data)
+                data = stream_read(chunk, exception_on_overflow=False)
                 # Show progress during recording
-                if i % int(rate / chunk) == 0:  # Approximately every second
-                    seconds_left = duration - (i // int(rate / chunk))
-                    print(
-                        f"{Fore.BLUE}Recording: {Fore.GREEN}{seconds_left}"
-                        f"{Fore.BLUE} seconds left...{Style.RESET_ALL}"
-                    )
+                if i % chunks_per_second == 0:  # Approximately every second
+                    seconds_left = duration - (i // chunks_per_second)
+                    print(RECORDING_PROGRESS_LINE.format(seconds_left))
             except Exception as e:
                 logger.error(f"Error reading from stream: {e}")
-                # Create some silent data to maintain timing
-                frames.append(b"\x00" * chunk)
+                data = silence
+
+            write_frames(data)
+            if i % sample_step == 0:
+                frames_append(data)
 
         # Ensure we display zero seconds at the end
-        print(
-            f"{Fore.BLUE}Recording: {Fore.GREEN}0"
-            f"{Fore.BLUE} seconds left...{Style.RESET_ALL}"
-        )
+        print(RECORDING_PROGRESS_LINE.format(0))
 
         return frames
 
@@ -303,10 +364,6 @@ class AudioRecordingService(IAudioRecordingService):
             logger.warning("No audio frames captured")
             return False
 
-        # Calculate the average level of the audio signal
-        import statistics
-        import struct
-
         # Convert some frames samples to integers for analysis
         try:
             # Sample at most 10 frames for efficiency
@@ -316,19 +373,14 @@ class AudioRecordingService(IAudioRecordingService):
             levels = []
 
             for frame in sample_frames:
-                # Convert bytes to 16-bit integers (assuming format_type=pyaudio.paInt16)
-                # and calculate their absolute values
-                format_str = f"<{len(frame)//2}h"
-                try:
-                    int_values = struct.unpack(format_str, frame)
-                    # Get absolute levels
-                    abs_values = [abs(v) for v in int_values]
-                    if abs_values:
-                        # Use median to avoid outliers
-                        levels.append(statistics.median(abs_values))
-                except Exception as e:
-                    logger.warning(f"Error unpacking audio frame: {e}")
-                    continue
+                # View bytes as 16-bit integers (format_type=pyaudio.paInt16)
+                # and widen before abs() so -32768 does not overflow
+                int_values = np.frombuffer(
+                    frame, dtype="<i2", count=len(frame) // 2
+                ).astype(np.int32)
+                if int_values.size:
+                    # Use median to avoid outliers
+                    levels.append(float(np.median(np.abs(int_values))))
 
             # Check if we have enough data
             if not levels:
@@ -336,7 +388,7 @@ class AudioRecordingService(IAudioRecordingService):
                 return False
 
             # Calculate median level across frames
-            median_level = statistics.median(levels)
+            median_level = float(np.median(levels))
 
             # Check if audio is too quiet
             # 16-bit audio ranges from -32768 to 32767, so we use a percentage threshold
@@ -357,37 +409,36 @@ class AudioRecordingService(IAudioRecordingService):
             logger.warning(f"Error validating audio quality: {e}")
             return True  # Default to accepting audio on error
 
-    def _save_frames_to_wav(
+    def _open_wav_file(
         self,
         output_path: str,
         audio: pyaudio.PyAudio,
-        frames: List[bytes],
         channels: int,
         rate: int,
         format_type: int,
-    ) -> None:
-        """Save audio frames to a WAV file.
+    ) -> wave.Wave_write:
+        """Open a WAV file for writing recorded frames.
 
         Args:
             output_path: Path where the WAV file will be saved
             audio: PyAudio instance
-            frames: List of audio frames
             channels: Number of audio channels
             rate: Sample rate
             format_type: Audio format
 
+        Returns:
+            wave.Wave_write: WAV file with its parameters set
+
         Raises:
-            AudioRecordingError: If saving the file fails
+            AudioRecordingError: If the file cannot be opened
         """
         try:
-            with wave.open(output_path, "wb") as wf:
-                wf.setnchannels(channels)
-                wf.setsampwidth(audio.get_sample_size(format_type))
-                wf.setframerate(rate)
-                wf.writeframes(b"".join(frames))
+            wf = wave.open(output_path, "wb")
         except (IOError, OSError) as e:
             logger.error(f"Error saving WAV file: {e}")
             raise AudioRecordingError(f"Failed to save audio file: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error saving WAV file: {e}")
-            raise AudioRecordingError(f"Failed to save audio file: {e}")
+
+        wf.setnchannels(channels)
+        wf.setsampwidth(audio.get_sample_size(format_type))
+        wf.setframerate(rate)
+        return wf
@@ -43,10 +43,12 @@ class ConfigurationManager(IConfigurationManager):
         self.set_default("WHISPER_MODEL", "tiny")
         self.set_default("WHISPER_COMPUTE_TYPE", "int8")
         self.set_default("WHISPER_DEVICE", "cpu")
+        self.set_default("TRANSCRIBE_CONCURRENT_REQUESTS", 3)
 
         # Text-to-speech configuration
         self.set_default("TTS_LANGUAGE", "en")
         self.set_default("TTS_SPEED", "normal")
+        self.set_default("TTS_CACHE_MAX_BYTES", 100 * 1024 * 1024)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value.
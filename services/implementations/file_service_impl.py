@@ -5,12 +5,13 @@ import logging
 import os
 import time
 import wave
-from typing import Optional, Tuple, Union
+from typing import Iterable, Optional, Tuple, Union
 
 import numpy as np
 import soundfile as sf
 
-from services.exceptions import FileOperationError
+from services.directories import ensure_directory
+from services.exceptions import AudioServiceError, FileOperationError
 from services.interfaces.file_service_interface import IFileService
 
 logger = logging.getLogger(__name__)
@@ -91,16 +92,12 @@ class FileService(IFileService):
         if not dir_path:
             raise FileOperationError("Directory path cannot be empty")
 
-        # Try to create directory if it doesn't exist
-        if not os.path.isdir(dir_path):
-            try:
-                os.makedirs(dir_path, exist_ok=True)
+        try:
+            if ensure_directory(dir_path):
                 logger.info(f"Created directory: {dir_path}")
-            except (IOError, OSError) as e:
-                logger.error(f"Failed to create directory: {e}")
-                raise FileOperationError(
-                    f"Failed to create directory: {dir_path}"
-                )
+        except OSError as e:
+            logger.error(f"Failed to create directory: {e}")
+            raise FileOperationError(f"Failed to create directory: {dir_path}")
 
         return dir_path
 
@@ -123,9 +120,10 @@ class FileService(IFileService):
             if parent_dir:
                 self.prepare_directory(parent_dir)
 
-            # Save text to file
-            with open(file_path, "w") as f:
-                f.write(text)
+            # Encode once as utf-8 and write the bytes in a single call,
+            # independent of the locale encoding
+            with open(file_path, "wb") as f:
+                f.write(text.encode("utf-8"))
 
             logger.info(f"Text saved to: {file_path}")
             return file_path
@@ -173,6 +171,75 @@ class FileService(IFileService):
             logger.error(f"Failed to save audio file: {e}")
             raise FileOperationError(f"Failed to save audio file: {e}")
 
+    def save_stream(
+        self, chunks: Iterable[Tuple[np.ndarray, int]], file_path: str
+    ) -> str:
+        """Save audio chunks to a file as they are produced.
+
+        The file is opened once with the sample rate and channel count of
+        the first chunk, and each chunk is appended as it arrives, so the
+        complete audio never has to be held in memory. Chunks are written
+        to a temporary file that replaces file_path only once the stream
+        completes, so a failed stream never leaves a truncated file.
+
+        Args:
+            chunks: Iterable of (audio_data, sample_rate) tuples
+            file_path: Path to the output file
+
+        Returns:
+            str: Path to the saved file
+
+        Raises:
+            FileOperationError: If saving fails or no audio is produced
+        """
+        try:
+            # Ensure the parent directory exists
+            parent_dir = os.path.dirname(file_path)
+            if parent_dir:
+                self.prepare_directory(parent_dir)
+
+            # The temporary name hides the extension, so the container
+            # format is taken from file_path
+            partial_path = f"{file_path}.part"
+            audio_format = os.path.splitext(file_path)[1][1:].upper() or None
+            writer: Optional[sf.SoundFile] = None
+            try:
+                try:
+                    for data, sample_rate in chunks:
+                        if writer is None:
+                            channels = 1 if data.ndim == 1 else data.shape[1]
+                            writer = sf.SoundFile(
+                                partial_path,
+                                mode="w",
+                                samplerate=sample_rate,
+                                channels=channels,
+                                format=audio_format,
+                            )
+                        writer.write(data)
+                finally:
+                    if writer is not None:
+                        writer.close()
+
+                if writer is None:
+                    raise FileOperationError("No audio data to save")
+                os.replace(partial_path, file_path)
+            except BaseException:
+                try:
+                    os.remove(partial_path)
+                except OSError:
+                    pass
+                raise
+
+            logger.info(f"Audio streamed to: {file_path}")
+            return file_path
+
+        except AudioServiceError:
+            # Pass through errors raised by the chunk producer
+            raise
+        except Exception as e:
+            logger.error(f"Failed to save audio stream: {e}")
+            raise FileOperationError(f"Failed to save audio stream: {e}")
+
     def generate_temp_output_path(self) -> str:
         """Generate a temporary output file path.
 
@@ -202,19 +269,21 @@ class FileService(IFileService):
             FileOperationError: If reading fails
         """
         try:
-            with open(file_path, "r") as f:
-                content = f.read().strip()
+            # Read the bytes and decode them once instead of
+            # streaming them through a text wrapper
+            with open(file_path, "rb") as f:
+                content = f.read().decode("utf-8").strip()
             logger.info(f"Text read from: {file_path}")
             return content
         except Exception as e:
             logger.error(f"Failed to read text file: {e}")
             raise FileOperationError(f"Failed to read text file: {e}")
 
-    def load_latest_transcription(self) -> Optional[str]:
-        """Load the latest transcription file.
+    def get_latest_transcription_path(self) -> Optional[str]:
+        """Find the most recent transcription file without reading it.
 
         Returns:
-            Optional[str]: The content of the latest transcription file or None if not found
+            Optional[str]: Path of the latest transcription file or None if not found
         """
         # Get output directory from environment or use default
         output_dir = self.sanitize_path(
@@ -229,11 +298,23 @@ class FileService(IFileService):
             logger.info("No transcription files found")
             return None
         # Get the most recent file
-        latest_file = max(transcript_files, key=os.path.getctime)
+        return max(transcript_files, key=os.path.getctime)
+
+    def load_latest_transcription(self) -> Optional[str]:
+        """Load the latest transcription file.
+
+        Returns:
+            Optional[str]: The content of the latest transcription file or None if not found
+        """
+        latest_file = self.get_latest_transcription_path()
+        if not latest_file:
+            return None
         try:
             # Read and return the content
-            with open(latest_file, "r") as f:
-                content = f.read().strip()
+            # Read the bytes and decode them once instead of
+            # streaming them through a text wrapper
+            with open(latest_file, "rb") as f:
+                content = f.read().decode("utf-8").strip()
             logger.info(f"Loaded latest transcription from: {latest_file}")
             return content
         except Exception as e:
@@ -304,19 +304,36 @@ class FileTranscriptionService(IFileTranscriptionService):
             )
             return []
 
-        # Transcribe each file
+        # Transcribe all files with one model load and batched inference
+        print(
+            f"{Fore.CYAN}Transcribing {len(wav_files)} files from: "
+            f"{Fore.YELLOW}{directory}{Style.RESET_ALL}"
+        )
+        try:
+            results = self.transcription_service.transcribe_batch(
+                wav_files, model_size, language
+            )
+        except Exception as e:
+            logger.error(f"Error transcribing {directory}: {e}")
+            print(
+                f"{Fore.RED}Error transcribing {directory}: "
+                f"{e}{Style.RESET_ALL}"
+            )
+            return []
+
         transcriptions = []
-        for wav_file in wav_files:
-            try:
-                transcription = self.transcribe_file(
-                    wav_file, model_size, language
-                )
-                transcriptions.append(transcription)
-            except Exception as e:
-                logger.error(f"Error transcribing {wav_file}: {e}")
+        for wav_file, transcription, error in results:
+            if error or transcription is None:
                 print(
                     f"{Fore.RED}Error transcribing {wav_file}: "
-                    f"{e}{Style.RESET_ALL}"
+                    f"{error}{Style.RESET_ALL}"
                 )
+                continue
+
+            print(
+                f"\n{Fore.GREEN}Transcription of {wav_file}:"
+                f"{Style.RESET_ALL}\n{transcription}\n"
+            )
+            transcriptions.append(transcription)
 
         return transcriptions
@@ -8,7 +8,6 @@ from typing import Optional, Tuple
 
 import numpy as np
 import soundfile as sf
-from gtts import gTTS
 
 from library.bin.dependency_injection.module_loader import Injectable
 from services.interfaces.text_to_speech_service_interface import (
@@ -47,6 +46,9 @@ class TextToSpeechService(ITextToSpeechService):
             # Default to English if no voice/language is provided
             language = voice or "en"
 
+            # gTTS pulls in requests, so it is imported on first use
+            from gtts import gTTS
+
             # Create gTTS object
             tts = gTTS(text=text, lang=language, slow=False)
 
@@ -64,7 +66,8 @@ class TextToSpeechService(ITextToSpeechService):
                 temp_file.write(mp3_fp.read())
 
             # Use soundfile to read the audio file
-            audio_data, sample_rate = sf.read(temp_filename)
+            # Decode as float32, matching audio loaded from the TTS cache
+            audio_data, sample_rate = sf.read(temp_filename, dtype="float32")
 
             # Clean up the temporary file
             os.remove(temp_filename)
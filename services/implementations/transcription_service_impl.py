@@ -2,11 +2,20 @@
 
 import logging
 import os
+import threading
 import time
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from colorama import Fore, Style
-from faster_whisper import WhisperModel
 
 from services.exceptions import FileOperationError, TranscriptionError
 from services.interfaces.file_service_interface import IFileService
@@ -14,8 +23,96 @@ from services.interfaces.transcription_service_interface import (
     ITranscriptionService,
 )
 
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
 logger = logging.getLogger(__name__)
 
+# Serializes model loads so concurrent callers share one load per config
+_MODEL_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _cached_whisper_model(
+    model_size: str, device: str, compute_type: str
+) -> "WhisperModel":
+    """Load a Whisper model once per configuration and keep it warm.
+
+    Args:
+        model_size: Whisper model size
+        device: Device to run the model on
+        compute_type: CTranslate2 compute type
+
+    Returns:
+        WhisperModel: The loaded model
+    """
+    logger.info(f"Loading Whisper model: {model_size}")
+    logger.info(f"Using compute type: {compute_type}")
+    logger.info(f"Using device: {device}")
+
+    # faster-whisper pulls in ctranslate2, av and tokenizers, so it is only
+    # imported once a model is actually needed
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(model_size, device=device, compute_type=compute_type)
+
+
+def load_whisper_model(
+    model_size: str, device: str, compute_type: str
+) -> "WhisperModel":
+    """Get a warm Whisper model, loading it on first use.
+
+    Models are shared by every caller in the process, keyed on
+    (model_size, device, compute_type), so only the first transcription
+    with a given configuration pays the load cost.
+
+    Args:
+        model_size: Whisper model size
+        device: Device to run the model on
+        compute_type: CTranslate2 compute type
+
+    Returns:
+        WhisperModel: The loaded model
+    """
+    with _MODEL_LOCK:
+        return _cached_whisper_model(model_size, device, compute_type)
+
+
+def _get_batched_pipeline_class() -> Optional[Type[Any]]:
+    """Get faster-whisper's BatchedInferencePipeline if it is available.
+
+    Returns:
+        Optional[Type[Any]]: The pipeline class, or None on faster-whisper
+            versions older than 1.1
+    """
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:
+        return None
+    pipeline_class: Type[Any] = BatchedInferencePipeline
+    return pipeline_class
+
+
+def _get_batch_size() -> Optional[int]:
+    """Get the opt-in batch size for batched inference.
+
+    Batched inference uses different VAD and chunking than sequential
+    transcription, so it is only enabled by setting WHISPER_BATCH_SIZE.
+
+    Returns:
+        Optional[int]: Number of chunks decoded together, or None when
+            batched inference is not enabled
+    """
+    value = os.environ.get("WHISPER_BATCH_SIZE")
+    if not value:
+        return None
+    try:
+        batch_size = int(value)
+    except ValueError:
+        logger.warning(f"Invalid WHISPER_BATCH_SIZE: {value}. Ignoring it.")
+        return None
+    return batch_size if batch_size > 0 else None
+
 
 class TranscriptionService(ITranscriptionService):
     """Service for transcribing audio using faster-whisper."""
@@ -71,6 +168,76 @@ class TranscriptionService(ITranscriptionService):
             logger.error(f"Error transcribing audio: {e}")
             raise TranscriptionError(f"Failed to transcribe audio: {str(e)}")
 
+    def transcribe_batch(
+        self,
+        audio_file_paths: List[str],
+        model_size: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> List[Tuple[str, Optional[str], Optional[Exception]]]:
+        """Transcribe several audio files with a single loaded model.
+
+        The Whisper model is loaded once for the whole batch instead of once
+        per file. When WHISPER_BATCH_SIZE is set and faster-whisper (1.1 or
+        later) provides BatchedInferencePipeline, the chunks of each file
+        are decoded together in batches of that size.
+
+        Args:
+            audio_file_paths: Paths to the audio files to transcribe
+            model_size: Whisper model size (tiny, base, small, medium, large)
+            language: Language code to use (e.g., 'en' for English).
+                If provided, skips language detection.
+
+        Returns:
+            List[Tuple[str, Optional[str], Optional[Exception]]]:
+                (file_path, transcription or None, exception or None)
+                for each file, in input order
+
+        Raises:
+            TranscriptionError: If the model cannot be loaded
+        """
+        if not audio_file_paths:
+            return []
+
+        model_config = self._get_whisper_model_config(model_size)
+        model = self._load_whisper_model(model_config)
+
+        batch_size = _get_batch_size()
+        if batch_size:
+            pipeline_class = _get_batched_pipeline_class()
+            if pipeline_class is None:
+                logger.warning(
+                    "WHISPER_BATCH_SIZE is set, but the installed "
+                    "faster-whisper has no BatchedInferencePipeline; "
+                    "transcribing without batching"
+                )
+                batch_size = None
+            else:
+                model = pipeline_class(model=model)
+                logger.info(
+                    f"Using batched inference, batch size: {batch_size}"
+                )
+
+        results: List[Tuple[str, Optional[str], Optional[Exception]]] = []
+        for audio_file_path in audio_file_paths:
+            try:
+                if not self._is_valid_audio_file(audio_file_path):
+                    raise TranscriptionError(
+                        "Invalid or corrupted audio file"
+                    )
+
+                transcription = self._transcribe_with_model(
+                    model, audio_file_path, language, batch_size
+                )
+                self._save_transcription_to_file(
+                    audio_file_path, transcription
+                )
+                results.append((audio_file_path, transcription, None))
+            except Exception as e:
+                logger.error(f"Error transcribing {audio_file_path}: {e}")
+                results.append((audio_file_path, None, e))
+
+        return results
+
     def _is_valid_audio_file(self, audio_file_path: str) -> bool:
         """Check if the audio file is valid.
 
@@ -141,16 +308,28 @@ class TranscriptionService(ITranscriptionService):
         Raises:
             TranscriptionError: If transcription fails
         """
-        logger.info(f"Loading Whisper model: {model_config['model_size']}")
-        logger.info(f"Using compute type: {model_config['compute_type']}")
-        logger.info(f"Using device: {model_config['device']}")
+        model = self._load_whisper_model(model_config)
+        return self._transcribe_with_model(model, audio_file_path, language)
 
+    def _load_whisper_model(
+        self, model_config: Dict[str, str]
+    ) -> "WhisperModel":
+        """Get the warm Whisper model described by a model configuration.
+
+        Args:
+            model_config: Model configuration dictionary
+
+        Returns:
+            WhisperModel: The loaded model
+
+        Raises:
+            TranscriptionError: If the model cannot be loaded
+        """
         try:
-            # Initialize the model
-            model = WhisperModel(
+            return load_whisper_model(
                 model_config["model_size"],
-                device=model_config["device"],
-                compute_type=model_config["compute_type"],
+                model_config["device"],
+                model_config["compute_type"],
             )
         except Exception as e:
             logger.error(f"Failed to load Whisper model: {e}")
@@ -159,6 +338,26 @@ class TranscriptionService(ITranscriptionService):
                 Check if the model cache directory is properly mounted: {e}"""
             )
 
+    def _transcribe_with_model(
+        self,
+        model: Any,
+        audio_file_path: str,
+        language: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ) -> str:
+        """Transcribe an audio file with an already loaded model.
+
+        Args:
+            model: WhisperModel or BatchedInferencePipeline to run
+            audio_file_path: Path to the audio file
+            language: Language code to use (e.g., 'en' for English).
+                If provided, skips language detection.
+            batch_size: Number of chunks decoded together, for batched
+                pipelines only
+
+        Returns:
+            str: Transcribed text
+        """
         # Run transcription
         logger.info(f"Transcribing audio file: {audio_file_path}")
         print(f"{Fore.CYAN}Transcribing audio...{Style.RESET_ALL}")
@@ -182,11 +381,14 @@ class TranscriptionService(ITranscriptionService):
         # If language is specified, use it to skip language detection
         if language:
             logger.info(f"Using specified language: {language}")
-            transcription_options["language"] = language  # type: ignore
+            transcription_options["language"] = language
             print(
                 f"{Fore.CYAN}Using language: {Fore.YELLOW}{language}{Style.RESET_ALL}"
             )
 
+        if batch_size:
+            transcription_options["batch_size"] = batch_size
+
         # Run transcription with the specified options
         segments, info = model.transcribe(
             audio_file_path, **transcription_options
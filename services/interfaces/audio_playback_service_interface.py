@@ -1,9 +1,10 @@
 """Audio playback service interface for audio synthesis."""
 
 from abc import ABC, abstractmethod
-from typing import Tuple, Union
+from typing import TYPE_CHECKING, Tuple, Union
 
-import numpy as np
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class IAudioPlaybackService(ABC):
@@ -11,7 +12,7 @@ class IAudioPlaybackService(ABC):
 
     @abstractmethod
     def play(
-        self, audio_data: Union[np.ndarray, Tuple[np.ndarray, int]]
+        self, audio_data: "Union[np.ndarray, Tuple[np.ndarray, int]]"
     ) -> None:
         """Play audio data through the default audio output.
 
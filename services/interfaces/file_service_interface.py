@@ -1,9 +1,10 @@
 """File service interface for audio transcription tool."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Union
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple, Union
 
-import numpy as np
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class IFileService(ABC):
@@ -67,7 +68,7 @@ class IFileService(ABC):
     @abstractmethod
     def save(
         self,
-        audio_data: Union[np.ndarray, Tuple[np.ndarray, int]],
+        audio_data: "Union[np.ndarray, Tuple[np.ndarray, int]]",
         file_path: str,
     ) -> str:
         """Save audio data to a file.
@@ -84,6 +85,24 @@ class IFileService(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_stream(
+        self, chunks: "Iterable[Tuple[np.ndarray, int]]", file_path: str
+    ) -> str:
+        """Save audio chunks to a file as they are produced.
+
+        Args:
+            chunks: Iterable of (audio_data, sample_rate) tuples
+            file_path: Path to the output file
+
+        Returns:
+            str: Path to the saved file
+
+        Raises:
+            FileOperationError: If saving fails
+        """
+        pass
+
     @abstractmethod
     def generate_temp_output_path(self) -> str:
         """Generate a temporary output file path.
@@ -108,6 +127,15 @@ class IFileService(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_latest_transcription_path(self) -> Optional[str]:
+        """Find the most recent transcription file without reading it.
+
+        Returns:
+            Optional[str]: Path of the latest transcription file or None if not found
+        """
+        pass
+
     @abstractmethod
     def load_latest_transcription(self) -> Optional[str]:
         """Load the latest transcription file.
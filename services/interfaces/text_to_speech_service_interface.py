@@ -1,9 +1,10 @@
 """Text to speech service interface for audio synthesis."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
-import numpy as np
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class ITextToSpeechService(ABC):
@@ -12,7 +13,7 @@ class ITextToSpeechService(ABC):
     @abstractmethod
     def synthesize(
         self, text: str, voice: Optional[str] = None
-    ) -> Tuple[np.ndarray, int]:
+    ) -> "Tuple[np.ndarray, int]":
         """Synthesize text to audio using text-to-speech.
 
         Args:
@@ -1,7 +1,7 @@
 """Transcription service interface for audio transcription tool."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Tuple
 
 
 class ITranscriptionService(ABC):
@@ -30,3 +30,28 @@ class ITranscriptionService(ABC):
             FileOperationError: If file operations fail
         """
         pass
+
+    @abstractmethod
+    def transcribe_batch(
+        self,
+        audio_file_paths: List[str],
+        model_size: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> List[Tuple[str, Optional[str], Optional[Exception]]]:
+        """Transcribe several audio files with a single loaded model.
+
+        Args:
+            audio_file_paths: Paths to the audio files to transcribe
+            model_size: Model size (tiny, base, small, medium, large)
+            language: Language code to use (e.g., 'en' for English).
+                If provided, skips language detection.
+
+        Returns:
+            List[Tuple[str, Optional[str], Optional[Exception]]]:
+                (file_path, transcription or None, exception or None)
+                for each file, in input order
+
+        Raises:
+            TranscriptionError: If the model cannot be loaded
+        """
+        pass
@@ -135,15 +135,15 @@ class PlatformDetectionService:
         """
         pi_model_path = "/proc/device-tree/model"
 
-        if not os.path.exists(pi_model_path):
-            return ""
-
+        # Opening the file is the existence check; most hosts have none
         try:
             with open(pi_model_path) as f:
                 model = f.read().lower()
                 if "raspberry pi" not in model:
                     return ""
                 return "pi"
+        except FileNotFoundError:
+            return ""
         except (IOError, OSError) as e:
             logger.debug(f"Error reading Raspberry Pi model: {e}")
             return ""
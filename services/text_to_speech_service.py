@@ -2,24 +2,129 @@
 
 import io
 import logging
-import os
-import tempfile
-from typing import Optional, Tuple
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Callable, Iterator, Optional, Tuple
 
 import numpy as np
 import soundfile as sf
-from gtts import gTTS
+
+from services.audio_buffer import AudioBuffer
 
 logger = logging.getLogger(__name__)
 
+# Runs of whitespace, including newlines and Unicode spaces
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Upper bound on the samples of recently synthesized phrases kept in
+# memory, about 90 seconds of 24 kHz float32 audio
+_MEMO_MAX_BYTES = 8 * 1024 * 1024
+
+# Recently synthesized audio by (text, language), least recently used first
+_memo: "OrderedDict[Tuple[str, str], AudioBuffer]" = OrderedDict()
+_memo_bytes = 0
+_memo_lock = threading.Lock()
+
+
+def _synthesize_with_gtts(text: str, language: str) -> AudioBuffer:
+    """Synthesize text with gTTS.
+
+    The MP3 is decoded from memory, so no temporary file is written.
+
+    Args:
+        text: The text to synthesize
+        language: gTTS language code
+
+    Returns:
+        AudioBuffer: Audio data and sample rate
+    """
+    # gTTS pulls in requests, so it is imported on first use
+    from gtts import gTTS
+
+    # Create gTTS object
+    tts = gTTS(text=text, lang=language, slow=False)
+
+    # Save to a BytesIO object
+    mp3_fp = io.BytesIO()
+    tts.write_to_fp(mp3_fp)
+    mp3_fp.seek(0)
+
+    # Decode as float32, matching audio loaded from the TTS cache
+    audio_data, sample_rate = sf.read(mp3_fp, dtype="float32")
+
+    logger.info(
+        f"Generated {len(audio_data)/sample_rate:.2f}s audio at {sample_rate}Hz"
+    )
+    return AudioBuffer(audio_data, sample_rate)
+
+
+def _synthesize_memoized(text: str, language: str) -> AudioBuffer:
+    """Synthesize text with gTTS, keeping recent results in memory.
+
+    Repeated phrases (prompts, error messages) are served from memory.
+    Entries are evicted least recently used first once their samples
+    exceed _MEMO_MAX_BYTES in total. Failures raise and are therefore
+    never stored.
+
+    Args:
+        text: The text to synthesize
+        language: gTTS language code
+
+    Returns:
+        AudioBuffer: Read-only audio data and sample rate
+    """
+    global _memo_bytes
+
+    key = (text, language)
+    with _memo_lock:
+        audio = _memo.get(key)
+        if audio is not None:
+            _memo.move_to_end(key)
+            return audio
+
+    audio = _synthesize_with_gtts(text, language)
+
+    # Results are shared between callers, so guard against mutation
+    audio.samples.setflags(write=False)
+    size = audio.samples.nbytes
+    if size > _MEMO_MAX_BYTES:
+        return audio
+
+    with _memo_lock:
+        if key not in _memo:
+            _memo[key] = audio
+            _memo_bytes += size
+            while _memo_bytes > _MEMO_MAX_BYTES:
+                _, evicted = _memo.popitem(last=False)
+                _memo_bytes -= evicted.samples.nbytes
+    return audio
+
 
 class TextToSpeechService:
     """Service for text-to-speech synthesis."""
 
     @staticmethod
-    def synthesize(
-        text: str, voice: Optional[str] = None
-    ) -> Tuple[np.ndarray, int]:
+    def normalize_text(text: str) -> str:
+        """Normalize text before synthesis.
+
+        Applies Unicode NFKC normalization and collapses whitespace in a
+        single pass each, so text that only differs in formatting (line
+        wrapping, non-breaking spaces, full-width characters) is spoken
+        and cached identically.
+
+        Args:
+            text: The text to normalize
+
+        Returns:
+            str: Normalized text, stripped of leading and trailing spaces
+        """
+        text = unicodedata.normalize("NFKC", text)
+        return _WHITESPACE_RE.sub(" ", text).strip()
+
+    @staticmethod
+    def synthesize(text: str, voice: Optional[str] = None) -> AudioBuffer:
         """Synthesize text to audio using text-to-speech.
 
         Args:
@@ -27,7 +132,7 @@ class TextToSpeechService:
             voice: Optional voice identifier to use (language code for gTTS, e.g., 'en', 'fr', etc.)
 
         Returns:
-            Tuple[np.ndarray, int]: Audio data as numpy array and sample rate
+            AudioBuffer: Audio data as numpy array and sample rate
         """
         logger.info(
             f"Synthesizing text: {text[:30]}{'...' if len(text) > 30 else ''}"
@@ -36,56 +141,90 @@ class TextToSpeechService:
         # Use gTTS for text-to-speech synthesis
         try:
             # Default to English if no voice/language is provided
-            language = voice or "en"
+            return _synthesize_memoized(text, voice or "en")
+        except Exception as e:
+            logger.error(f"Failed to synthesize speech with gTTS: {e}")
+            logger.warning("Falling back to dummy audio generation")
+            return TextToSpeechService._generate_fallback_audio()
 
-            # Create gTTS object
-            tts = gTTS(text=text, lang=language, slow=False)
+    @staticmethod
+    def synthesize_stream(
+        text: str,
+        voice: Optional[str] = None,
+        on_fallback: Optional[Callable[[], None]] = None,
+    ) -> Iterator[AudioBuffer]:
+        """Synthesize text to audio, yielding chunks as they are generated.
 
-            # Save to a temporary BytesIO object
-            mp3_fp = io.BytesIO()
-            tts.write_to_fp(mp3_fp)
-            mp3_fp.seek(0)
+        gTTS splits long text into parts and fetches each part separately,
+        so every part is decoded and yielded as soon as it arrives. This
+        lets callers start playback before the whole text is synthesized.
 
-            # Create a temporary file to save the MP3
-            with tempfile.NamedTemporaryFile(
-                suffix=".mp3", delete=False
-            ) as temp_file:
-                temp_filename = temp_file.name
-                mp3_fp.seek(0)
-                temp_file.write(mp3_fp.read())
+        Args:
+            text: The text to synthesize
+            voice: Optional voice identifier to use (language code for gTTS, e.g., 'en', 'fr', etc.)
+            on_fallback: Optional callback invoked when the dummy tone is
+                yielded instead of synthesized speech
+
+        Yields:
+            AudioBuffer: Audio chunk as numpy array and sample rate
+        """
+        logger.info(
+            f"Streaming synthesis of text: {text[:30]}{'...' if len(text) > 30 else ''}"
+        )
+
+        chunks_yielded = 0
+        try:
+            # Default to English if no voice/language is provided
+            language = voice or "en"
 
-            # Use soundfile to read the audio file
-            audio_data, sample_rate = sf.read(temp_filename)
+            # gTTS pulls in requests, so it is imported on first use
+            from gtts import gTTS
 
-            # Clean up the temporary file
-            os.remove(temp_filename)
+            tts = gTTS(text=text, lang=language, slow=False)
 
-            logger.info(
-                f"Generated {len(audio_data)/sample_rate:.2f}s audio at {sample_rate}Hz"
-            )
-            return audio_data, sample_rate
+            # Each streamed part is a self-contained MP3 segment
+            for mp3_bytes in tts.stream():
+                audio_data, sample_rate = sf.read(
+                    io.BytesIO(mp3_bytes), dtype="float32"
+                )
+                chunks_yielded += 1
+                yield AudioBuffer(audio_data, sample_rate)
 
         except Exception as e:
-            logger.error(f"Failed to synthesize speech with gTTS: {e}")
+            logger.error(f"Failed to stream speech with gTTS: {e}")
+
+            # Only fall back if nothing was produced, to avoid splicing a
+            # sine wave into the middle of partially synthesized speech
+            if chunks_yielded:
+                raise
             logger.warning("Falling back to dummy audio generation")
+            if on_fallback:
+                on_fallback()
+            yield TextToSpeechService._generate_fallback_audio()
+
+    @staticmethod
+    def _generate_fallback_audio() -> AudioBuffer:
+        """Generate a short dummy tone used when synthesis is unavailable.
 
-            # Fallback to dummy audio generation
-            sample_rate = 16000
-            duration = 2.0  # seconds
-            t = np.linspace(
-                0, duration, int(sample_rate * duration), endpoint=False
-            )
-
-            # Create a simple sine wave
-            frequencies = [440, 880]
-            audio_data = np.zeros_like(t)
-            for freq in frequencies:
-                audio_data += 0.5 * np.sin(2 * np.pi * freq * t)
-
-            # Normalize the audio data
-            audio_data = audio_data / np.max(np.abs(audio_data))
-
-            logger.info(
-                f"Generated fallback {len(audio_data)/sample_rate:.2f}s audio at {sample_rate}Hz"
-            )
-            return audio_data, sample_rate
+        Returns:
+            AudioBuffer: Audio data as numpy array and sample rate
+        """
+        sample_rate = 16000
+        duration = 2.0  # seconds
+        t = np.linspace(
+            0, duration, int(sample_rate * duration), endpoint=False
+        )
+
+        # Create a simple sine wave
+        frequencies = [440, 880]
+        audio_data = np.zeros_like(t)
+        for freq in frequencies:
+            audio_data += 0.5 * np.sin(2 * np.pi * freq * t)
+
+        # Normalize the audio data
+        audio_data = audio_data / np.max(np.abs(audio_data))
+
+        logger.info(
+            f"Generated fallback {len(audio_data)/sample_rate:.2f}s audio at {sample_rate}Hz"
+        )
+        return AudioBuffer(audio_data, sample_rate)
@@ -6,7 +6,6 @@ import time
 from typing import Dict, Optional
 
 from colorama import Fore, Style
-from faster_whisper import WhisperModel
 
 from services.exceptions import (
     FileOperationError,
@@ -17,9 +16,15 @@ from services.file_service import FileService
 from services.implementations.configuration_manager_impl import (
     ConfigurationManager,
 )
+from services.implementations.transcription_service_impl import (
+    load_whisper_model,
+)
 
 logger = logging.getLogger(__name__)
 
+# Extensions accepted for audio files without a warning
+_AUDIO_EXTENSIONS = (".wav", ".mp3", ".flac", ".ogg", ".m4a")
+
 
 class TranscriptionService:
     """Service for transcribing audio using faster-whisper."""
@@ -137,10 +142,7 @@ class TranscriptionService:
             return False
 
         # Additional format validation to ensure file has audio extension
-        valid_extensions = [".wav", ".mp3", ".flac", ".ogg", ".m4a"]
-        if not any(
-            audio_file_path.lower().endswith(ext) for ext in valid_extensions
-        ):
+        if not audio_file_path.lower().endswith(_AUDIO_EXTENSIONS):
             logger.warning(
                 f"File does not have a standard audio extension: {audio_file_path}"
             )
@@ -226,8 +228,8 @@ class TranscriptionService:
         logger.info(f"Using device: {model_config['device']}")
 
         try:
-            # Initialize the model
-            model = WhisperModel(
+            # Reuse the warm model for this configuration
+            model = load_whisper_model(
                 model_config["model_size"],
                 device=model_config["device"],
                 compute_type=model_config["compute_type"],
@@ -0,0 +1,198 @@
+"""Content-addressed cache for synthesized speech.
+
+This module provides a two-level cache for text-to-speech output: a
+size-bounded directory of audio files keyed by a hash of the synthesis
+inputs and the output format, and a small in-process LRU of decoded audio
+for hot entries.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import soundfile as sf
+
+from services.audio_buffer import AudioBuffer
+
+logger = logging.getLogger(__name__)
+
+
+class TTSCache:
+    """Cache of synthesized audio keyed on (text, voice, model, format).
+
+    Attributes:
+        cache_dir: Directory holding the cached audio files
+        max_bytes: Maximum total size of the cache directory in bytes
+        memory_entries: Maximum number of decoded entries kept in memory
+    """
+
+    def __init__(
+        self, cache_dir: str, max_bytes: int, memory_entries: int = 128
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cached audio files
+            max_bytes: Maximum total size of the cache directory in bytes
+            memory_entries: Maximum number of decoded entries kept in memory
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[str, AudioBuffer]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(text: str, voice: str, model: str, audio_format: str) -> str:
+        """Build the cache key for a synthesis request.
+
+        The output format is part of the key, so a file cached for one
+        container is never copied to a path expecting another.
+
+        Args:
+            text: The text to synthesize
+            voice: Voice or language identifier
+            model: Synthesis engine or model identifier
+            audio_format: Output file extension, such as "wav" or "flac"
+
+        Returns:
+            str: Hex digest identifying the request, with the format as
+                its extension
+        """
+        audio_format = audio_format.lower()
+        digest = hashlib.sha256()
+        for part in (model, voice, audio_format, text):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return f"{digest.hexdigest()}.{audio_format}"
+
+    def path_for(self, key: str) -> str:
+        """Get the cache file path for a key.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            str: Path of the cached audio file
+        """
+        return os.path.join(self.cache_dir, key)
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Look up a cached file and mark it as recently used.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Optional[str]: Path of the cached file, or None on a miss
+        """
+        cache_path = self.path_for(key)
+        try:
+            # Touch the entry so eviction sees it as recently used
+            os.utime(cache_path)
+        except OSError:
+            return None
+        return cache_path
+
+    def load(self, key: str) -> Optional[AudioBuffer]:
+        """Load decoded audio for a key, preferring the in-memory LRU.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Optional[AudioBuffer]: Audio data and sample rate,
+                or None on a miss
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+        cache_path = self.lookup(key)
+        if not cache_path:
+            return None
+
+        try:
+            # float32 keeps the in-memory LRU at half the size of
+            # soundfile's float64 default
+            audio_data, sample_rate = sf.read(cache_path, dtype="float32")
+        except Exception as e:
+            logger.warning("Failed to read cached audio %s: %s", cache_path, e)
+            return None
+
+        audio = AudioBuffer(audio_data, sample_rate)
+        with self._lock:
+            self._memory[key] = audio
+            if len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+        return audio
+
+    def store(self, key: str, source_path: str) -> None:
+        """Copy a synthesized file into the cache and enforce the size limit.
+
+        The file is copied rather than hard-linked, so later writes to the
+        source path cannot change the cached entry.
+
+        Args:
+            key: Cache key from make_key
+            source_path: Path of the synthesized audio file
+        """
+        cache_path = self.path_for(key)
+        try:
+            try:
+                shutil.copyfile(source_path, cache_path)
+            except FileNotFoundError:
+                # The directory normally exists already, so it is only
+                # created when the first copy into it fails
+                os.makedirs(self.cache_dir, exist_ok=True)
+                shutil.copyfile(source_path, cache_path)
+        except OSError as e:
+            logger.warning("Failed to cache synthesized audio: %s", e)
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used files until under the size limit."""
+        try:
+            entries = [
+                entry
+                for entry in os.scandir(self.cache_dir)
+                if entry.is_file()
+            ]
+        except OSError as e:
+            logger.warning("Failed to scan TTS cache: %s", e)
+            return
+
+        stats = []
+        for entry in entries:
+            try:
+                stats.append((entry.path, entry.stat()))
+            except OSError:
+                # Removed by another process or an earlier eviction
+                continue
+        total = sum(stat.st_size for _, stat in stats)
+        if total <= self.max_bytes:
+            return
+
+        for path, stat in sorted(stats, key=lambda item: item[1].st_atime):
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning("Failed to evict cached audio %s: %s", path, e)
+                continue
+
+            key = os.path.basename(path)
+            with self._lock:
+                self._memory.pop(key, None)
+            total -= stat.st_size
+            logger.debug("Evicted cached audio: %s", path)
+            if total <= self.max_bytes:
+                break
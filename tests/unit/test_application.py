@@ -0,0 +1,47 @@
+"""Unit tests for the application entry point."""
+
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import pytest
+
+from audio.application import Application
+
+
+class StubConfig:
+    """Configuration stub returning a fixed concurrency setting."""
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        if key == "TRANSCRIBE_CONCURRENT_REQUESTS":
+            return self.value
+        return default
+
+
+def _application(value: Any) -> Application:
+    """Create an application whose configuration holds value."""
+    application = Application()
+    application.services = SimpleNamespace(  # type: ignore[assignment]
+        config_manager=StubConfig(value)
+    )
+    return application
+
+
+@pytest.mark.unit
+class TestConcurrencyLimit:
+    """Unit tests for Application._get_concurrency_limit."""
+
+    @pytest.mark.parametrize("value, expected", [(5, 5), ("2", 2), (1, 1)])
+    def test_valid_setting(self, value: Any, expected: int) -> None:
+        """Test that a positive integer setting is used as is."""
+        assert _application(value)._get_concurrency_limit() == expected
+
+    @pytest.mark.parametrize("value", ["many", None, 0, -2])
+    def test_invalid_setting_falls_back(self, value: Any, caplog) -> None:
+        """Test that an invalid setting is logged and replaced."""
+        limit = _application(value)._get_concurrency_limit()
+
+        assert limit == Application.TRANSCRIBE_CONCURRENT_REQUESTS
+        assert "Invalid TRANSCRIBE_CONCURRENT_REQUESTS" in caplog.text
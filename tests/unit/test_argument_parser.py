@@ -0,0 +1,65 @@
+"""Unit tests for the command-line argument parser."""
+
+import os
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+from audio import __version__
+from audio.utilities.argument_parser import ArgumentParser
+
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+
+@pytest.mark.unit
+class TestArgumentParserUnit:
+    """Unit tests for ArgumentParser."""
+
+    def test_parse_audio_out_arguments(self) -> None:
+        """Test that a command and its options are parsed."""
+        args, command = ArgumentParser().parse_arguments(
+            ["audio-out", "--data-source", "Hello"]
+        )
+
+        assert command == "audio-out"
+        assert args["data_source"] == "Hello"
+
+    def test_builds_only_requested_command(self) -> None:
+        """Test that only the requested command's parser is built."""
+        parser = ArgumentParser()
+        parser.parse_arguments(["audio-in", "--record"])
+
+        assert parser._configured_commands == {"audio-in"}
+
+    def test_version_exits_without_commands(self, capsys: Any) -> None:
+        """Test that --version exits before any command parser is built."""
+        parser = ArgumentParser()
+        with pytest.raises(SystemExit) as exc_info:
+            parser.parse_arguments(["--version"])
+
+        assert exc_info.value.code == 0
+        assert __version__ in capsys.readouterr().out
+        assert parser._configured_commands == set()
+
+    def test_import_loads_no_services(self) -> None:
+        """Test that importing the parser does not load the service stack."""
+        code = (
+            "import sys\n"
+            "import audio.utilities.argument_parser\n"
+            "print(','.join(m for m in sys.modules"
+            " if m.split('.')[0] in ('services', 'plugins')"
+            " or m == 'audio.audio_pipeline_controller'))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == ""
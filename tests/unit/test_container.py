@@ -0,0 +1,141 @@
+"""Unit tests for the dependency injection container."""
+
+import pytest
+
+from library.bin.dependency_injection.container import (
+    DIContainer,
+    ServiceLifetime,
+)
+
+
+class Leaf:
+    """Service without dependencies."""
+
+
+class Middle:
+    """Service depending on Leaf."""
+
+    def __init__(self, leaf: Leaf) -> None:
+        self.leaf = leaf
+
+
+class Top:
+    """Service depending on Middle and Leaf."""
+
+    def __init__(self, middle: Middle, leaf: Leaf) -> None:
+        self.middle = middle
+        self.leaf = leaf
+
+
+class CycleA:
+    """Service depending on CycleB."""
+
+    def __init__(self, other: "CycleB") -> None:
+        self.other = other
+
+
+class CycleB:
+    """Service depending on CycleA."""
+
+    def __init__(self, other: CycleA) -> None:
+        self.other = other
+
+
+class SelfLoop:
+    """Service depending on itself."""
+
+    def __init__(self, other: "SelfLoop") -> None:
+        self.other = other
+
+
+@pytest.mark.unit
+class TestDIContainer:
+    """Unit tests for DIContainer dependency handling."""
+
+    def test_resolves_constructor_dependencies(self) -> None:
+        """Test that dependencies are injected and singletons shared."""
+        container = DIContainer()
+        container.register(Leaf, Leaf)
+        container.register(Middle, Middle)
+        container.register(Top, Top)
+
+        top = container.resolve(Top)
+
+        assert top.middle.leaf is top.leaf
+        assert container.resolve(Top) is top
+
+    def test_cycle_raises(self) -> None:
+        """Test that a dependency cycle is reported by name."""
+        container = DIContainer()
+        container.register(CycleA, CycleA)
+        container.register(CycleB, CycleB)
+
+        with pytest.raises(ValueError, match="CycleA -> CycleB -> CycleA"):
+            container.resolve(CycleA)
+
+    def test_self_dependency_raises(self) -> None:
+        """Test that a service depending on itself is a cycle."""
+        container = DIContainer()
+        container.register(SelfLoop, SelfLoop)
+
+        with pytest.raises(ValueError, match="Circular dependency"):
+            container.resolve(SelfLoop)
+
+    def test_cycle_does_not_affect_unrelated_services(self) -> None:
+        """Test that services outside a cycle still resolve."""
+        container = DIContainer()
+        container.register(CycleA, CycleA)
+        container.register(CycleB, CycleB)
+        container.register(Leaf, Leaf)
+        container.register(Middle, Middle)
+
+        assert isinstance(container.resolve(Middle), Middle)
+        with pytest.raises(ValueError):
+            container.resolve(CycleB)
+        assert isinstance(container.resolve(Leaf), Leaf)
+
+    def test_reregistering_rechecks_cycles(self) -> None:
+        """Test that a cycle introduced by a later registration is found."""
+        container = DIContainer()
+        container.register(CycleA, implementation=object())
+        container.register(CycleB, CycleB)
+        container.resolve(CycleB)
+
+        container.register(CycleA, CycleA)
+
+        with pytest.raises(ValueError, match="Circular dependency"):
+            container.resolve(CycleA)
+
+    def test_dependency_order_lists_dependencies_first(self) -> None:
+        """Test that every service comes after its dependencies."""
+        container = DIContainer()
+        container.register(Top, Top)
+        container.register(Middle, Middle)
+        container.register(Leaf, Leaf)
+
+        order = container._dependency_order([Top])
+
+        assert order == [Leaf, Middle, Top]
+
+    def test_warm_up_creates_singletons_only(self) -> None:
+        """Test that warm_up creates singletons and skips transients."""
+        container = DIContainer()
+        container.register(Leaf, Leaf)
+        container.register(
+            Middle, Middle, lifetime=ServiceLifetime.TRANSIENT
+        )
+
+        container.warm_up()
+
+        assert Leaf in container._singletons
+        assert Middle not in container._singletons
+
+    def test_warm_up_raises_on_cycle(self) -> None:
+        """Test that warm_up checks every registration for cycles."""
+        container = DIContainer()
+        container.register(Leaf, Leaf)
+        container.register(CycleA, CycleA)
+        container.register(CycleB, CycleB)
+
+        with pytest.raises(ValueError, match="Circular dependency"):
+            container.warm_up()
@@ -0,0 +1,41 @@
+"""Unit tests for directory preparation."""
+
+import os
+
+import pytest
+
+from services.directories import ensure_directory
+from services.exceptions import FileOperationError
+from services.implementations.file_service_impl import FileService
+
+
+@pytest.mark.unit
+class TestEnsureDirectory:
+    """Unit tests for ensure_directory."""
+
+    def test_creates_missing_directory(self, tmp_path) -> None:
+        """Test that missing directories and parents are created."""
+        dir_path = str(tmp_path / "a" / "b")
+
+        assert ensure_directory(dir_path) is True
+        assert os.path.isdir(dir_path)
+
+    def test_existing_directory(self, tmp_path) -> None:
+        """Test that an existing directory is accepted."""
+        assert ensure_directory(str(tmp_path)) is False
+
+    def test_file_in_the_way_raises(self, tmp_path) -> None:
+        """Test that a regular file at the path is an error."""
+        file_path = tmp_path / "notadir"
+        file_path.write_text("")
+
+        with pytest.raises(FileExistsError):
+            ensure_directory(str(file_path))
+
+    def test_prepare_directory_rejects_file(self, tmp_path) -> None:
+        """Test that FileService reports a file in place of a directory."""
+        file_path = tmp_path / "notadir"
+        file_path.write_text("")
+
+        with pytest.raises(FileOperationError):
+            FileService().prepare_directory(str(file_path))
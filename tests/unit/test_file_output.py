@@ -0,0 +1,75 @@
+"""Unit tests for the file output plugin."""
+
+import os
+from typing import Any, Optional
+
+import pytest
+
+from plugins.builtin.file_output import FileOutputPlugin
+
+
+class StubConfig:
+    """Configuration stub pointing the plugin at a test directory."""
+
+    def __init__(self, output_dir: str) -> None:
+        self.output_dir = output_dir
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        if key == "AUDIO_OUTPUT_DIR":
+            return self.output_dir
+        return default
+
+
+@pytest.fixture
+def plugin(tmp_path) -> FileOutputPlugin:
+    """Create a file output plugin writing to a temporary directory."""
+    file_output = FileOutputPlugin()
+    file_output.initialize(StubConfig(str(tmp_path)))
+    return file_output
+
+
+@pytest.mark.unit
+class TestFileOutputPlugin:
+    """Unit tests for FileOutputPlugin."""
+
+    def test_handle_transcription_writes_metadata(
+        self, plugin, tmp_path
+    ) -> None:
+        """Test that a transcription is saved with its metadata."""
+        assert plugin.handle_transcription("hello", {"source_file": "a.wav"})
+
+        [name] = os.listdir(tmp_path)
+        assert name.startswith("transcript_a_")
+        content = (tmp_path / name).read_text(encoding="utf-8")
+        assert content.startswith("hello\n\n# Metadata:\n")
+        assert "# source_file: a.wav\n" in content
+
+    def test_handle_batch_writes_one_file_per_item(
+        self, plugin, tmp_path
+    ) -> None:
+        """Test that batch items never overwrite each other."""
+        items = {
+            "first": {"text": "one"},
+            "second": {"text": "two"},
+            "third": {"text": "three", "metadata": {"source_file": "x/a.wav"}},
+            "fourth": {"text": "four", "metadata": {"source_file": "y/a.wav"}},
+        }
+
+        results = plugin.handle_batch(items)
+
+        assert results == dict.fromkeys(items, True)
+        contents = {
+            (tmp_path / name).read_text(encoding="utf-8").split("\n")[0]
+            for name in os.listdir(tmp_path)
+        }
+        assert contents == {"one", "two", "three", "four"}
+
+    def test_initialize_rejects_file_as_output_dir(self, tmp_path) -> None:
+        """Test that a file in place of the output directory is an error."""
+        from services.exceptions import FileOperationError
+
+        file_path = tmp_path / "notadir"
+        file_path.write_text("")
+
+        with pytest.raises(FileOperationError):
+            FileOutputPlugin().initialize(StubConfig(str(file_path)))
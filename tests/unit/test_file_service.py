@@ -0,0 +1,58 @@
+"""Unit tests for the file service."""
+
+import os
+from typing import Iterator, Tuple
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from services.exceptions import FileOperationError
+from services.implementations.file_service_impl import FileService
+
+SAMPLE_RATE = 16000
+
+
+def _chunks(count: int) -> Iterator[Tuple[np.ndarray, int]]:
+    """Yield count chunks of 160 silent samples."""
+    for _ in range(count):
+        yield np.zeros(160, dtype=np.float32), SAMPLE_RATE
+
+
+@pytest.mark.unit
+class TestSaveStream:
+    """Unit tests for FileService.save_stream."""
+
+    @pytest.mark.parametrize("extension", ["wav", "flac"])
+    def test_writes_all_chunks(self, tmp_path, extension: str) -> None:
+        """Test that every chunk is saved in the target's format."""
+        file_path = str(tmp_path / f"out.{extension}")
+
+        assert FileService().save_stream(_chunks(3), file_path) == file_path
+
+        info = sf.info(file_path)
+        assert info.format == extension.upper()
+        assert info.frames == 480
+        assert os.listdir(tmp_path) == [f"out.{extension}"]
+
+    def test_failed_stream_leaves_no_file(self, tmp_path) -> None:
+        """Test that an error part way through removes the partial file."""
+        file_path = tmp_path / "out.wav"
+        file_path.write_bytes(b"old")
+
+        def failing_chunks() -> Iterator[Tuple[np.ndarray, int]]:
+            yield from _chunks(2)
+            raise ConnectionError("network lost")
+
+        with pytest.raises(FileOperationError):
+            FileService().save_stream(failing_chunks(), str(file_path))
+
+        assert os.listdir(tmp_path) == ["out.wav"]
+        assert file_path.read_bytes() == b"old"
+
+    def test_empty_stream_is_an_error(self, tmp_path) -> None:
+        """Test that a stream without chunks saves nothing."""
+        with pytest.raises(FileOperationError):
+            FileService().save_stream(_chunks(0), str(tmp_path / "out.wav"))
+
+        assert os.listdir(tmp_path) == []
@@ -0,0 +1,88 @@
+"""Unit tests for the injectable service index."""
+
+import os
+import sys
+import textwrap
+
+import pytest
+
+from library.bin.dependency_injection.module_loader import (
+    _read_index,
+    write_index,
+)
+
+SERVICE_SOURCE = textwrap.dedent(
+    """
+    from library.bin.dependency_injection.module_loader import Injectable
+
+
+    @Injectable()
+    class IndexedService:
+        pass
+    """
+)
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    """Create an importable package holding one injectable service."""
+    package_dir = tmp_path / "indexed_pkg"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "service.py").write_text(SERVICE_SOURCE)
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package_dir
+    for name in [m for m in sys.modules if m.startswith("indexed_pkg")]:
+        del sys.modules[name]
+
+
+def _age(path, seconds: float) -> None:
+    """Move a file's modification time into the past."""
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+
+@pytest.mark.unit
+class TestServiceIndex:
+    """Unit tests for write_index and _read_index."""
+
+    def test_round_trip(self, package, tmp_path) -> None:
+        """Test that an up-to-date index lists the injectable services."""
+        index_path = str(tmp_path / "index.json")
+
+        assert write_index(["indexed_pkg"], index_path) == 1
+        result = _read_index(("indexed_pkg",), index_path)
+
+        assert result is not None
+        discovered, modules = result
+        assert modules == 1
+        [(interface, implementation, lifetime)] = discovered
+        assert implementation.__name__ == "IndexedService"
+        assert interface is implementation
+        assert lifetime == "singleton"
+
+    def test_missing_index(self, tmp_path) -> None:
+        """Test that a missing index falls back to the package walk."""
+        index_path = str(tmp_path / "missing.json")
+
+        assert _read_index(("indexed_pkg",), index_path) is None
+
+    def test_other_packages_ignored(self, package, tmp_path) -> None:
+        """Test that an index built for other packages is not used."""
+        index_path = str(tmp_path / "index.json")
+        write_index(["indexed_pkg"], index_path)
+
+        assert _read_index(("indexed_pkg", "other"), index_path) is None
+
+    def test_stale_index_ignored(self, package, tmp_path) -> None:
+        """Test that a module added after the index invalidates it."""
+        for path in (package / "__init__.py", package / "service.py"):
+            _age(path, 60)
+        _age(package, 60)
+        index_path = str(tmp_path / "index.json")
+        write_index(["indexed_pkg"], index_path)
+
+        (package / "added.py").write_text(SERVICE_SOURCE)
+
+        assert _read_index(("indexed_pkg",), index_path) is None
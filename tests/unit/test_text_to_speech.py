@@ -0,0 +1,99 @@
+"""Unit tests for the in-memory text-to-speech memo."""
+
+from collections import OrderedDict
+from typing import Any, List
+
+import numpy as np
+import pytest
+
+from services import text_to_speech_service
+from services.audio_buffer import AudioBuffer
+from services.text_to_speech_service import TextToSpeechService
+
+
+@pytest.fixture
+def synthesized(monkeypatch) -> List[str]:
+    """Replace gTTS with a stub and start from an empty memo."""
+    calls: List[str] = []
+
+    def fake_synthesize(text: str, language: str) -> AudioBuffer:
+        calls.append(text)
+        # One float32 sample per character of text
+        return AudioBuffer(np.zeros(len(text), dtype=np.float32), 16000)
+
+    monkeypatch.setattr(
+        text_to_speech_service, "_synthesize_with_gtts", fake_synthesize
+    )
+    monkeypatch.setattr(text_to_speech_service, "_memo", OrderedDict())
+    monkeypatch.setattr(text_to_speech_service, "_memo_bytes", 0)
+    return calls
+
+
+@pytest.mark.unit
+class TestSynthesisMemo:
+    """Unit tests for the memo behind TextToSpeechService.synthesize."""
+
+    def test_repeated_phrase_is_served_from_memory(
+        self, synthesized: List[str]
+    ) -> None:
+        """Test that a repeated phrase is synthesized once."""
+        first = TextToSpeechService.synthesize("hello")
+        second = TextToSpeechService.synthesize("hello")
+
+        assert second is first
+        assert synthesized == ["hello"]
+        assert not first.samples.flags.writeable
+
+    def test_language_is_part_of_the_key(
+        self, synthesized: List[str]
+    ) -> None:
+        """Test that the same text in another language is synthesized."""
+        TextToSpeechService.synthesize("hello", "en")
+        TextToSpeechService.synthesize("hello", "fr")
+
+        assert synthesized == ["hello", "hello"]
+
+    def test_evicts_least_recently_used_by_size(
+        self, synthesized: List[str], monkeypatch: Any
+    ) -> None:
+        """Test that the memo stays within its byte limit."""
+        # Room for two 4-character clips of float32 samples
+        monkeypatch.setattr(text_to_speech_service, "_MEMO_MAX_BYTES", 32)
+
+        TextToSpeechService.synthesize("aaaa")
+        TextToSpeechService.synthesize("bbbb")
+        TextToSpeechService.synthesize("aaaa")
+        TextToSpeechService.synthesize("cccc")
+
+        assert list(text_to_speech_service._memo) == [
+            ("aaaa", "en"),
+            ("cccc", "en"),
+        ]
+        assert text_to_speech_service._memo_bytes == 32
+
+    def test_oversized_clip_is_not_kept(
+        self, synthesized: List[str], monkeypatch: Any
+    ) -> None:
+        """Test that a clip larger than the limit is not memoized."""
+        monkeypatch.setattr(text_to_speech_service, "_MEMO_MAX_BYTES", 8)
+
+        TextToSpeechService.synthesize("too long")
+
+        assert not text_to_speech_service._memo
+
+    def test_failure_falls_back_and_is_not_kept(self, monkeypatch) -> None:
+        """Test that a failed synthesis yields the fallback tone."""
+
+        def failing_synthesize(text: str, language: str) -> AudioBuffer:
+            raise RuntimeError("offline")
+
+        monkeypatch.setattr(
+            text_to_speech_service,
+            "_synthesize_with_gtts",
+            failing_synthesize,
+        )
+
+        audio = TextToSpeechService.synthesize("unreachable")
+
+        assert audio.sample_rate == 16000
+        assert ("unreachable", "en") not in text_to_speech_service._memo
@@ -0,0 +1,150 @@
+"""Unit tests for the synthesized speech cache."""
+
+import os
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from services.tts_cache import TTSCache
+
+SAMPLE_RATE = 16000
+
+
+def _write_wav(path: str, frames: int = 1600) -> str:
+    """Write a short test tone and return its path."""
+    t = np.arange(frames) / SAMPLE_RATE
+    sf.write(path, 0.5 * np.sin(2 * np.pi * 440 * t), SAMPLE_RATE)
+    return path
+
+
+@pytest.fixture
+def source(tmp_path) -> str:
+    """Create a synthesized WAV file outside the cache directory."""
+    return _write_wav(str(tmp_path / "synth.wav"))
+
+
+@pytest.mark.unit
+class TestTTSCache:
+    """Unit tests for TTSCache."""
+
+    def test_make_key_depends_on_every_input(self) -> None:
+        """Test that keys are stable and distinguish each input."""
+        key = TTSCache.make_key("hello", "en", "gtts", "wav")
+
+        assert key == TTSCache.make_key("hello", "en", "gtts", "WAV")
+        assert key != TTSCache.make_key("hello", "fr", "gtts", "wav")
+        assert key != TTSCache.make_key("hello", "en", "other", "wav")
+        # The separator keeps shifted boundaries from colliding
+        assert TTSCache.make_key("ab", "c", "m", "wav") != TTSCache.make_key(
+            "a", "bc", "m", "wav"
+        )
+
+    def test_make_key_depends_on_format(self, tmp_path) -> None:
+        """Test that each output format gets its own cache file."""
+        cache = TTSCache(str(tmp_path / "cache"), max_bytes=10**6)
+        wav_key = TTSCache.make_key("hello", "en", "gtts", "wav")
+        flac_key = TTSCache.make_key("hello", "en", "gtts", "flac")
+
+        assert wav_key != flac_key
+        assert cache.path_for(wav_key).endswith(".wav")
+        assert cache.path_for(flac_key).endswith(".flac")
+
+    def test_lookup_miss(self, tmp_path) -> None:
+        """Test that a missing entry is reported as a miss."""
+        cache = TTSCache(str(tmp_path / "cache"), max_bytes=10**6)
+
+        assert cache.lookup("missing") is None
+        assert cache.load("missing") is None
+
+    def test_store_creates_directory_and_copies(
+        self, tmp_path, source
+    ) -> None:
+        """Test that storing copies the file into a new cache directory."""
+        cache = TTSCache(str(tmp_path / "cache"), max_bytes=10**6)
+
+        cache.store("key", source)
+        os.remove(source)
+
+        assert cache.lookup("key") == cache.path_for("key")
+        assert os.path.isfile(cache.path_for("key"))
+
+    def test_load_decodes_and_keeps_in_memory(
+        self, tmp_path, source
+    ) -> None:
+        """Test that loaded audio is float32 and served from memory."""
+        cache = TTSCache(str(tmp_path / "cache"), max_bytes=10**6)
+        cache.store("key", source)
+
+        audio = cache.load("key")
+        assert audio is not None
+        assert audio.samples.dtype == np.float32
+        assert audio.sample_rate == SAMPLE_RATE
+
+        os.remove(cache.path_for("key"))
+        assert cache.load("key") is audio
+
+    def test_memory_lru_evicts_oldest(self, tmp_path, source) -> None:
+        """Test that the in-memory LRU holds at most memory_entries."""
+        cache = TTSCache(
+            str(tmp_path / "cache"), max_bytes=10**6, memory_entries=2
+        )
+        for key in ("a", "b", "c"):
+            cache.store(key, source)
+
+        cache.load("a")
+        cache.load("b")
+        cache.load("a")
+        cache.load("c")
+
+        assert list(cache._memory) == ["a", "c"]
+
+    def test_disk_eviction_removes_least_recently_used(
+        self, tmp_path, source
+    ) -> None:
+        """Test that the directory is trimmed to max_bytes by access time."""
+        entry_size = os.path.getsize(source)
+        cache = TTSCache(
+            str(tmp_path / "cache"), max_bytes=entry_size * 2
+        )
+        cache.store("old", source)
+        cache.store("recent", source)
+        cache.load("old")
+        cache.load("recent")
+        os.utime(cache.path_for("old"), (1000, 1000))
+        os.utime(cache.path_for("recent"), (2000, 2000))
+
+        cache.store("new", source)
+
+        assert cache.lookup("old") is None
+        assert cache.lookup("recent") is not None
+        assert cache.lookup("new") is not None
+        assert "old" not in cache._memory
+        assert "recent" in cache._memory
+
+    def test_eviction_skips_vanished_entries(
+        self, tmp_path, source, monkeypatch
+    ) -> None:
+        """Test that a file removed during eviction does not fail store."""
+        cache = TTSCache(str(tmp_path / "cache"), max_bytes=10**6)
+        cache.store("gone", source)
+        scandir = os.scandir
+
+        def scandir_then_remove(path: str):
+            entries = list(scandir(path))
+            # Another process evicts the entry after the directory scan
+            os.remove(cache.path_for("gone"))
+            return entries
+
+        monkeypatch.setattr(os, "scandir", scandir_then_remove)
+        cache.store("key", source)
+
+        assert cache.lookup("key") is not None
+
+    def test_store_missing_source_is_ignored(self, tmp_path) -> None:
+        """Test that a failed copy leaves no entry behind."""
+        cache = TTSCache(str(tmp_path / "cache"), max_bytes=10**6)
+
+        cache.store("key", str(tmp_path / "missing.wav"))
+
+        assert cache.lookup("key") is None
@@ -0,0 +1,113 @@
+"""Unit tests for WAV header validation."""
+
+import struct
+import wave
+from typing import Any
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from plugins.builtin.wav_audio_format import WavAudioFormatPlugin
+
+
+def _write_canonical(path: str) -> str:
+    """Write a 16-bit mono PCM file with the canonical 44-byte header."""
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(b"\x00\x00" * 160)
+    return path
+
+
+def _write_with_extra_chunk(path: str) -> str:
+    """Write a PCM file with an odd-sized LIST chunk before the data."""
+    fmt = struct.pack("<HHIIHH", 1, 1, 16000, 32000, 2, 16)
+    info = b"INFOabc"  # odd size, so a pad byte follows
+    data = b"\x00\x00" * 160
+    chunks = (
+        b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        + b"LIST" + struct.pack("<I", len(info)) + info + b"\x00"
+        + b"data" + struct.pack("<I", len(data)) + data
+    )
+    with open(path, "wb") as f:
+        f.write(b"RIFF" + struct.pack("<I", 4 + len(chunks)) + b"WAVE")
+        f.write(chunks)
+    return path
+
+
+def _write_canonical_with_zero_channels(path: str) -> str:
+    """Write a canonical header that declares no channels."""
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36, b"WAVE", b"fmt ", 16, 1, 0, 16000, 0, 0, 16,
+        b"data", 0,
+    )
+    with open(path, "wb") as f:
+        f.write(header)
+    return path
+
+
+@pytest.fixture
+def plugin() -> WavAudioFormatPlugin:
+    """Create a WAV format plugin."""
+    return WavAudioFormatPlugin()
+
+
+@pytest.mark.unit
+class TestWavValidation:
+    """Unit tests for WavAudioFormatPlugin.validate_file."""
+
+    def test_canonical_header_skips_wave_module(
+        self, plugin, tmp_path, mocker: Any
+    ) -> None:
+        """Test that a canonical header is validated by the fast path."""
+        path = _write_canonical(str(tmp_path / "canonical.wav"))
+        fallback = mocker.spy(plugin, "_validate_with_wave")
+
+        assert plugin.validate_file(path) is True
+        fallback.assert_not_called()
+
+    def test_canonical_header_with_bad_properties(
+        self, plugin, tmp_path, mocker: Any
+    ) -> None:
+        """Test that the fast path still rejects invalid properties."""
+        path = _write_canonical_with_zero_channels(str(tmp_path / "bad.wav"))
+        fallback = mocker.spy(plugin, "_validate_with_wave")
+
+        assert plugin.validate_file(path) is False
+        fallback.assert_not_called()
+
+    def test_extra_chunk_uses_wave_module(
+        self, plugin, tmp_path, mocker: Any
+    ) -> None:
+        """Test that a header with extra chunks falls back to wave."""
+        path = _write_with_extra_chunk(str(tmp_path / "list.wav"))
+        fallback = mocker.spy(plugin, "_validate_with_wave")
+
+        assert plugin.validate_file(path) is True
+        fallback.assert_called_once_with(path)
+
+    def test_float_header_uses_wave_module(
+        self, plugin, tmp_path, mocker: Any
+    ) -> None:
+        """Test that a non-PCM header is left to the wave module."""
+        path = str(tmp_path / "float.wav")
+        sf.write(path, np.zeros(160, dtype=np.float32), 16000, "FLOAT")
+        fallback = mocker.spy(plugin, "_validate_with_wave")
+
+        plugin.validate_file(path)
+
+        fallback.assert_called_once_with(path)
+
+    def test_truncated_header_is_invalid(self, plugin, tmp_path) -> None:
+        """Test that a file shorter than a header is rejected."""
+        path = tmp_path / "short.wav"
+        path.write_bytes(b"RIFF\x00\x00")
+
+        assert plugin.validate_file(str(path)) is False
+
+    def test_missing_file_is_invalid(self, plugin, tmp_path) -> None:
+        """Test that a missing file is rejected."""
+        assert plugin.validate_file(str(tmp_path / "missing.wav")) is False